@@ -1,21 +1,447 @@
+import contextlib
 import pandas as pd
 import mysql.connector
 from mysql.connector import Error
+import glob
+import os
+import tempfile
+import time
 
-def csv_to_mysql(csv_file, host='localhost', user='root', password='', database='gs25_db'):
+# gs25_products 테이블에 저장하는 CSV 컬럼 (순서대로)
+PRODUCT_COLUMNS = ['이미지URL', '상품명', '가격', '행사유형', '행사분류']
+
+# 같은 (상품명, 행사유형)을 다시 적재하면 새 행을 만들지 않고 기존 행을 갱신 (uk_product 키 사용)
+UPSERT_SET = """
+  이미지URL = VALUES(이미지URL),
+  가격 = VALUES(가격),
+  행사분류 = VALUES(행사분류),
+  가격값 = VALUES(가격값)
+"""
+
+INSERT_QUERY = f"""
+INSERT INTO gs25_products 
+(이미지URL, 상품명, 가격, 행사유형, 행사분류, 가격값)
+VALUES (%s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE{UPSERT_SET}"""
+
+
+# 가격 문자열("1,500원" 등)에서 숫자만 남겨 정수로 변환하는 SQL 식
+PRICE_VALUE_SQL = "CAST(NULLIF(REGEXP_REPLACE({column}, '[^0-9]', ''), '') AS UNSIGNED)"
+
+# 웹페이지의 조회 조건(행사유형/행사분류)과 정렬(id/상품명/가격값) 조합별 인덱스
+# - 조건 없이 상품명순 정렬은 uk_product(상품명, 행사유형)를 사용
+# - 행사유형과 행사분류를 함께 거는 조회는 행사유형 인덱스를 정렬 순서대로 읽으며 행사분류를 거름
+#   (행사유형+행사분류+가격값은 통계 프로시저의 조합별 최저/최고 가격 계산에 사용)
+ROUTE_INDEXES = [
+    ('idx_promotion_id', '행사유형, id'),
+    ('idx_category_id', '행사분류, id'),
+    ('idx_price', '가격값'),
+    ('idx_promotion_price', '행사유형, 가격값'),
+    ('idx_category_price', '행사분류, 가격값'),
+    ('idx_promotion_category_price', '행사유형, 행사분류, 가격값'),
+    ('idx_promotion_name', '행사유형, 상품명'),
+    ('idx_category_name', '행사분류, 상품명'),
+]
+
+# 예전 마이그레이션 3이 만들었지만 어떤 조회도 필요로 하지 않는 인덱스 (마이그레이션 8에서 삭제)
+REDUNDANT_INDEXES = ['idx_name', 'idx_promotion_category_id', 'idx_promotion_category_name']
+
+
+def product_rows(df):
+    """DataFrame을 INSERT 파라미터 튜플 목록으로 변환 (빈 값은 NULL, 마지막 값은 정수 가격)"""
+    values = df[PRODUCT_COLUMNS].astype(object)
+    price_digits = df['가격'].astype(str).str.replace(r'[^0-9]', '', regex=True)
+    values['가격값'] = pd.to_numeric(price_digits, errors='coerce').astype('Int64').astype(object)
+    values = values.where(pd.notna(values), None)
+    return list(values.itertuples(index=False, name=None))
+
+
+def insert_in_batches(cursor, rows, batch_size=1000):
+    """batch_size개씩 executemany로 삽입 (mysql.connector가 여러 행 INSERT 한 문장으로 묶어 전송)"""
+    for start in range(0, len(rows), batch_size):
+        cursor.executemany(INSERT_QUERY, rows[start:start + batch_size])
+
+
+def escape_load_data_value(value):
+    """LOAD DATA의 이스케이프 문자(\\)가 값에 그대로 남도록 두 번 씀 (빈 값은 \\N으로 NULL 처리)"""
+    return value.replace('\\', '\\\\') if isinstance(value, str) else value
+
+
+def load_data_infile(cursor, df):
+    """
+    LOAD DATA LOCAL INFILE로 한 번에 적재
+    
+    CSV의 컬럼 순서나 추가 컬럼(덤증정상품 등)과 관계없도록 테이블 컬럼 순서대로 임시 파일을 만들어
+    임시 테이블에 적재한 뒤, 이미 있는 (상품명, 행사유형)은 갱신하도록 gs25_products에 upsert합니다.
+    """
+    temp_file = tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', newline='', delete=False)
+    try:
+        with temp_file:
+            values = df[PRODUCT_COLUMNS].astype(object).apply(lambda column: column.map(escape_load_data_value))
+            values.to_csv(temp_file, index=False, header=False, na_rep='\\N', lineterminator='\n')
+        
+        cursor.execute("""
+        CREATE TEMPORARY TABLE IF NOT EXISTS gs25_products_load (
+            load_id INT AUTO_INCREMENT PRIMARY KEY,
+            이미지URL VARCHAR(500),
+            상품명 VARCHAR(255) NOT NULL,
+            가격 VARCHAR(50),
+            행사유형 VARCHAR(50),
+            행사분류 VARCHAR(50),
+            가격값 INT UNSIGNED NULL
+        )
+        """)
+        cursor.execute("TRUNCATE TABLE gs25_products_load")
+        cursor.execute(f"""
+        LOAD DATA LOCAL INFILE '{temp_file.name.replace(os.sep, '/')}'
+        INTO TABLE gs25_products_load
+        CHARACTER SET utf8mb4
+        FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY '\\\\'
+        LINES TERMINATED BY '\\n'
+        (이미지URL, 상품명, @가격, 행사유형, 행사분류)
+        SET 가격 = @가격, 가격값 = {PRICE_VALUE_SQL.format(column='@가격')}
+        """)
+        loaded_rows = cursor.rowcount
+        
+        # 파일 안에서 같은 상품이 여러 번 나오면 뒤에 나온 행으로 갱신되도록 적재 순서대로 반영
+        cursor.execute(f"""
+        INSERT INTO gs25_products (이미지URL, 상품명, 가격, 행사유형, 행사분류, 가격값)
+        SELECT 이미지URL, 상품명, 가격, 행사유형, 행사분류, 가격값 FROM gs25_products_load ORDER BY load_id
+        ON DUPLICATE KEY UPDATE{UPSERT_SET}""")
+        return loaded_rows
+    finally:
+        os.remove(temp_file.name)
+
+
+def column_exists(cursor, table, column):
+    cursor.execute("""
+    SELECT COUNT(*) FROM information_schema.columns
+    WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+    """, (table, column))
+    return cursor.fetchone()[0] > 0
+
+
+def index_exists(cursor, table, index_name):
+    cursor.execute("""
+    SELECT COUNT(*) FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+    """, (table, index_name))
+    return cursor.fetchone()[0] > 0
+
+
+def add_price_value_column(cursor, conn, batch_size):
+    """정렬용 정수 가격 컬럼(가격값) 추가"""
+    if not column_exists(cursor, 'gs25_products', '가격값'):
+        cursor.execute("ALTER TABLE gs25_products ADD COLUMN 가격값 INT UNSIGNED NULL AFTER 가격")
+
+
+def backfill_price_value(cursor, conn, batch_size):
+    """기존 행의 가격값을 id 구간별로 나눠 채움 (구간마다 커밋해 잠금을 짧게 유지)"""
+    cursor.execute("SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM gs25_products")
+    min_id, max_id = cursor.fetchone()
+    updated = 0
+    for start in range(min_id - 1, max_id, batch_size):
+        cursor.execute(f"""
+        UPDATE gs25_products SET 가격값 = {PRICE_VALUE_SQL.format(column='가격')}
+        WHERE id > %s AND id <= %s AND 가격값 IS NULL
+        """, (start, start + batch_size))
+        updated += cursor.rowcount
+        conn.commit()
+    print(f"가격값 {updated}개 행 채움")
+
+
+def add_route_indexes(cursor, conn, batch_size):
+    """웹페이지 조회/정렬 조합별 복합 인덱스 추가 (테이블 잠금 없이 온라인으로 생성)"""
+    for index_name, columns in ROUTE_INDEXES:
+        if not index_exists(cursor, 'gs25_products', index_name):
+            cursor.execute(f"ALTER TABLE gs25_products ADD INDEX {index_name} ({columns}), "
+                           f"ALGORITHM=INPLACE, LOCK=NONE")
+            print(f"인덱스 {index_name}({columns}) 생성")
+
+
+def add_name_fulltext_index(cursor, conn, batch_size):
+    """상품명 부분 검색(/search)용 ngram 전문 검색 인덱스 추가"""
+    if not index_exists(cursor, 'gs25_products', 'ft_name'):
+        cursor.execute("ALTER TABLE gs25_products ADD FULLTEXT INDEX ft_name (상품명) WITH PARSER ngram")
+
+
+def drop_redundant_route_indexes(cursor, conn, batch_size):
+    """REDUNDANT_INDEXES 삭제 - 저장할 때마다 갱신하는 인덱스 수를 줄임"""
+    for index_name in REDUNDANT_INDEXES:
+        if index_exists(cursor, 'gs25_products', index_name):
+            cursor.execute(f"ALTER TABLE gs25_products DROP INDEX {index_name}, ALGORITHM=INPLACE, LOCK=NONE")
+            print(f"인덱스 {index_name} 삭제")
+
+
+def add_product_unique_key(cursor, conn, batch_size):
+    """
+    (상품명, 행사유형) UNIQUE 키 추가 - 같은 CSV를 다시 적재해도 행이 늘어나지 않도록
+    
+    이미 중복으로 쌓인 행은 가장 최근에 적재된(id가 가장 큰) 행만 남기고 삭제합니다.
+    삭제하는 행은 먼저 gs25_products_duplicates 테이블에 복사해 둡니다.
+    """
+    if index_exists(cursor, 'gs25_products', 'uk_product'):
+        return
+    duplicate_join = """
+    FROM gs25_products older
+    JOIN gs25_products newer
+      ON newer.상품명 = older.상품명 AND newer.행사유형 <=> older.행사유형 AND newer.id > older.id
+    """
+    cursor.execute(f"SELECT COUNT(DISTINCT older.id) {duplicate_join}")
+    duplicates = cursor.fetchone()[0]
+    if not duplicates:
+        print("삭제할 중복 상품이 없습니다.")
+    else:
+        cursor.execute("CREATE TABLE IF NOT EXISTS gs25_products_duplicates LIKE gs25_products")
+        cursor.execute(f"INSERT IGNORE INTO gs25_products_duplicates SELECT DISTINCT older.* {duplicate_join}")
+        print(f"중복 상품 {duplicates}개 행을 gs25_products_duplicates에 백업")
+        cursor.execute(f"DELETE older {duplicate_join}")
+        print(f"중복 상품 {cursor.rowcount}개 행 삭제")
+    conn.commit()
+    cursor.execute("ALTER TABLE gs25_products ADD UNIQUE KEY uk_product (상품명, 행사유형)")
+
+
+# gs25_products 변경을 행사유형/행사분류별 요약(gs25_product_stats)에 반영하는 프로시저와 트리거
+# (CSV 적재, 크롤러의 upsert_web_products 등 어느 경로로 저장해도 요약이 함께 갱신됨)
+# 세션 변수 @gs25_skip_product_stats가 설정된 동안에는 트리거가 건너뜀 (defer_product_stats 참고)
+PRODUCT_STATS_ROUTINES = [
+    """
+    CREATE PROCEDURE gs25_product_stats_add(IN p_promotion VARCHAR(50), IN p_category VARCHAR(50),
+                                            IN p_price INT UNSIGNED)
+    MODIFIES SQL DATA
+    BEGIN
+      INSERT INTO gs25_product_stats
+      (행사유형, 행사분류, product_count, price_count, price_sum, min_price, max_price)
+      VALUES (COALESCE(p_promotion, ''), COALESCE(p_category, ''), 1, p_price IS NOT NULL,
+              COALESCE(p_price, 0), p_price, p_price)
+      ON DUPLICATE KEY UPDATE
+        product_count = product_count + 1,
+        price_count = price_count + VALUES(price_count),
+        price_sum = price_sum + VALUES(price_sum),
+        min_price = COALESCE(LEAST(min_price, VALUES(min_price)), min_price, VALUES(min_price)),
+        max_price = COALESCE(GREATEST(max_price, VALUES(max_price)), max_price, VALUES(max_price));
+    END
+    """,
+    """
+    CREATE PROCEDURE gs25_product_stats_remove(IN p_promotion VARCHAR(50), IN p_category VARCHAR(50),
+                                               IN p_price INT UNSIGNED)
+    MODIFIES SQL DATA
+    BEGIN
+      UPDATE gs25_product_stats
+      SET product_count = product_count - 1,
+          price_count = price_count - (p_price IS NOT NULL),
+          price_sum = price_sum - COALESCE(p_price, 0)
+      WHERE 행사유형 = COALESCE(p_promotion, '') AND 행사분류 = COALESCE(p_category, '');
+      -- 최저/최고 가격인 상품이 빠진 경우에만 그 조합을 다시 계산 (idx_promotion_category_price 사용)
+      IF p_price IS NOT NULL THEN
+        UPDATE gs25_product_stats
+        SET min_price = (SELECT MIN(가격값) FROM gs25_products
+                         WHERE 행사유형 <=> p_promotion AND 행사분류 <=> p_category),
+            max_price = (SELECT MAX(가격값) FROM gs25_products
+                         WHERE 행사유형 <=> p_promotion AND 행사분류 <=> p_category)
+        WHERE 행사유형 = COALESCE(p_promotion, '') AND 행사분류 = COALESCE(p_category, '')
+          AND (p_price <= min_price OR p_price >= max_price);
+      END IF;
+    END
+    """,
+    """
+    CREATE TRIGGER gs25_products_stats_insert AFTER INSERT ON gs25_products FOR EACH ROW
+    BEGIN
+      IF @gs25_skip_product_stats IS NULL THEN
+        CALL gs25_product_stats_add(NEW.행사유형, NEW.행사분류, NEW.가격값);
+      END IF;
+    END
+    """,
+    """
+    CREATE TRIGGER gs25_products_stats_update AFTER UPDATE ON gs25_products FOR EACH ROW
+    BEGIN
+      IF @gs25_skip_product_stats IS NULL THEN
+        CALL gs25_product_stats_remove(OLD.행사유형, OLD.행사분류, OLD.가격값);
+        CALL gs25_product_stats_add(NEW.행사유형, NEW.행사분류, NEW.가격값);
+      END IF;
+    END
+    """,
+    """
+    CREATE TRIGGER gs25_products_stats_delete AFTER DELETE ON gs25_products FOR EACH ROW
+    BEGIN
+      IF @gs25_skip_product_stats IS NULL THEN
+        CALL gs25_product_stats_remove(OLD.행사유형, OLD.행사분류, OLD.가격값);
+      END IF;
+    END
+    """,
+]
+
+
+def rebuild_product_stats(cursor, conn):
+    """gs25_product_stats를 gs25_products 전체 집계로 다시 채움 (처음 만들 때, 요약이 어긋났을 때)"""
+    cursor.execute("DELETE FROM gs25_product_stats")
+    cursor.execute("""
+    INSERT INTO gs25_product_stats
+    (행사유형, 행사분류, product_count, price_count, price_sum, min_price, max_price)
+    SELECT COALESCE(행사유형, ''), COALESCE(행사분류, ''), COUNT(*), COUNT(가격값),
+           COALESCE(SUM(가격값), 0), MIN(가격값), MAX(가격값)
+    FROM gs25_products
+    GROUP BY COALESCE(행사유형, ''), COALESCE(행사분류, '')
+    """)
+    print(f"상품 통계 {cursor.rowcount}개 조합 집계")
+    conn.commit()
+
+
+@contextlib.contextmanager
+def defer_product_stats(cursor, conn):
+    """
+    블록 안에서는 통계 트리거를 끄고, 끝나면 gs25_product_stats를 한 번만 다시 집계
+    
+    LOAD DATA처럼 많은 행을 한꺼번에 적재할 때 행마다 트리거가 요약 행을 갱신하지 않도록 합니다.
+    세션 변수라 같은 연결의 저장만 영향을 받고, 다른 연결의 저장은 그대로 트리거가 반영합니다.
+    
+    Args:
+        cursor: 적재에 쓰는 연결의 커서
+        conn: 같은 MySQL 연결 (재집계 후 커밋)
+    """
+    cursor.execute("SET @gs25_skip_product_stats = 1")
+    try:
+        yield
+    finally:
+        try:
+            cursor.execute("SET @gs25_skip_product_stats = NULL")
+            rebuild_product_stats(cursor, conn)
+        except Error as e:
+            print(f"상품 통계 재집계 실패 (rebuild_product_stats로 다시 집계하세요): {e}")
+
+
+def create_product_stats_routines(cursor):
+    """통계 프로시저와 트리거를 지우고 PRODUCT_STATS_ROUTINES로 다시 만듦"""
+    for name in ('gs25_products_stats_insert', 'gs25_products_stats_update', 'gs25_products_stats_delete'):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for name in ('gs25_product_stats_add', 'gs25_product_stats_remove'):
+        cursor.execute(f"DROP PROCEDURE IF EXISTS {name}")
+    for routine in PRODUCT_STATS_ROUTINES:
+        cursor.execute(routine)
+
+
+def add_product_stats_table(cursor, conn, batch_size):
+    """
+    행사유형/행사분류별 상품 수와 가격 통계 요약 테이블(gs25_product_stats) 추가
+    
+    웹페이지의 상품 수, 필터별 개수, /stats는 gs25_products를 매번 세지 않고 이 테이블을 읽습니다.
+    gs25_products에 INSERT/UPDATE/DELETE가 일어나면 트리거가 해당 조합의 행만 갱신합니다.
+    """
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS gs25_product_stats (
+        행사유형 VARCHAR(50) NOT NULL DEFAULT '',
+        행사분류 VARCHAR(50) NOT NULL DEFAULT '',
+        product_count INT NOT NULL DEFAULT 0,
+        price_count INT NOT NULL DEFAULT 0,
+        price_sum BIGINT NOT NULL DEFAULT 0,
+        min_price INT UNSIGNED NULL,
+        max_price INT UNSIGNED NULL,
+        PRIMARY KEY (행사유형, 행사분류)
+    )
+    ''')
+    create_product_stats_routines(cursor)
+    # 트리거를 먼저 만든 뒤 집계해야 그 사이에 저장된 행이 빠지지 않음
+    rebuild_product_stats(cursor, conn)
+
+
+def recreate_product_stats_routines(cursor, conn, batch_size):
+    """이미 만들어진 통계 트리거를 @gs25_skip_product_stats를 확인하는 트리거로 교체"""
+    create_product_stats_routines(cursor)
+    # 교체하는 사이에 저장된 행이 요약에서 빠지지 않도록 다시 집계
+    rebuild_product_stats(cursor, conn)
+
+
+# (버전, 설명, 적용 함수) - 새 마이그레이션은 버전을 올려 끝에 추가
+MIGRATIONS = [
+    (1, "가격값 INT 컬럼 추가", add_price_value_column),
+    (2, "가격값 채우기", backfill_price_value),
+    (3, "조회/정렬 조합별 복합 인덱스 추가", add_route_indexes),
+    (4, "상품명 전문 검색 인덱스 추가", add_name_fulltext_index),
+    (5, "상품명+행사유형 UNIQUE 키 추가", add_product_unique_key),
+    (6, "행사유형/행사분류별 상품 통계 테이블과 트리거 추가", add_product_stats_table),
+    (7, "대량 적재 중 건너뛸 수 있는 통계 트리거로 교체", recreate_product_stats_routines),
+    (8, "어떤 조회도 사용하지 않는 인덱스 삭제", drop_redundant_route_indexes),
+]
+
+
+def apply_migrations(cursor, conn, batch_size=5000):
+    """아직 적용하지 않은 마이그레이션을 버전 순서대로 적용하고 schema_migrations에 기록"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        description VARCHAR(255),
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    cursor.execute("SELECT version FROM schema_migrations")
+    applied = {version for (version,) in cursor.fetchall()}
+    
+    for version, description, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        start_time = time.perf_counter()
+        migrate(cursor, conn, batch_size)
+        cursor.execute("INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                       (version, description))
+        conn.commit()
+        print(f"마이그레이션 {version} 적용: {description} ({time.perf_counter() - start_time:.2f}초)")
+
+
+def migrate_gs25_products(host='localhost', user='root', password='', database='gs25_db', batch_size=5000):
+    """gs25_products 스키마를 최신 버전으로 마이그레이션"""
     conn = None
     cursor = None
     
     try:
-        # CSV 파일 읽기
-        df = pd.read_csv(csv_file, encoding='utf-8-sig')
-        print(f"CSV 파일에서 {len(df)}개 상품 정보를 읽었습니다.")
+        conn = mysql.connector.connect(host=host, user=user, password=password, database=database)
+        cursor = conn.cursor()
+        apply_migrations(cursor, conn, batch_size)
+        print("gs25_products 스키마가 최신 버전입니다.")
+    except Error as e:
+        print(f"마이그레이션 중 MySQL 오류 발생: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        if conn and conn.is_connected():
+            conn.close()
+
+
+def read_csv_chunks(csv_file, chunksize=None):
+    """CSV 파일을 chunksize행씩 나눠 읽기 (chunksize가 없으면 파일 전체를 한 번에)"""
+    if chunksize:
+        yield from pd.read_csv(csv_file, encoding='utf-8-sig', chunksize=chunksize)
+    else:
+        yield pd.read_csv(csv_file, encoding='utf-8-sig')
+
+
+def csv_to_mysql(csv_file, host='localhost', user='root', password='', database='gs25_db',
+                 batch_size=1000, use_load_data=False, chunksize=None):
+    """
+    CSV 파일의 상품 정보를 MySQL gs25_products 테이블에 적재 (이미 있는 상품명+행사유형은 갱신)
+    
+    Args:
+        csv_file (str): 크롤링 결과 CSV 파일 경로 또는 glob 패턴 (예: gs25_results/GS25_행사상품_*.csv)
+        batch_size (int): executemany 한 번에 보낼 행 수
+        use_load_data (bool): LOAD DATA LOCAL INFILE로 적재할지 여부 (서버가 허용하지 않으면 batch INSERT로 진행)
+        chunksize (int): 지정하면 파일을 이 행 수씩 읽어 적재하고 커밋 (파일 크기와 관계없이 메모리 사용량 일정)
+    """
+    conn = None
+    cursor = None
+    
+    try:
+        # 적재할 CSV 파일 목록 (패턴이면 파일명 순서대로)
+        csv_files = sorted(glob.glob(csv_file)) if glob.has_magic(csv_file) else [csv_file]
+        if not csv_files:
+            print(f"적재할 CSV 파일이 없습니다: {csv_file}")
+            return
+        print(f"{len(csv_files)}개의 CSV 파일을 적재합니다.")
         
         # MySQL 연결
         conn = mysql.connector.connect(
             host=host,
             user=user,
-            password=password
+            password=password,
+            allow_local_infile=use_load_data
         )
         
         if conn.is_connected():
@@ -43,25 +469,39 @@ def csv_to_mysql(csv_file, host='localhost', user='root', password='', database=
             ''')
             print("테이블 생성 완료")
             
-            # 데이터 삽입
-            for _, row in df.iterrows():
-                insert_query = """
-                INSERT INTO gs25_products 
-                (이미지URL, 상품명, 가격, 행사유형, 행사분류)
-                VALUES (%s, %s, %s, %s, %s)
-                """
-                
-                cursor.execute(insert_query, (
-                    row['이미지URL'],
-                    row['상품명'],
-                    row['가격'],
-                    row['행사유형'],
-                    row['행사분류']
-                ))
+            # 정수 가격 컬럼, 인덱스 등 스키마를 최신 버전으로
+            apply_migrations(cursor, conn)
+            
+            # 데이터 삽입 (청크마다 커밋하므로 한 번에 메모리에 올라오는 행은 chunksize개 이하)
+            # LOAD DATA로 적재할 때는 행마다 도는 통계 트리거를 끄고 끝난 뒤 한 번만 다시 집계
+            start_time = time.perf_counter()
+            total_rows = 0
+            stats_context = defer_product_stats(cursor, conn) if use_load_data else contextlib.nullcontext()
+            with stats_context:
+                for path in csv_files:
+                    file_rows = 0
+                    for df in read_csv_chunks(path, chunksize):
+                        loaded = False
+                        if use_load_data:
+                            try:
+                                load_data_infile(cursor, df)
+                                loaded = True
+                            except Error as e:
+                                # 서버의 local_infile이 꺼져 있는 경우 등 - 이후 청크도 batch INSERT로 진행
+                                print(f"LOAD DATA LOCAL INFILE을 사용할 수 없어 batch INSERT로 진행합니다: {e}")
+                                use_load_data = False
+                        if not loaded:
+                            insert_in_batches(cursor, product_rows(df), batch_size)
+                        
+                        # 변경사항 저장
+                        conn.commit()
+                        file_rows += len(df)
+                    print(f"'{path}'에서 {file_rows}개 상품 정보를 적재했습니다.")
+                    total_rows += file_rows
             
-            # 변경사항 저장
-            conn.commit()
-            print(f"총 {len(df)}개의 상품 정보가 데이터베이스에 성공적으로 저장되었습니다.")
+            elapsed = time.perf_counter() - start_time
+            print(f"총 {total_rows}개의 상품 정보가 데이터베이스에 성공적으로 저장되었습니다.")
+            print(f"적재 시간: {elapsed:.2f}초 ({total_rows / max(elapsed, 1e-9):.0f}행/초)")
             
     except Error as e:
         print(f"MySQL 오류 발생: {e}")
@@ -87,5 +527,12 @@ csv_to_mysql(
     csv_file=r"",# 올릴 파일 경로 놓기 
     user="root", 
     password="",  # 실제 비밀번호로 변경
-    database="gs25_db"
-)
\ No newline at end of file
+    database="gs25_db",
+    batch_size=1000  # use_load_data=True로 LOAD DATA LOCAL INFILE 사용 가능
+)
+
+# 기존 테이블만 최신 스키마(정수 가격 컬럼, 조회용 인덱스)로 바꿀 수도 있습니다
+# migrate_gs25_products(password="", batch_size=5000)
+
+# 여러 달치 크롤링 결과를 5000행씩 나눠 적재할 수도 있습니다
+# csv_to_mysql(csv_file="gs25_results/GS25_행사상품_*.csv", password="", chunksize=5000)
\ No newline at end of file
@@ -5,12 +5,1655 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from abc import ABC, abstractmethod
+from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+import requests
+from collections import Counter, namedtuple
+from itertools import repeat, zip_longest
+import contextlib
+import csv
+import datetime
+import fnmatch
+import glob
+import hashlib
+import io
+import json
+import math
+import queue
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
 import time
+import tracemalloc
+import unicodedata
+import zlib
 import pandas as pd
 import os
 
-class GS25EventCrawler:
-    def __init__(self, url, crawl_all_pages=True, max_pages=20, wait_time=10):
+
+# 현재 보이는 상품 목록의 상태 (상품 수, 첫 상품명, 현재 페이지 표시)
+LIST_STATE_JS = """
+var wraps = document.querySelectorAll('div.tblwrap');
+for (var i = 0; i < wraps.length; i++) {
+    if (window.getComputedStyle(wraps[i]).display !== 'block') continue;
+    var items = wraps[i].querySelectorAll('ul.prod_list li');
+    var first = wraps[i].querySelector('ul.prod_list li p.tit');
+    var marker = wraps[i].querySelector('a.on');
+    return {
+        count: items.length,
+        first: first ? first.textContent.trim() : '',
+        page: marker ? marker.textContent.trim() : ''
+    };
+}
+return {count: 0, first: '', page: ''};
+"""
+
+# 현재 보이는 페이지의 상품 정보를 한 번의 execute_script 호출로 추출
+# (_crawl_current_page_elements와 동일한 선택자와 규칙 사용)
+EXTRACT_PAGE_JS = """
+var wraps = document.querySelectorAll('div.tblwrap');
+var visible = null;
+for (var i = 0; i < wraps.length; i++) {
+    if (window.getComputedStyle(wraps[i]).display === 'block') { visible = wraps[i]; break; }
+}
+if (!visible) return null;
+
+function firstText(root, selector) {
+    var el = root.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+}
+
+var products = [];
+var items = visible.querySelectorAll('ul.prod_list li div.prod_box');
+for (var j = 0; j < items.length; j++) {
+    var item = items[j];
+    var img = item.querySelector('p.img img');
+    var name = firstText(item, 'p.tit');
+    var price = item.querySelector('p.price span.cost');
+    if (!img || name === null || !price) continue;
+
+    var promotion = firstText(item, 'div.flag_box.ONE_TO_ONE p.flg01 span') || '';
+    if (!promotion) promotion = firstText(item, 'div.flag_box.TWO_TO_ONE p.flg01 span') || '';
+    if (!promotion && item.querySelector('div.flag_box.GIFT p.flg01 span')) promotion = '덤증정';
+    if (!promotion) promotion = firstText(item, 'div.flag_box p.flg01 span') || '';
+
+    var gift = '';
+    if (promotion.indexOf('덤') !== -1) gift = firstText(item, 'div.dum_box div.dum_txt p.name') || '';
+
+    products.push({
+        img: img.src,
+        name: name,
+        price: price.innerText.split('원').join('').trim(),
+        promotion: promotion,
+        gift: gift
+    });
+}
+return products;
+"""
+
+
+def create_chrome_driver(performance_log=False):
+    """
+    크롤링용 헤드리스 Chrome WebDriver 생성
+    
+    Args:
+        performance_log (bool): 네트워크 사용량 집계를 위해 DevTools 성능 로그를 켤지 여부
+    """
+    # Chrome 옵션 설정
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # 헤드리스 모드 (필요시 주석처리)
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    if performance_log:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
+    # WebDriver 초기화
+    return webdriver.Chrome(options=chrome_options)
+
+
+# 크롤링 결과 파일의 컬럼 순서
+PRODUCT_COLUMNS = ["이미지URL", "상품명", "가격", "행사유형", "행사분류", "덤증정상품"]
+
+
+def parse_price(value):
+    """가격 문자열("1,500원")이나 숫자에서 정수 가격 추출 (값이 없으면 0)"""
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return 0 if isinstance(value, float) and math.isnan(value) else int(value)
+    digits = ''.join(filter(str.isdigit, str(value)))
+    return int(digits) if digits else 0
+
+
+def _text(value):
+    """CSV의 빈 값(NaN/None)을 빈 문자열로 변환"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    return str(value)
+
+
+def _collapse_whitespace(value):
+    """
+    페이지에서 읽은 텍스트의 공백 정리 - 앞뒤 공백을 지우고 연속된 공백/줄바꿈을 공백 하나로
+    
+    innerText(JavaScript 추출), WebElement.text(요소별 추출), text_content()(스냅샷 재생)는
+    줄바꿈과 들여쓰기를 다르게 돌려주므로 세 경로 모두 이 함수로 정리해 같은 값을 만듭니다.
+    """
+    return " ".join(_text(value).split())
+
+
+class Product(namedtuple("Product", ["image_url", "name", "price", "promotion", "category", "gift"])):
+    """
+    행사상품 레코드 (크롤러, CSV 입출력, DB 저장에서 공통으로 사용)
+    
+    튜플 기반이라 상품마다 dict를 만들 때보다 메모리를 적게 쓰고,
+    가격은 정수로, 행사유형/행사분류는 intern된 문자열로 보관합니다.
+    CSV/DB와 주고받을 때는 to_row()/from_row()로 기존 한글 컬럼 dict와 변환합니다.
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def create(cls, image_url, name, price, promotion, category, gift=""):
+        """가격 문자열을 정수로 바꾸고 반복되는 값을 intern해서 생성"""
+        return cls(_text(image_url), _text(name).strip(), parse_price(price),
+                   sys.intern(_text(promotion)), sys.intern(_text(category)), _text(gift))
+    
+    @classmethod
+    def from_row(cls, row):
+        """한글 컬럼 dict(크롤링 결과, CSV 행)에서 생성"""
+        return cls.create(row.get("이미지URL"), row.get("상품명"), row.get("가격"),
+                          row.get("행사유형"), row.get("행사분류"), row.get("덤증정상품"))
+    
+    @classmethod
+    def coerce(cls, product):
+        """Product 또는 한글 컬럼 dict를 Product로 변환"""
+        return product if isinstance(product, cls) else cls.from_row(product)
+    
+    @classmethod
+    def from_frame(cls, df):
+        """DataFrame 컬럼을 직접 순회하며 생성 (df.to_dict('records')를 거치지 않음)"""
+        size = len(df)
+        columns = [df[column] if column in df.columns else [None] * size for column in PRODUCT_COLUMNS]
+        return [cls.create(*values) for values in zip(*columns)]
+    
+    def to_row(self):
+        """기존 크롤링 결과와 같은 한글 컬럼 dict로 변환 (덤증정상품은 있을 때만 포함)"""
+        row = {
+            "이미지URL": self.image_url,
+            "상품명": self.name,
+            "가격": f"{self.price:,}",
+            "행사유형": self.promotion,
+            "행사분류": self.category
+        }
+        if self.gift:
+            row["덤증정상품"] = self.gift
+        return row
+
+
+def normalize_product_key(name, promotion):
+    """
+    중복 판별용 상품 키 - (상품명, 행사유형)을 정규화
+    
+    전각 문자를 반각으로 바꾸고(NFKC) 연속된 공백을 하나로 줄여
+    "콜라 500ml"와 "콜라　５００ml" 같은 표기 차이를 같은 상품으로 봅니다.
+    """
+    normalized_name = " ".join(unicodedata.normalize("NFKC", name).split())
+    normalized_promotion = "".join(unicodedata.normalize("NFKC", promotion).split())
+    return f"{normalized_name}\x1f{normalized_promotion}"
+
+
+def db_product_key(name, promotion):
+    """
+    DB UNIQUE 키(unique_product)가 같은 행으로 보는 상품끼리 같아지는 (상품명, 행사유형) 키
+    
+    MySQL 기본 정렬 규칙(utf8mb4_0900_ai_ci)처럼 대소문자, 악센트, 전각/반각 차이는 무시하고
+    공백은 그대로 비교합니다.
+    """
+    def fold(text):
+        text = unicodedata.normalize("NFKD", unicodedata.normalize("NFKC", text or "")).casefold()
+        return "".join(char for char in text if not unicodedata.combining(char))
+    return (fold(name), fold(promotion))
+
+
+class BloomFilter:
+    """키 존재 여부를 빠르게 거르는 블룸 필터 (False면 확실히 없음, True면 있을 수 있음)"""
+    
+    def __init__(self, capacity=100000, error_rate=0.01):
+        """
+        Args:
+            capacity (int): 예상 키 개수
+            error_rate (float): 허용할 오탐률
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+    
+    def _positions(self, key):
+        """이중 해싱으로 hash_count개의 비트 위치 계산"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+
+class ProductDedupIndex:
+    """
+    실행 간에 유지되는 상품 중복 인덱스 (SQLite 파일)
+    
+    정규화한 (상품명, 행사유형) 키마다 가격/이미지/덤증정상품의 서명을 저장합니다.
+    이미 알고 있고 내용도 같은 상품은 다음 실행에서 건너뛸 수 있습니다.
+    메모리의 블룸 필터가 처음 보는 상품을 디스크 조회 없이 걸러냅니다.
+    크롤러와 DB 적재는 서로 다른 인덱스 파일을 사용해야 합니다.
+    """
+    
+    def __init__(self, path, use_bloom=True, bloom_capacity=100000):
+        """
+        Args:
+            path (str): 인덱스 파일(SQLite) 경로
+            use_bloom (bool): 블룸 필터로 처음 보는 상품을 먼저 거를지 여부
+            bloom_capacity (int): 블룸 필터의 예상 키 개수
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS dedup_index (key TEXT PRIMARY KEY, signature TEXT)")
+        self.stats = {"lookups": 0, "bloom_skips": 0, "known": 0}
+        
+        self.bloom = None
+        if use_bloom:
+            self.bloom = BloomFilter(capacity=bloom_capacity)
+            for (key,) in self.conn.execute("SELECT key FROM dedup_index"):
+                self.bloom.add(key)
+    
+    @staticmethod
+    def product_key(product):
+        return normalize_product_key(product.name, product.promotion)
+    
+    @staticmethod
+    def signature(product):
+        """키 외의 상품 내용 서명 (바뀌면 다시 처리해야 함)"""
+        content = f"{product.price}\x1f{product.image_url}\x1f{product.category}\x1f{product.gift}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+    
+    def is_unchanged(self, product):
+        """이미 인덱스에 있고 내용도 같은 상품인지 확인"""
+        key = self.product_key(product)
+        self.stats["lookups"] += 1
+        if self.bloom is not None and key not in self.bloom:
+            self.stats["bloom_skips"] += 1
+            return False
+        row = self.conn.execute("SELECT signature FROM dedup_index WHERE key = ?", (key,)).fetchone()
+        if row and row[0] == self.signature(product):
+            self.stats["known"] += 1
+            return True
+        return False
+    
+    def add_many(self, products):
+        """처리한 상품을 인덱스에 기록"""
+        rows = [(self.product_key(product), self.signature(product)) for product in products]
+        self.conn.executemany("INSERT OR REPLACE INTO dedup_index (key, signature) VALUES (?, ?)", rows)
+        self.conn.commit()
+        if self.bloom is not None:
+            for key, _ in rows:
+                self.bloom.add(key)
+    
+    def report(self):
+        print(f"- 중복 인덱스: 조회 {self.stats['lookups']}건, 블룸 필터로 바로 통과 {self.stats['bloom_skips']}건, "
+              f"기존 상품 {self.stats['known']}건 건너뜀")
+    
+    def close(self):
+        self.conn.close()
+
+
+class CrawlMetrics:
+    """
+    크롤링 단계별 계측 (페이지 로딩, 대기, 추출, 중복 제거, 저장)
+    
+    단계 시간은 중첩된 하위 단계를 뺀 순수 시간으로 집계하고,
+    WebDriver 명령 수, 재시도, 전송 바이트를 페이지별로 기록합니다.
+    결과는 Prometheus 텍스트 파일과 JSON 실행 보고서로 내보냅니다.
+    """
+    
+    STAGES = ["page_load", "wait", "extraction", "dedup", "save"]
+    
+    def __init__(self, prometheus_path=None, json_path=None):
+        """
+        Args:
+            prometheus_path (str): Prometheus 텍스트 파일 경로 (node_exporter textfile collector용)
+            json_path (str): JSON 실행 보고서 경로
+        """
+        self.prometheus_path = prometheus_path
+        self.json_path = json_path
+        self.started_at = time.time()
+        self.stage_seconds = {stage: 0.0 for stage in self.STAGES}
+        self.command_counts = Counter()
+        self.webdriver_commands = 0
+        self.retries = Counter()
+        self.bytes_transferred = 0
+        self.products = 0
+        self.pages = []
+        self.current_page = None
+        self._stack = []
+    
+    def instrument_driver(self, driver):
+        """WebDriver.execute를 감싸 모든 WebDriver 명령 수를 집계"""
+        # 풀에서 재사용하는 드라이버가 여러 번 감싸지지 않도록 원래 execute를 보관
+        original_execute = getattr(driver, "_uninstrumented_execute", driver.execute)
+        driver._uninstrumented_execute = original_execute
+        
+        def counting_execute(driver_command, params=None):
+            self.webdriver_commands += 1
+            self.command_counts[driver_command] += 1
+            return original_execute(driver_command, params)
+        
+        driver.execute = counting_execute
+    
+    @staticmethod
+    def uninstrument_driver(driver):
+        """instrument_driver로 감싼 execute를 원래대로 되돌림 (BrowserPool에 드라이버를 반환할 때)"""
+        original_execute = getattr(driver, "_uninstrumented_execute", None)
+        if original_execute is not None:
+            driver.execute = original_execute
+            del driver._uninstrumented_execute
+    
+    @contextlib.contextmanager
+    def stage(self, name):
+        """단계 시간 측정 (중첩된 하위 단계 시간은 상위 단계에서 제외)"""
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            exclusive = elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + exclusive
+            if self.current_page is not None:
+                stages = self.current_page["stages"]
+                stages[name] = stages.get(name, 0.0) + exclusive
+    
+    def begin_page(self, tab_id, page):
+        """페이지 기록 시작 (이전 페이지 기록은 종료)"""
+        self.end_page()
+        self.current_page = {"tab": tab_id, "page": page, "stages": {}, "products": 0, "bytes": 0,
+                             "retries": 0, "commands_at_start": self.webdriver_commands}
+    
+    def end_page(self):
+        """현재 페이지 기록 종료"""
+        if self.current_page is None:
+            return
+        record = self.current_page
+        record["webdriver_commands"] = self.webdriver_commands - record.pop("commands_at_start")
+        record["commands_per_product"] = (record["webdriver_commands"] / record["products"]
+                                          if record["products"] else None)
+        self.pages.append(record)
+        self.current_page = None
+    
+    def record_products(self, count):
+        self.products += count
+        if self.current_page is not None:
+            self.current_page["products"] += count
+    
+    def record_retry(self, operation):
+        self.retries[operation] += 1
+        if self.current_page is not None:
+            self.current_page["retries"] += 1
+    
+    def record_bytes(self, count):
+        self.bytes_transferred += count
+        if self.current_page is not None:
+            self.current_page["bytes"] += count
+    
+    def finish(self):
+        """실행 종료 - 설정된 경로로 지표 내보내기"""
+        self.end_page()
+        if self.prometheus_path:
+            self._write_atomic(self.prometheus_path, self.to_prometheus())
+            print(f"- 크롤링 지표(Prometheus): {self.prometheus_path}")
+        if self.json_path:
+            self._write_atomic(self.json_path, json.dumps(self.to_report(), ensure_ascii=False, indent=2))
+            print(f"- 크롤링 실행 보고서(JSON): {self.json_path}")
+    
+    def to_report(self):
+        """JSON 실행 보고서 내용"""
+        return {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "duration_seconds": round(time.time() - self.started_at, 3),
+            "stage_seconds": {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+            "pages": len(self.pages),
+            "products": self.products,
+            "webdriver_commands": self.webdriver_commands,
+            "webdriver_commands_by_type": dict(self.command_counts),
+            "retries": dict(self.retries),
+            "bytes": self.bytes_transferred,
+            "page_details": self.pages
+        }
+    
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 지표"""
+        lines = [
+            "# HELP gs25_crawl_duration_seconds Wall time of the last crawl run.",
+            "# TYPE gs25_crawl_duration_seconds gauge",
+            f"gs25_crawl_duration_seconds {time.time() - self.started_at:.3f}",
+            "# HELP gs25_crawl_stage_seconds Time spent per crawl stage in the last run.",
+            "# TYPE gs25_crawl_stage_seconds gauge"
+        ]
+        for stage, seconds in self.stage_seconds.items():
+            lines.append(f'gs25_crawl_stage_seconds{{stage="{stage}"}} {seconds:.3f}')
+        lines += [
+            "# HELP gs25_crawl_pages Pages crawled in the last run.",
+            "# TYPE gs25_crawl_pages gauge",
+            f"gs25_crawl_pages {len(self.pages)}",
+            "# HELP gs25_crawl_products Products extracted in the last run.",
+            "# TYPE gs25_crawl_products gauge",
+            f"gs25_crawl_products {self.products}",
+            "# HELP gs25_crawl_webdriver_commands WebDriver commands issued in the last run.",
+            "# TYPE gs25_crawl_webdriver_commands gauge"
+        ]
+        for command, count in sorted(self.command_counts.items()):
+            lines.append(f'gs25_crawl_webdriver_commands{{command="{command}"}} {count}')
+        lines += [
+            "# HELP gs25_crawl_retries Retried operations in the last run.",
+            "# TYPE gs25_crawl_retries gauge"
+        ]
+        for operation, count in sorted(self.retries.items()):
+            lines.append(f'gs25_crawl_retries{{operation="{operation}"}} {count}')
+        lines += [
+            "# HELP gs25_crawl_bytes Bytes transferred by the browser in the last run.",
+            "# TYPE gs25_crawl_bytes gauge",
+            f"gs25_crawl_bytes {self.bytes_transferred}"
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def _write_atomic(self, path, content):
+        """수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+
+class PageExtractionError(Exception):
+    """페이지가 제대로 표시되지 않아 상품을 추출하지 못한 경우 (재시도 대상)"""
+
+
+class RetryPolicy:
+    """페이지 작업 재시도 정책 (상한이 있는 지수 백오프 + 지터)"""
+    
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0, jitter=0.3):
+        """
+        Args:
+            max_attempts (int): 작업당 최대 시도 횟수 (첫 시도 포함)
+            base_delay (float): 첫 재시도 전 대기 시간(초), 재시도마다 두 배로 늘어남
+            max_delay (float): 재시도 전 대기 시간의 상한(초)
+            jitter (float): 대기 시간에 더할 무작위 비율 (여러 작업자가 동시에 재시도하지 않도록)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+    
+    def delay(self, attempt):
+        """attempt번째 시도가 실패한 뒤 기다릴 시간(초)"""
+        delay = self.base_delay * (2 ** (attempt - 1))
+        delay *= 1 + random.uniform(0, self.jitter)
+        return min(delay, self.max_delay)
+
+
+class CircuitBreaker:
+    """
+    사이트 장애 감지용 회로 차단기
+    
+    연속 실패가 failure_threshold번 쌓이면 cooldown초 동안 크롤링을 멈춘 뒤 한 번 더 시도하고,
+    그 시도도 실패하면 다시 멈춥니다. max_trips번 차단되면 더 진행하지 않고 예외를 발생시킵니다.
+    """
+    
+    def __init__(self, failure_threshold=5, cooldown=60, max_trips=3):
+        """
+        Args:
+            failure_threshold (int): 차단으로 전환할 연속 실패 횟수
+            cooldown (float): 차단 후 크롤링을 멈출 시간(초)
+            max_trips (int): 이만큼 차단되면 크롤링 중단
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self.failures = 0
+        self.trips = 0
+        self.opened_at = None
+        self.half_open = False
+    
+    def wait_if_open(self):
+        """차단 상태면 남은 시간만큼 대기 (차단 횟수를 넘었으면 RuntimeError)"""
+        if self.opened_at is None:
+            return
+        if self.trips >= self.max_trips:
+            raise RuntimeError(f"사이트 응답 실패로 {self.trips}회 차단되어 크롤링을 중단합니다.")
+        
+        remaining = self.cooldown - (time.time() - self.opened_at)
+        if remaining > 0:
+            print(f"사이트 응답 실패가 이어져 {remaining:.0f}초 동안 크롤링을 멈춥니다.")
+            time.sleep(remaining)
+        
+        # 다음 시도 결과로 회복 여부 판단
+        self.opened_at = None
+        self.half_open = True
+    
+    def record_success(self):
+        self.failures = 0
+        self.half_open = False
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.half_open or self.failures >= self.failure_threshold:
+            self.trips += 1
+            self.opened_at = time.time()
+            self.failures = 0
+            self.half_open = False
+
+
+def split_page_shards(total_pages, shard_count=None, shard_size=None):
+    """
+    페이지 범위 [1, total_pages]를 서로 겹치지 않는 (시작, 끝) 구간 목록으로 분할
+    
+    Args:
+        total_pages (int): 총 페이지 수
+        shard_count (int): 나눌 구간 수 (shard_size가 없을 때 사용)
+        shard_size (int): 구간당 페이지 수
+    """
+    if total_pages < 1:
+        return []
+    
+    if not shard_size:
+        shard_count = max(1, min(shard_count or 1, total_pages))
+        shard_size = -(-total_pages // shard_count)  # 올림 나눗셈
+    
+    return [(start, min(start + shard_size - 1, total_pages))
+            for start in range(1, total_pages + 1, shard_size)]
+
+
+# 스냅샷 저장용 DOM - 화면에 보이는 div.tblwrap에 표시를 남긴 뒤 전체 HTML 반환
+# (계산된 스타일은 HTML에 남지 않으므로 재생 시 이 표시로 보이는 목록을 찾음)
+SNAPSHOT_JS = """
+var wraps = document.querySelectorAll('div.tblwrap');
+for (var i = 0; i < wraps.length; i++) {
+    var visible = window.getComputedStyle(wraps[i]).display === 'block';
+    wraps[i].setAttribute('data-snapshot-visible', visible ? '1' : '0');
+}
+return document.documentElement.outerHTML;
+"""
+
+
+def _crawl_tab_worker(url, tab_id, options, start_page=1, end_page=None, journal_path=None):
+    """
+    프로세스 풀 작업자 - 자체 헤드리스 Chrome으로 행사 탭 하나(또는 그 페이지 구간)를 크롤링
+    
+    journal_path를 주면 크롤링한 페이지마다 그 구간 저널에 기록해, 작업자가 중단되어도
+    부모 프로세스가 그때까지의 페이지를 체크포인트로 옮길 수 있게 합니다.
+    상품은 [(페이지 번호, 상품 목록)]으로 페이지별로 반환해 부모 프로세스가 페이지 단위로
+    체크포인트와 증분 상태에 기록할 수 있게 합니다. 네트워크 필터가 있으면 이 작업에서 집계한
+    페이지별 네트워크 사용량도 함께 반환해 부모 프로세스의 필터에 합칩니다.
+    """
+    crawler = GS25EventCrawler(url, **options)
+    crawler.page_results = []
+    if journal_path:
+        crawler.checkpoint = CrawlCheckpoint(journal_path)
+    network_filter = crawler.network_filter
+    first_stat = len(network_filter.page_stats) if network_filter else 0
+    crawler.crawl_single_event(tab_id, save_results=False, start_page=start_page, end_page=end_page)
+    network_stats = network_filter.page_stats[first_stat:] if network_filter else None
+    return tab_id, start_page, crawler.page_results, crawler.incomplete_tabs, network_stats
+
+
+class CrawlCheckpoint:
+    """
+    크롤링 체크포인트 저널 (추가 전용 JSON Lines 파일)
+    
+    페이지 하나를 마칠 때마다 탭 ID, 페이지 번호, 추출한 상품 목록을 한 줄씩 기록하고,
+    탭을 끝까지 마치면 완료 기록을 남깁니다. 중단된 크롤링은 이 기록으로 이어서 진행합니다.
+    병렬 크롤링 작업자는 구간마다 별도의 구간 저널(shard_path)에 페이지를 기록하고,
+    부모 프로세스가 작업 결과를 병합할 때 이 저널로 옮깁니다.
+    """
+    
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 저널 파일 경로
+        """
+        self.path = path
+    
+    def reset(self, tab_ids=None):
+        """
+        새 크롤링을 위해 저널 비우기
+        
+        Args:
+            tab_ids (list): 기록을 지울 탭 ID 목록 (기본값은 전체 - 다른 탭의 기록은 그대로 둠)
+        """
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        if tab_ids is None:
+            open(self.path, 'w', encoding='utf-8').close()
+        else:
+            self._rewrite(set(tab_ids))
+        self._remove_shards(tab_ids)
+    
+    def record_page(self, tab_id, page, products):
+        """완료한 페이지와 그 페이지의 상품 목록 기록"""
+        self._append({"type": "page", "tab": tab_id, "page": page,
+                      "products": [product.to_row() for product in products]})
+    
+    def record_tab_done(self, tab_id):
+        """탭 크롤링 완료 기록"""
+        self._append({"type": "tab_done", "tab": tab_id})
+    
+    def shard_path(self, tab_id, start_page):
+        """병렬 크롤링 작업자가 탭의 start_page부터 구간을 기록할 구간 저널 경로"""
+        return f"{self.path}.{tab_id}-{start_page}.part"
+    
+    def load_shard(self, tab_id, start_page):
+        """구간 저널에 기록된 [(페이지 번호, 상품 목록)] - 작업자가 결과를 반환하지 못하고 중단된 경우"""
+        return [(entry["page"], [Product.from_row(row) for row in entry["products"]])
+                for entry in self._entries(self.shard_path(tab_id, start_page)) if entry["type"] == "page"]
+    
+    def discard_shard(self, tab_id, start_page):
+        """병합을 마친 구간 저널 삭제"""
+        path = self.shard_path(tab_id, start_page)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def load(self):
+        """
+        저널 읽기 - {탭 ID: {"pages": {페이지: 상품 목록}, "done": 완료 여부}} 반환
+        
+        기록 도중 중단되어 잘린 마지막 줄은 무시합니다. 병합하지 못하고 남은 구간 저널의 페이지
+        기록(구간의 완료 기록은 제외)은 이 저널로 옮긴 뒤 구간 저널을 삭제합니다.
+        """
+        # 잘린 마지막 줄 뒤에 새 기록이 이어 붙지 않도록 줄바꿈 보충
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                truncated = f.read(1) != b"\n"
+            if truncated:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write("\n")
+        
+        for shard in self._shard_paths():
+            pages = [entry for entry in self._entries(shard) if entry["type"] == "page"]
+            for entry in pages:
+                self._append(entry)
+            os.remove(shard)
+            if pages:
+                print(f"구간 저널에서 {len(pages)}개 페이지를 체크포인트로 옮겼습니다: {shard}")
+        
+        state = {}
+        for entry in self._entries(self.path):
+            tab_state = state.setdefault(entry["tab"], {"pages": {}, "done": False})
+            if entry["type"] == "page":
+                tab_state["pages"][entry["page"]] = [Product.from_row(row) for row in entry["products"]]
+            elif entry["type"] == "tab_done":
+                tab_state["done"] = True
+        return state
+    
+    def clear(self, tab_ids=None):
+        """
+        크롤링이 정상 종료되면 저널 삭제
+        
+        Args:
+            tab_ids (list): 끝까지 마친 탭 ID 목록 (기본값은 전체) - 그 탭의 기록만 지우고,
+                            남은 기록이 없으면 파일 삭제
+        """
+        self._remove_shards(tab_ids)
+        if not os.path.exists(self.path):
+            return
+        if tab_ids is not None and self._rewrite(set(tab_ids)):
+            return
+        os.remove(self.path)
+    
+    def _entries(self, path):
+        """저널 파일의 기록을 차례로 읽기 (손상된 줄은 건너뜀)"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    print("체크포인트의 손상된 기록을 건너뜁니다.")
+    
+    def _rewrite(self, removed_tab_ids):
+        """removed_tab_ids의 기록을 뺀 저널을 임시 파일에 쓴 뒤 교체 - 남은 기록 수 반환"""
+        kept = [entry for entry in self._entries(self.path) if entry["tab"] not in removed_tab_ids]
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in kept:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        return len(kept)
+    
+    def _shard_paths(self, tab_ids=None):
+        """남아 있는 구간 저널 경로 (tab_ids를 주면 그 탭의 구간만)"""
+        paths = sorted(glob.glob(glob.escape(self.path) + ".*.part"))
+        if tab_ids is None:
+            return paths
+        prefixes = tuple(f"{self.path}.{tab_id}-" for tab_id in tab_ids)
+        return [path for path in paths if path.startswith(prefixes)]
+    
+    def _remove_shards(self, tab_ids=None):
+        for path in self._shard_paths(tab_ids):
+            os.remove(path)
+    
+    def _append(self, entry):
+        """기록 한 줄 추가 후 디스크에 즉시 반영"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class CrawlDeltaTracker:
+    """
+    페이지 지문(fingerprint) 기반 증분 크롤링
+    
+    페이지마다 (상품명, 가격, 행사유형, 덤증정상품) 목록의 해시를 이전 실행과 비교합니다.
+    신상품은 앞쪽 페이지에 추가되므로 앞쪽 페이지가 연속으로 바뀌지 않았다면
+    나머지 페이지도 바뀌지 않은 것으로 보고 이전 실행의 결과를 그대로 사용합니다.
+    
+    단, 탭의 총 페이지 수가 이전과 다르거나, 사용할 페이지 중 max_carry_age보다 오래전에
+    실제로 크롤링한 페이지가 있거나, full_crawl_every번째 실행(전체 크롤링 주기)이면 끝까지 크롤링합니다.
+    """
+    
+    def __init__(self, state_path, unchanged_stop_after=2, max_carry_age=86400, full_crawl_every=7):
+        """
+        Args:
+            state_path (str): 페이지 지문과 상품 목록을 저장할 상태 파일 경로
+            unchanged_stop_after (int): 연속으로 이만큼 페이지가 바뀌지 않으면 탭 크롤링 중단
+            max_carry_age (float): 이전 결과를 그대로 사용할 수 있는 페이지의 최대 경과 시간(초)
+            full_crawl_every (int): 이전 결과를 사용한 실행이 이만큼 이어지면 다음 실행은 전체 크롤링
+        """
+        self.state_path = state_path
+        self.unchanged_stop_after = unchanged_stop_after
+        self.max_carry_age = max_carry_age
+        self.full_crawl_every = full_crawl_every
+        
+        state = self._load()
+        self.previous = state.get("tabs", {})
+        self.previous_total_pages = state.get("total_pages", {})
+        self.runs_since_full = state.get("runs_since_full", 0)
+        self.full_pass = self.runs_since_full + 1 >= full_crawl_every
+        if self.previous and self.full_pass:
+            print(f"- 증분 크롤링: 이전 결과를 사용한 실행이 {self.runs_since_full}번 이어져 이번에는 전체 크롤링합니다.")
+        
+        self.current = {}
+        self.current_total_pages = {}
+        self.unchanged_streak = {}
+        self.skipped_pages = 0
+        self.incomplete_tabs = set()
+    
+    @staticmethod
+    def page_fingerprint(products):
+        """페이지 상품 목록의 지문 (순서 포함)"""
+        digest = hashlib.sha1()
+        for product in products:
+            row = (product.name, str(product.price), product.promotion, product.gift)
+            digest.update("\x1f".join(row).encode('utf-8'))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+    
+    def observe_page(self, tab_id, page, products, total_pages, last_page=None):
+        """
+        크롤링한 페이지 기록 - 탭 크롤링을 여기서 멈추고 나머지 페이지는 이전 결과를 사용해도 되면 True 반환
+        
+        Args:
+            tab_id (str): 행사 탭 ID
+            page (int): 크롤링한 페이지 번호
+            products (list): 페이지에서 추출한 상품 목록
+            total_pages (int): 사이트에 표시된 탭의 총 페이지 수 (이전 실행과 같아야 이전 결과 사용)
+            last_page (int): 이번에 크롤링할 마지막 페이지 (페이지 구간을 나눈 경우, 기본값은 total_pages)
+        """
+        fingerprint = self.page_fingerprint(products)
+        self.current.setdefault(tab_id, {})[str(page)] = {
+            "fingerprint": fingerprint,
+            "products": [product.to_row() for product in products],
+            "crawled_at": time.time()
+        }
+        self.current_total_pages[tab_id] = total_pages
+        
+        previous_page = self.previous.get(tab_id, {}).get(str(page))
+        if previous_page and previous_page["fingerprint"] == fingerprint:
+            self.unchanged_streak[tab_id] = self.unchanged_streak.get(tab_id, 0) + 1
+        else:
+            self.unchanged_streak[tab_id] = 0
+        
+        if self.unchanged_streak[tab_id] < self.unchanged_stop_after:
+            return False
+        return self._can_carry_forward(tab_id, page, total_pages, last_page or total_pages)
+    
+    def _can_carry_forward(self, tab_id, page, total_pages, last_page):
+        """page 다음부터 last_page까지 이전 결과를 사용할 수 있는지 확인 (안 되면 처음 한 번만 사유 출력)"""
+        reason = None
+        previous_pages = self.previous.get(tab_id, {})
+        if self.full_pass:
+            return False
+        if self.previous_total_pages.get(tab_id) != total_pages:
+            reason = f"총 페이지 수가 바뀜 ({self.previous_total_pages.get(tab_id)} → {total_pages})"
+        else:
+            now = time.time()
+            for next_page in range(page + 1, last_page + 1):
+                page_state = previous_pages.get(str(next_page))
+                if page_state is None:
+                    reason = f"이전 실행에 페이지 {next_page} 결과가 없음"
+                    break
+                if now - page_state.get("crawled_at", 0) > self.max_carry_age:
+                    reason = f"페이지 {next_page} 결과가 {self.max_carry_age / 3600:.0f}시간보다 오래됨"
+                    break
+        
+        if reason and self.unchanged_streak[tab_id] == self.unchanged_stop_after:
+            print(f"- 증분 크롤링: {tab_id} 탭은 {reason} - 끝까지 크롤링합니다.")
+        return reason is None
+    
+    def carry_forward(self, tab_id, after_page, last_page):
+        """이전 실행에서 after_page 다음부터 last_page까지의 상품 목록을 페이지 순서대로 반환 (현재 상태에도 복사)"""
+        previous_pages = self.previous.get(tab_id, {})
+        carried = []
+        for page in range(after_page + 1, last_page + 1):
+            page_state = previous_pages[str(page)]
+            self.current.setdefault(tab_id, {})[str(page)] = page_state
+            carried.append([Product.from_row(row) for row in page_state["products"]])
+        self.skipped_pages += len(carried)
+        return carried
+    
+    def mark_incomplete(self, tab_id):
+        """끝까지 크롤링하지 못한 탭 - 방문하지 못한 페이지는 이전 상태를 유지하고 삭제로 판단하지 않음"""
+        self.incomplete_tabs.add(tab_id)
+        for page, page_state in self.previous.get(tab_id, {}).items():
+            self.current.setdefault(tab_id, {}).setdefault(page, page_state)
+        if tab_id in self.previous_total_pages:
+            self.current_total_pages.setdefault(tab_id, self.previous_total_pages[tab_id])
+    
+    def current_products(self):
+        """이번 실행에서 기록한 페이지(크롤링하거나 이전 결과를 사용한 페이지)의 상품을 탭/페이지 순서대로 반환"""
+        products = []
+        for tab_pages in self.current.values():
+            for page in sorted(tab_pages, key=int):
+                products.extend(Product.from_row(row) for row in tab_pages[page]["products"])
+        return products
+    
+    def finish(self, products=None, output_dir="gs25_results"):
+        """
+        이전 실행 대비 추가/삭제/변경된 상품을 변경 파일로 저장하고 상태 파일 갱신
+        
+        Args:
+            products (list): 이번 실행의 최종 상품 목록 (없으면 상태에 기록한 페이지별 상품 목록으로 비교 -
+                             keep_in_memory=False로 결과를 메모리에 쌓지 않은 경우)
+            output_dir (str): 변경 파일을 저장할 디렉토리
+        """
+        if products is None:
+            products = self.current_products()
+        previous_products = {}
+        incomplete_keys = set()
+        for tab_id in self.previous:
+            for page in sorted(self.previous[tab_id], key=int):
+                for row in self.previous[tab_id][page]["products"]:
+                    product = Product.from_row(row)
+                    previous_products.setdefault(self._product_key(product), product)
+                    if tab_id in self.incomplete_tabs:
+                        incomplete_keys.add(self._product_key(product))
+        
+        current_products = {}
+        for product in products:
+            current_products.setdefault(self._product_key(product), product)
+        
+        delta_rows = []
+        for key, product in current_products.items():
+            if key not in previous_products:
+                delta_rows.append(dict(product.to_row(), 변경구분="추가"))
+            elif self._product_values(product) != self._product_values(previous_products[key]):
+                delta_rows.append(dict(product.to_row(), 변경구분="변경"))
+        for key, product in previous_products.items():
+            if key not in current_products and key not in incomplete_keys:
+                delta_rows.append(dict(product.to_row(), 변경구분="삭제"))
+        
+        print(f"- 증분 크롤링: 이전 실행 결과로 {self.skipped_pages}개 페이지 생략, "
+              f"변경 상품 {len(delta_rows)}개")
+        
+        if delta_rows:
+            if not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            delta_path = os.path.join(output_dir, f"GS25_변경상품_{timestamp}.csv")
+            pd.DataFrame(delta_rows).to_csv(delta_path, index=False, encoding='utf-8-sig')
+            print(f"- 변경 상품 저장 경로: {delta_path}")
+        
+        self._save()
+    
+    def _product_key(self, product):
+        return (product.name, product.promotion)
+    
+    def _product_values(self, product):
+        return (product.price, product.image_url, product.category, product.gift)
+    
+    def _load(self):
+        """이전 실행의 상태 파일 읽기"""
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except ValueError as e:
+            print(f"증분 크롤링 상태 파일을 읽을 수 없어 전체 크롤링으로 진행합니다: {e}")
+            return {}
+        
+        # 총 페이지 수와 크롤링 시각이 없는 이전 형식은 전체 크롤링으로 새로 만듦
+        if "tabs" not in state:
+            print("증분 크롤링 상태 파일이 이전 형식이어서 전체 크롤링으로 진행합니다.")
+            return {}
+        return state
+    
+    def _save(self):
+        """이번 실행의 상태를 임시 파일에 쓴 뒤 교체"""
+        directory = os.path.dirname(self.state_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        # 이전 결과를 하나도 사용하지 않고 끝까지 마친 실행이면 전체 크롤링 주기를 다시 시작
+        full_run = self.skipped_pages == 0 and not self.incomplete_tabs
+        state = {
+            "runs_since_full": 0 if full_run else self.runs_since_full + 1,
+            "total_pages": self.current_total_pages,
+            "tabs": self.current
+        }
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(temp_path, self.state_path)
+
+
+class ProductSink(ABC):
+    """크롤링 결과 스트리밍 저장소 - 페이지마다 새로 추출된 상품을 바로 내보냄"""
+    
+    description = "sink"
+    # 중복 인덱스가 이전 실행과 같은 내용이라고 판단한 상품을 건너뛸지 여부
+    # (이력처럼 크롤링마다 전체 목록이 필요한 저장소는 False)
+    skip_unchanged = True
+    
+    @abstractmethod
+    def write(self, products):
+        """상품 목록 저장"""
+    
+    def close(self):
+        """저장소 정리"""
+        pass
+
+
+class CsvProductSink(ProductSink):
+    """상품을 CSV 파일에 한 페이지씩 이어서 기록"""
+    
+    def __init__(self, file_path):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.description = file_path
+        self.file = open(file_path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=PRODUCT_COLUMNS, restval="")
+        self.writer.writeheader()
+    
+    def write(self, products):
+        self.writer.writerows(product.to_row() for product in products)
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
+
+
+class JsonLinesProductSink(ProductSink):
+    """상품을 JSON Lines 파일에 한 줄씩 기록"""
+    
+    def __init__(self, file_path):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.description = file_path
+        self.file = open(file_path, 'w', encoding='utf-8')
+    
+    def write(self, products):
+        for product in products:
+            self.file.write(json.dumps(product.to_row(), ensure_ascii=False) + "\n")
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
+
+
+class SqlProductSink(ProductSink):
+    """상품을 GS25DatabaseManager.save_products로 바로 DB에 저장"""
+    
+    def __init__(self, db_manager):
+        """
+        Args:
+            db_manager (GS25DatabaseManager): 연결된 데이터베이스 관리자
+        """
+        self.description = f"MySQL {db_manager.database}"
+        self.db_manager = db_manager
+        self.failed_count = 0
+    
+    def write(self, products):
+        # 저장 실패는 예외로 전달되어 크롤러가 중복 인덱스에 기록하지 않음
+        _, failed_products, _, _ = self.db_manager.upsert_products(products)
+        self.failed_count += len(failed_products)
+
+
+class HistoryProductSink(ProductSink):
+    """
+    상품을 GS25DatabaseManager.save_snapshot으로 이력 테이블(product_history)에 기록
+    
+    같은 크롤링의 상품은 모두 sink를 만들 때 정한 크롤링 시각으로 기록되고, batch_size개씩 모아 저장합니다.
+    이력은 크롤링마다 전체 목록을 남겨야 하므로 중복 인덱스가 건너뛰는 상품도 받습니다.
+    PipelineProductSink와 함께 쓸 때는 별도의 DB 관리자(연결)를 넘겨야 합니다.
+    """
+    
+    skip_unchanged = False
+    
+    def __init__(self, db_manager, crawled_at=None, batch_size=1000):
+        """
+        Args:
+            db_manager (GS25DatabaseManager): 연결된 데이터베이스 관리자
+            crawled_at (datetime): 크롤링 시각 (기본값: sink를 만든 시각)
+            batch_size (int): 이만큼 모이면 이력 테이블에 저장할 상품 수
+        """
+        self.description = f"MySQL {db_manager.database} (이력)"
+        self.db_manager = db_manager
+        self.crawled_at = crawled_at or datetime.datetime.now()
+        self.batch_size = batch_size
+        self.pending = []
+        self.saved_count = 0
+        self.failed_count = 0
+    
+    def write(self, products):
+        self.pending.extend(products)
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+    
+    def close(self):
+        self._flush()
+        print(f"- 이력 저장: {self.saved_count}개 상품 저장, 저장 실패 {self.failed_count}개")
+    
+    def _flush(self):
+        """모은 상품 저장 (save_snapshot은 실패하면 0을 반환)"""
+        if not self.pending:
+            return
+        products, self.pending = self.pending, []
+        saved = self.db_manager.save_snapshot(products, self.crawled_at, self.batch_size)
+        self.saved_count += saved
+        self.failed_count += len(products) - saved
+
+
+class PipelineProductSink(ProductSink):
+    """
+    크롤러 → DB 파이프라인 - 상품을 크기가 제한된 큐에 넣고 별도 스레드가 모아서 일괄 저장
+    
+    큐가 가득 차면 크롤러가 기다리므로(backpressure) DB가 느려도 메모리 사용량이 늘지 않고,
+    close() 때 큐에 남은 상품을 모두 저장한 뒤 종료합니다.
+    event_products와 함께 웹페이지가 조회하는 gs25_products에도 저장하므로 CSV 적재 없이 웹페이지에 반영됩니다.
+    DB 관리자의 연결은 저장 스레드만 사용하므로 크롤링 중에는 다른 곳에서 쓰지 않아야 합니다.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, db_manager, batch_size=200, max_pending_pages=20, flush_interval=5.0,
+                 publish_to_web=True, max_retries=2, retry_delay=1.0):
+        """
+        Args:
+            db_manager (GS25DatabaseManager): 연결된 데이터베이스 관리자
+            batch_size (int): 이만큼 모이면 바로 저장할 상품 수
+            max_pending_pages (int): 저장을 기다릴 수 있는 최대 페이지 수 (큐 크기)
+            flush_interval (float): 상품이 batch_size만큼 모이지 않아도 저장할 간격(초)
+            publish_to_web (bool): 웹페이지가 조회하는 gs25_products에도 저장할지 여부
+                                   (connect_Sql의 migrate_gs25_products로 uk_product 키를 먼저 추가해야 함)
+            max_retries (int): 일괄 저장이 실패했을 때 다시 시도할 횟수
+            retry_delay (float): 첫 재시도 전 대기 시간(초), 재시도마다 두 배로 늘어남
+        """
+        self.description = f"MySQL {db_manager.database} (파이프라인)"
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.publish_to_web = publish_to_web
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.queue = queue.Queue(maxsize=max_pending_pages)
+        self.saved_count = 0
+        self.failed_count = 0
+        self.blocked_time = 0.0
+        self.thread = threading.Thread(target=self._consume, name="gs25-db-pipeline", daemon=True)
+        self.thread.start()
+    
+    def write(self, products):
+        if not products:
+            return
+        # 큐가 가득 차 있으면 저장 스레드가 따라올 때까지 대기
+        start_time = time.perf_counter()
+        self.queue.put(list(products))
+        self.blocked_time += time.perf_counter() - start_time
+    
+    def close(self):
+        self.queue.put(self._STOP)
+        self.thread.join()
+        print(f"- DB 파이프라인: {self.saved_count}개 상품 저장, 저장 실패 {self.failed_count}개, "
+              f"큐 대기 {self.blocked_time:.1f}초")
+    
+    def _consume(self):
+        """저장 스레드 - 큐에서 상품을 모아 batch_size개 또는 flush_interval초마다 저장"""
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                products = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                products = None
+            
+            if products is self._STOP:
+                self._flush(batch)
+                return
+            if products:
+                batch.extend(products)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+                deadline = None
+    
+    def _flush(self, batch):
+        """모은 상품 저장 - 실패하면 연결을 확인하고 다시 시도하며, 끝내 실패한 상품은 failed_count에 집계"""
+        if not batch:
+            return
+        for attempt in range(self.max_retries + 1):
+            try:
+                if not self.db_manager.conn or not self.db_manager.conn.is_connected():
+                    if not self.db_manager.connect():
+                        raise RuntimeError("데이터베이스에 다시 연결하지 못했습니다.")
+                saved_products, failed_products, _, _ = self.db_manager.upsert_products(batch, self.batch_size)
+                if self.publish_to_web:
+                    self.db_manager.upsert_web_products(saved_products, self.batch_size)
+                self.saved_count += len(saved_products)
+                self.failed_count += len(failed_products)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.failed_count += len(batch)
+                    print(f"DB 파이프라인 저장 중 오류 발생 - 상품 {len(batch)}개 저장 실패: {str(e)}")
+                    return
+                delay = self.retry_delay * (2 ** attempt)
+                print(f"DB 파이프라인 저장 실패 ({attempt + 1}/{self.max_retries + 1}): {str(e)} - {delay:.1f}초 후 다시 시도합니다.")
+                time.sleep(delay)
+
+
+class AdaptiveCrawlScheduler:
+    """
+    변경 빈도 기반 크롤링 계획
+    
+    탭/페이지마다 이전 크롤링 대비 내용이 바뀐 비율을 지수 이동 평균으로 기록하고,
+    "변경률 x 마지막 크롤링 후 경과 시간"(그동안 놓쳤을 것으로 예상되는 변경)이 큰 페이지부터
+    시간당 페이지 예산 안에서 크롤링 대상을 고릅니다.
+    탭마다 가장 자주 바뀌는 페이지의 변경률로 크롤링 주기(min_tab_interval~max_tab_interval)를 정하고,
+    마지막 크롤링 후 주기가 지나지 않은 탭은 계획에서 뺍니다.
+    """
+    
+    def __init__(self, stats_path, budget_pages_per_hour=60, smoothing=0.3, initial_rate=1.0,
+                 min_tab_interval=3600, max_tab_interval=86400):
+        """
+        Args:
+            stats_path (str): 탭/페이지별 변경 통계 파일 경로
+            budget_pages_per_hour (int): 시간당 크롤링할 수 있는 최대 페이지 수
+            smoothing (float): 변경률 이동 평균에서 최근 관측의 가중치 (0~1)
+            initial_rate (float): 아직 관측하지 않은 페이지의 변경률
+            min_tab_interval (float): 크롤링할 때마다 바뀌는 탭의 크롤링 주기(초)
+            max_tab_interval (float): 바뀌지 않는 탭도 이 주기(초)마다는 크롤링
+        """
+        self.stats_path = stats_path
+        self.budget_pages_per_hour = budget_pages_per_hour
+        self.smoothing = smoothing
+        self.initial_rate = initial_rate
+        self.min_tab_interval = min_tab_interval
+        self.max_tab_interval = max_tab_interval
+        self.stats = {"tabs": {}, "last_plan_at": None}
+        if os.path.exists(stats_path):
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+    
+    def record(self, tab_id, page, products, total_pages=None):
+        """크롤링한 페이지의 변경 여부를 반영해 변경률 갱신"""
+        tab_stats = self.stats["tabs"].setdefault(tab_id, {"total_pages": None, "pages": {}})
+        if total_pages:
+            tab_stats["total_pages"] = total_pages
+        
+        page_stats = tab_stats["pages"].setdefault(str(page), {
+            "rate": self.initial_rate, "fingerprint": None, "last_crawled": None, "observations": 0})
+        fingerprint = CrawlDeltaTracker.page_fingerprint(products)
+        if page_stats["fingerprint"] is not None:
+            changed = 1.0 if fingerprint != page_stats["fingerprint"] else 0.0
+            page_stats["rate"] = self.smoothing * changed + (1 - self.smoothing) * page_stats["rate"]
+        page_stats["fingerprint"] = fingerprint
+        page_stats["last_crawled"] = time.time()
+        page_stats["observations"] += 1
+        tab_stats["last_crawled"] = page_stats["last_crawled"]
+    
+    def tab_interval(self, tab_id):
+        """탭의 크롤링 주기(초) - 가장 자주 바뀌는 페이지의 변경률이 1이면 최소 주기, 0이면 최대 주기"""
+        tab_stats = self.stats["tabs"].get(tab_id) or {}
+        rates = [page_stats["rate"] for page_stats in tab_stats.get("pages", {}).values()]
+        rate = max(rates) if rates else self.initial_rate
+        return self.max_tab_interval - (self.max_tab_interval - self.min_tab_interval) * rate
+    
+    def seconds_until_due(self, tab_id, now=None):
+        """탭의 다음 크롤링까지 남은 시간(초) - 0이면 지금 크롤링할 차례"""
+        now = now or time.time()
+        tab_stats = self.stats["tabs"].get(tab_id) or {}
+        # 탭별 크롤링 시각이 없는 이전 형식의 통계는 페이지별 크롤링 시각으로 판단
+        last_crawled = tab_stats.get("last_crawled") or max(
+            (page_stats["last_crawled"] or 0 for page_stats in tab_stats.get("pages", {}).values()), default=0)
+        if not last_crawled:
+            return 0
+        return max(0, last_crawled + self.tab_interval(tab_id) - now)
+    
+    def plan(self, tab_ids, now=None):
+        """
+        이번 실행에서 크롤링할 [(탭 ID, 페이지 목록)] - 우선순위가 높은 탭부터
+        
+        페이지 수를 아직 모르는 탭은 페이지 목록 대신 None(전체 크롤링)을 반환하고,
+        크롤링 주기(tab_interval)가 지나지 않은 탭은 넣지 않습니다.
+        
+        Args:
+            tab_ids (list): 크롤링할 수 있는 탭 ID 목록
+            now (float): 기준 시각 (기본값: 현재 시각)
+        """
+        now = now or time.time()
+        last_plan_at = self.stats.get("last_plan_at")
+        hours = (now - last_plan_at) / 3600 if last_plan_at else 1.0
+        budget = max(1, int(self.budget_pages_per_hour * min(hours, 24)))
+        self.stats["last_plan_at"] = now
+        
+        full_tabs = []
+        candidates = []
+        for tab_id in tab_ids:
+            tab_stats = self.stats["tabs"].get(tab_id)
+            if not tab_stats or not tab_stats.get("total_pages"):
+                full_tabs.append(tab_id)
+                continue
+            if self.seconds_until_due(tab_id, now) > 0:
+                continue
+            for page in range(1, tab_stats["total_pages"] + 1):
+                page_stats = tab_stats["pages"].get(str(page))
+                if page_stats is None or page_stats["last_crawled"] is None:
+                    # 새로 생긴 페이지는 변경된 것으로 보고 우선 크롤링
+                    priority = self.initial_rate * max(hours, 1.0)
+                else:
+                    priority = page_stats["rate"] * (now - page_stats["last_crawled"]) / 3600
+                candidates.append((priority, tab_id, page))
+        
+        # 우선순위가 같으면 신상품이 들어오는 앞쪽 페이지부터
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[2]))
+        selected = {}
+        tab_priority = {}
+        for priority, tab_id, page in candidates[:budget]:
+            if priority <= 0:
+                break
+            selected.setdefault(tab_id, []).append(page)
+            tab_priority[tab_id] = max(tab_priority.get(tab_id, 0), priority)
+        
+        plan = [(tab_id, None) for tab_id in full_tabs]
+        for tab_id in sorted(selected, key=lambda tab_id: -tab_priority[tab_id]):
+            plan.append((tab_id, sorted(selected[tab_id])))
+        return plan
+    
+    def save(self):
+        """변경 통계 파일 저장"""
+        directory = os.path.dirname(self.stats_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.stats_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f, ensure_ascii=False)
+        os.replace(temp_path, self.stats_path)
+    
+    def report(self):
+        """탭별 평균 변경률과 크롤링 주기 출력"""
+        for tab_id, tab_stats in self.stats["tabs"].items():
+            rates = [page_stats["rate"] for page_stats in tab_stats["pages"].values()]
+            if rates:
+                print(f"- {tab_id}: 평균 변경률 {sum(rates) / len(rates):.2f} ({len(rates)}개 페이지 관측), "
+                      f"크롤링 주기 {self.tab_interval(tab_id) / 3600:.1f}시간")
+
+
+class GS25CrawlerBase:
+    """크롤러 공통 기능 (행사 탭 목록, 중복 제거, 재시도, 체크포인트, 결과 저장)"""
+    
+    # 행사 탭 ID -> 탭 이름 (전체 탭 제외)
+    EVENT_TABS = {
+        "ONE_TO_ONE": "1+1 행사",
+        "TWO_TO_ONE": "2+1 행사",
+        "GIFT": "덤증정 행사"
+    }
+    
+    def __init__(self, url, crawl_all_pages=True, max_pages=20, sinks=None, keep_in_memory=True,
+                 dedup_index=None, metrics=None, checkpoint_path=None, delta_state_path=None,
+                 retry_policy=None, circuit_breaker=None):
+        self.url = url
+        self.crawl_all_pages = crawl_all_pages
+        self.max_pages = max_pages  # crawl_all_pages가 False일 때만 사용
+        self.products = []
+        self.product_keys = set()  # 정규화한 (상품명, 행사유형) 중복 체크를 위한 집합
+        self.duplicate_count = 0
+        
+        # 이전 실행에서 이미 저장소로 보낸 상품을 다시 보내지 않기 위한 인덱스 (ProductDedupIndex)
+        # 결과(self.products)와 증분 비교에는 영향을 주지 않고, 저장이 끝난 상품만 실행 종료 시 기록
+        self.dedup_index = dedup_index
+        self.unindexed_products = []
+        
+        # 단계별 계측 (CrawlMetrics)
+        self.metrics = metrics
+        
+        # 스트리밍 저장소 (keep_in_memory가 False이면 self.products에 쌓지 않음)
+        self.sinks = sinks or []
+        self.keep_in_memory = keep_in_memory
+        self.product_count = 0
+        self.category_counts = Counter()
+        
+        # 체크포인트 저널과 증분 크롤링 상태 (경로를 지정한 경우만)
+        self.checkpoint = CrawlCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.delta = CrawlDeltaTracker(delta_state_path) if delta_state_path else None
+        
+        # 페이지 작업 재시도 정책과 연속 실패 시 크롤링을 멈출 회로 차단기
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        
+        # 끝까지 크롤링하지 못한 탭 (탭 ID -> 중단 위치와 사유)
+        self.incomplete_tabs = {}
+        
+        # 행사 탭 ID 목록 (전체 탭 제외)
+        self.event_tabs = dict(self.EVENT_TABS)
+    
+    def _stage(self, name):
+        """계측이 켜져 있으면 단계 시간 측정"""
+        return self.metrics.stage(name) if self.metrics else contextlib.nullcontext()
+    
+    def _add_unique_products(self, products_list):
+        """중복되지 않은 상품만 추가"""
+        with self._stage("dedup"):
+            self._add_unique_products_unmeasured(products_list)
+    
+    def _add_unique_products_unmeasured(self, products_list):
+        new_products = []
+        for product in products_list:
+            product = Product.coerce(product)
+            product_key = normalize_product_key(product.name, product.promotion)
+            # 이미 추가된 (상품명, 행사유형)이 아닌 경우에만 추가
+            if product_key in self.product_keys:
+                self.duplicate_count += 1
+                print(f"중복 상품 발견 - 제외: {product.name} ({product.promotion})")
+                continue
+            self.product_keys.add(product_key)
+            new_products.append(product)
+        
+        if not new_products:
+            return
+        
+        self.product_count += len(new_products)
+        self.category_counts.update(product.category for product in new_products)
+        if self.keep_in_memory:
+            self.products.extend(new_products)
+        
+        if self.sinks:
+            self._write_sinks(new_products)
+    
+    def _write_sinks(self, products):
+        """
+        새로 추가된 상품을 스트리밍 저장소로 바로 내보냄
+        
+        이전 실행에서 같은 내용으로 보낸 상품은 skip_unchanged인 저장소에 보내지 않습니다.
+        """
+        changed = products
+        if self.dedup_index is not None:
+            changed = [product for product in products if not self.dedup_index.is_unchanged(product)]
+        
+        written = True
+        for sink in self.sinks:
+            sink_products = changed if sink.skip_unchanged else products
+            if not sink_products:
+                continue
+            try:
+                sink.write(sink_products)
+            except Exception as e:
+                written = False
+                print(f"스트리밍 저장({sink.description}) 중 오류 발생: {str(e)}")
+        
+        # 모든 저장소에 기록된 상품만 실행 종료 시 인덱스에 기록
+        if written and self.dedup_index is not None:
+            self.unindexed_products.extend(changed)
+    
+    def _finish_run(self):
+        """스트리밍 저장소를 닫고 계측 결과 내보내기"""
+        sinks_ok = True
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                sinks_ok = False
+                print(f"스트리밍 저장소({sink.description}) 종료 중 오류 발생: {str(e)}")
+            # 파이프라인처럼 나중에 저장하는 저장소는 닫은 뒤에야 실패 여부를 알 수 있음
+            if getattr(sink, "failed_count", 0):
+                sinks_ok = False
+        
+        if self.dedup_index is not None and self.unindexed_products:
+            if sinks_ok:
+                self.dedup_index.add_many(self.unindexed_products)
+            else:
+                print(f"- 저장에 실패한 저장소가 있어 {len(self.unindexed_products)}개 상품을 중복 인덱스에 기록하지 않습니다.")
+            self.unindexed_products = []
+        if self.metrics:
+            try:
+                self.metrics.finish()
+            except Exception as e:
+                print(f"크롤링 지표 저장 중 오류 발생: {str(e)}")
+    
+    def _retry(self, operation, action, recover=None):
+        """
+        페이지 작업 실행 - 실패하면 백오프 후 recover()로 페이지를 복구하고 다시 시도
+        
+        Args:
+            operation (str): 작업 이름 (재시도 지표와 로그에 사용)
+            action (callable): 실행할 작업
+            recover (callable): 재시도 전에 페이지를 다시 여는 함수
+        """
+        max_attempts = self.retry_policy.max_attempts
+        for attempt in range(1, max_attempts + 1):
+            self.circuit_breaker.wait_if_open()
+            try:
+                if attempt > 1 and recover:
+                    recover()
+                result = action()
+                self.circuit_breaker.record_success()
+                return result
+            except Exception as e:
+                self.circuit_breaker.record_failure()
+                if attempt == max_attempts:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                if self.metrics:
+                    self.metrics.record_retry(operation)
+                print(f"{operation} 실패 ({attempt}/{max_attempts}): {str(e)} - {delay:.1f}초 후 다시 시도합니다.")
+                time.sleep(delay)
+    
+    def _record_incomplete_tab(self, tab_id, tab_name, last_page, total_pages, reason):
+        """끝까지 크롤링하지 못한 탭 기록 (체크포인트는 완료로 표시하지 않으므로 다음 실행에서 이어서 진행)"""
+        self.incomplete_tabs[tab_id] = {
+            "tab_name": tab_name,
+            "last_page": last_page,
+            "total_pages": total_pages,
+            "reason": reason
+        }
+        if self.delta:
+            self.delta.mark_incomplete(tab_id)
+        print(f"{tab_name} 탭은 페이지 {last_page}/{total_pages or '?'}에서 중단되어 미완료로 기록합니다: {reason}")
+    
+    def _prepare_checkpoint(self, resume, tab_ids=None):
+        """
+        체크포인트 준비 - 탭별 시작 페이지 반환 (이미 완료된 탭은 None)
+        
+        resume이면 저널에 1페이지부터 빠짐없이 기록된 페이지의 상품을 탭/페이지 순서대로 다시 추가해
+        중단 없이 크롤링한 것과 같은 중복 제거 결과를 만들고, 그 다음 페이지부터 크롤링합니다
+        (병렬 크롤링의 뒤쪽 구간만 기록된 페이지는 다시 크롤링). resume이 아니면 이번에 크롤링할 탭의
+        기록만 지우고 새로 시작합니다.
+        
+        Args:
+            resume (bool): 저널에 기록된 지점부터 이어서 크롤링할지 여부
+            tab_ids (list): 이번에 크롤링할 탭 ID 목록 (기본값은 전체 행사 탭)
+        """
+        tab_ids = list(tab_ids or self.event_tabs)
+        start_pages = {tab_id: 1 for tab_id in tab_ids}
+        if not self.checkpoint:
+            return start_pages
+        
+        if not resume:
+            self.checkpoint.reset(tab_ids)
+            return start_pages
+        
+        state = self.checkpoint.load()
+        for tab_id in tab_ids:
+            tab_state = state.get(tab_id)
+            if not tab_state:
+                continue
+            if tab_state["done"]:
+                restored_pages = sorted(tab_state["pages"])
+                start_pages[tab_id] = None
+            else:
+                next_page = 1
+                while next_page in tab_state["pages"]:
+                    next_page += 1
+                restored_pages = range(1, next_page)
+                start_pages[tab_id] = next_page
+            for page in restored_pages:
+                self._add_unique_products(tab_state["pages"][page])
+            print(f"{self.event_tabs[tab_id]}: 체크포인트에서 {len(restored_pages)}개 페이지 복원")
+        
+        return start_pages
+    
+    def _finish_checkpoint(self, tab_ids=None):
+        """
+        크롤링한 탭을 모두 끝까지 마쳤을 때만 그 탭의 체크포인트 기록 삭제 (미완료 탭은 다음 실행에서 이어서 진행)
+        
+        Args:
+            tab_ids (list): 이번에 크롤링한 탭 ID 목록 (기본값은 전체 행사 탭)
+        """
+        if not self.checkpoint:
+            return
+        tab_ids = list(tab_ids or self.event_tabs)
+        if any(tab_id in self.incomplete_tabs for tab_id in tab_ids):
+            print(f"- 미완료 탭이 있어 체크포인트를 유지합니다: {self.checkpoint.path}")
+        else:
+            self.checkpoint.clear(tab_ids)
+    
+    def _finish_delta(self, tab_ids=None):
+        """
+        증분 크롤링 상태 저장과 변경 상품 파일 기록
+        
+        Args:
+            tab_ids (list): 이번에 크롤링한 탭 ID 목록 (기본값은 전체 행사 탭) - 나머지 탭은 이전 상태를 유지하고
+                            삭제로 판단하지 않음
+        """
+        if not self.delta:
+            return
+        for tab_id in self.event_tabs:
+            if tab_ids is not None and tab_id not in tab_ids:
+                self.delta.mark_incomplete(tab_id)
+        # 결과를 메모리에 쌓지 않았으면 증분 상태에 기록된 페이지별 상품 목록으로 비교
+        self.delta.finish(self.products if self.keep_in_memory else None)
+    
+    def _save_results(self, file_prefix="GS25_행사상품"):
+        """
+        크롤링 결과를 CSV 파일로 저장
+        
+        Args:
+            file_prefix (str): 결과 파일명 앞부분 ({file_prefix}_{시각}.csv)
+        """
+        with self._stage("save"):
+            self._save_results_unmeasured(file_prefix)
+    
+    def _save_results_unmeasured(self, file_prefix):
+        if not self.product_count:
+            print("저장할 데이터가 없습니다.")
+            return
+        
+        # 메모리에 결과를 쌓지 않는 경우 스트리밍 저장소에 이미 기록되어 있음
+        if not self.keep_in_memory:
+            print(f"\n크롤링 결과 요약:")
+            print(f"- 총 {self.product_count}개의 상품 정보 수집 (중복 제거됨)")
+            for sink in self.sinks:
+                print(f"- 스트리밍 저장: {sink.description}")
+            for event_type, count in self.category_counts.most_common():
+                print(f"- {event_type}: {count}개 상품")
+            if self.dedup_index is not None:
+                self.dedup_index.report()
+            return
+        
+        # 결과 디렉토리 생성
+        output_dir = "gs25_results"
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        
+        # 파일명 생성 (현재 시간 포함)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        file_path = os.path.join(output_dir, f"{file_prefix}_{timestamp}.csv")
+        
+        # DataFrame 생성 및 저장
+        df = pd.DataFrame([product.to_row() for product in self.products])
+        df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        print(f"\n크롤링 결과 요약:")
+        print(f"- 총 {len(self.products)}개의 상품 정보 수집 (중복 제거됨)")
+        print(f"- 결과 저장 경로: {file_path}")
+        
+        # 행사 유형별 통계
+        event_counts = df['행사분류'].value_counts().to_dict()
+        for event_type, count in event_counts.items():
+            print(f"- {event_type}: {count}개 상품")
+        
+        # 중복 제거 상태 보고
+        if self.duplicate_count > 0:
+            print(f"- {self.duplicate_count}개의 중복 상품이 제거되었습니다.")
+        if self.dedup_index is not None:
+            self.dedup_index.report()
+
+
+class GS25EventCrawler(GS25CrawlerBase):
+    def __init__(self, url, crawl_all_pages=True, max_pages=20, wait_time=10, smart_wait=True,
+                 js_extraction=True, checkpoint_path=None, delta_state_path=None,
+                 sinks=None, keep_in_memory=True, driver=None, network_filter=None, dedup_index=None,
+                 snapshot_dir=None, metrics=None, scheduler=None, retry_policy=None, circuit_breaker=None):
         """
         GS25 행사상품 크롤러 초기화 (1+1, 2+1, 덤증정 행사 모두 크롤링)
         
@@ -19,60 +1662,987 @@ class GS25EventCrawler:
             crawl_all_pages (bool): 모든 페이지를 크롤링할지 여부
             max_pages (int): crawl_all_pages가 False일 때 각 탭별 크롤링할 최대 페이지 수
             wait_time (int): 요소 로딩 대기 시간(초)
+            smart_wait (bool): 고정 대기(time.sleep) 대신 화면 갱신을 감지하는 즉시 진행할지 여부
+            js_extraction (bool): 페이지 전체 상품을 한 번의 JavaScript 호출로 추출할지 여부
+            checkpoint_path (str): 체크포인트 저널 경로 (지정하면 페이지마다 진행 상황을 기록)
+            delta_state_path (str): 증분 크롤링 상태 파일 경로 (지정하면 바뀌지 않은 페이지 범위를 생략)
+            sinks (list): 페이지마다 새 상품을 바로 내보낼 ProductSink 목록
+            keep_in_memory (bool): 수집한 상품을 self.products에 모아 마지막에 CSV로 저장할지 여부
+            driver (WebDriver): 재사용할 WebDriver (BrowserPool에서 빌린 드라이버 등, 크롤링 후 종료하지 않음)
+            network_filter (NetworkFilter): 요청 차단 규칙과 네트워크 사용량 집계기
+            dedup_index (ProductDedupIndex): 이전 실행에서 저장소로 보낸 상품을 다시 보내지 않기 위한 중복 인덱스
+            snapshot_dir (str): 지정하면 방문한 페이지의 DOM을 탭/페이지별 HTML 파일로 저장 (오프라인 재생용)
+            metrics (CrawlMetrics): 단계별 시간, WebDriver 명령 수 등을 기록할 계측기
+            scheduler (AdaptiveCrawlScheduler): 페이지별 변경률을 기록할 크롤링 계획기
+            retry_policy (RetryPolicy): 탭 열기/페이지 이동/추출 실패 시 재시도 정책
+            circuit_breaker (CircuitBreaker): 연속 실패 시 크롤링을 멈출 회로 차단기
+        """
+        super().__init__(url, crawl_all_pages, max_pages, sinks, keep_in_memory, dedup_index, metrics,
+                         checkpoint_path, delta_state_path, retry_policy, circuit_breaker)
+        self.wait_time = wait_time
+        self.snapshot_dir = snapshot_dir
+        self.scheduler = scheduler
+        self.smart_wait = smart_wait
+        self.js_extraction = js_extraction
+        
+        # 리스트로 설정하면 크롤링한 페이지마다 (페이지 번호, 상품 목록)을 기록 (병렬 크롤링 작업자)
+        self.page_results = None
+        
+        # 대기 통계 (고정 대기 대비 절약한 시간)
+        self.wait_stats = {"count": 0, "timeouts": 0, "waited": 0.0, "saved": 0.0}
+        
+        # WebDriver 초기화 (전달받은 드라이버는 호출한 쪽에서 관리)
+        self.owns_driver = driver is None
+        self.driver = driver or create_chrome_driver(performance_log=network_filter is not None)
+        self.wait = WebDriverWait(self.driver, wait_time)
+        if metrics:
+            metrics.instrument_driver(self.driver)
+        
+        # 요청 차단 규칙 적용
+        self.network_filter = network_filter
+        if network_filter:
+            network_filter.apply(self.driver)
+    
+    def start_crawling(self, resume=False):
+        """
+        크롤링 시작 - 모든 행사 유형 크롤링
+        
+        Args:
+            resume (bool): 체크포인트 저널에 기록된 지점부터 이어서 크롤링할지 여부
+        """
+        try:
+            # 이어서 크롤링할 위치 확인 (완료된 페이지의 상품은 그대로 복원)
+            start_pages = self._prepare_checkpoint(resume)
+            
+            # 웹사이트 접속
+            with self._stage("page_load"):
+                self.driver.get(self.url)
+            print(f"웹사이트 접속 완료: {self.url}")
+            
+            # 페이지 로딩 대기
+            with self._stage("wait"):
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.myptab")))
+            
+            # 페이지가 완전히 로드될 때까지 추가 대기
+            self._wait_until(self._document_ready, 3, "페이지 로딩")
+            
+            # 모든 행사 탭 목록 확인
+            tabs_found = self.driver.find_elements(By.CSS_SELECTOR, "ul.myptab li span a")
+            if not tabs_found:
+                print("행사 탭 목록을 찾을 수 없습니다.")
+                return []
+                
+            print(f"총 {len(tabs_found)}개의 행사 탭을 발견했습니다.")
+            
+            # 각 행사 탭별로 크롤링 진행
+            for tab_id, tab_name in self.event_tabs.items():
+                if start_pages.get(tab_id) is None:
+                    print(f"\n===== {tab_name} 이전 실행에서 완료됨 - 건너뜀 =====")
+                    continue
+                print(f"\n===== {tab_name} 크롤링 시작 =====")
+                try:
+                    self._crawl_event_tab(tab_id, tab_name, start_pages[tab_id])
+                    # 탭 간 전환 시 페이지가 안정화될 시간 추가
+                    if not self.smart_wait:
+                        time.sleep(3)
+                except Exception as e:
+                    print(f"{tab_name} 탭 크롤링 중 오류 발생: {str(e)}")
+                    print(f"다음 탭으로 진행합니다.")
+                    continue
+            
+            # 결과 저장 (크롤링 계획기가 있으면 이번에 관측한 페이지별 변경률도 저장)
+            self._save_results()
+            if self.scheduler:
+                self.scheduler.save()
+            self._report_run_stats()
+            self._finish_delta()
+            
+            self._finish_checkpoint()
+            
+            return self.products
+            
+        except Exception as e:
+            print(f"크롤링 중 오류 발생: {str(e)}")
+            return []
+            
+        finally:
+            # 드라이버 종료
+            self._release_driver()
+            self._finish_run()
+    
+    def start_parallel_crawling(self, max_workers=3, shards_per_tab=1, resume=False):
+        """
+        병렬 크롤링 - 행사 탭(또는 탭의 페이지 구간)마다 별도의 헤드리스 Chrome 프로세스에서 크롤링
+        
+        각 작업자의 결과는 event_tabs 순서와 페이지 순서대로 병합되므로
+        start_crawling과 동일한 self.products / CSV 결과와 중복 제거 결과를 얻습니다.
+        스트리밍 저장소(sinks)에는 페이지 단위가 아니라 작업(탭 또는 페이지 구간) 단위로 내보냅니다 -
+        앞선 작업이 모두 끝난 작업부터 순서대로 병합하므로 전체가 끝나기를 기다리지 않으며,
+        shards_per_tab을 늘리면 더 작은 단위로 내보냅니다.
+        체크포인트는 작업자가 페이지마다 구간 저널에 기록하고, 부모 프로세스가 작업 결과를 병합할 때
+        체크포인트로 옮깁니다 (작업자가 중단되면 구간 저널에 남은 페이지를 옮김). 모든 구간을 마친 탭만
+        완료로 기록되고, resume하면 완료된 탭은 복원하고 중간에 멈춘 탭은 1페이지부터 빠짐없이 기록된
+        다음 페이지부터 나누지 않고 크롤링합니다.
+        증분 크롤링 상태(delta_state_path)도 페이지마다 기록하지만, 작업자는 이전 결과를 사용하지 않고
+        끝까지 크롤링합니다.
+        
+        Args:
+            max_workers (int): 동시에 실행할 작업자(Chrome) 수
+            shards_per_tab (int): 각 탭의 페이지 범위를 나눌 구간 수
+            resume (bool): 체크포인트 저널에 기록된 지점부터 이어서 크롤링할지 여부
+        """
+        try:
+            start_pages = self._prepare_checkpoint(resume)
+            
+            # 처음부터 크롤링하는 탭만 나누고, 부모 드라이버로 탭별 총 페이지 수 확인
+            jobs = []
+            resumed_tabs = [tab_id for tab_id, start_page in start_pages.items() if start_page and start_page > 1]
+            fresh_tabs = [tab_id for tab_id, start_page in start_pages.items() if start_page == 1]
+            for tab_id in resumed_tabs:
+                jobs.append((tab_id, start_pages[tab_id], None))
+            # 증분 상태에는 탭의 총 페이지 수도 기록 (다음 실행에서 이전 결과를 사용할 수 있는지 판단)
+            tab_pages = {}
+            if (shards_per_tab > 1 and fresh_tabs) or self.delta:
+                tab_pages = self.probe_total_pages()
+            if shards_per_tab > 1 and fresh_tabs:
+                for tab_id in fresh_tabs:
+                    shards = split_page_shards(tab_pages[tab_id], shard_count=shards_per_tab)
+                    if not shards:
+                        # 총 페이지 수를 알 수 없으면 탭을 빠뜨리지 않도록 나누지 않고 작업자 하나가 크롤링
+                        print(f"{self.event_tabs[tab_id]} 탭의 총 페이지 수를 확인하지 못해 페이지를 나누지 않고 크롤링합니다.")
+                        shards = [(1, None)]
+                    for start_page, end_page in shards:
+                        jobs.append((tab_id, start_page, end_page))
+            else:
+                jobs.extend((tab_id, 1, None) for tab_id in fresh_tabs)
+            jobs.sort(key=lambda job: (list(self.event_tabs).index(job[0]), job[1]))
+            
+            # 부모 프로세스의 드라이버는 더 이상 사용하지 않으므로 먼저 종료
+            self._release_driver()
+            
+            failed_jobs = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_crawl_tab_worker, self.url, tab_id, self._worker_options(),
+                                    start_page, end_page,
+                                    self.checkpoint.shard_path(tab_id, start_page) if self.checkpoint else None)
+                    for tab_id, start_page, end_page in jobs
+                ]
+                # 완료 순서와 관계없이 탭 순서, 페이지 순서대로 기다려 병합 (병합하는 즉시 스트리밍 저장소로 전달)
+                for (tab_id, start_page, _), future in zip(jobs, futures):
+                    incomplete_tabs = {}
+                    try:
+                        _, _, pages, incomplete_tabs, network_stats = future.result()
+                        self.incomplete_tabs.update(incomplete_tabs)
+                        if self.network_filter and network_stats:
+                            self.network_filter.merge(network_stats)
+                        print(f"{self.event_tabs[tab_id]} (페이지 {start_page}~) 작업 완료 - "
+                              f"{sum(len(products) for _, products in pages)}개 상품")
+                    except Exception as e:
+                        print(f"병렬 크롤링 작업 중 오류 발생: {str(e)}")
+                        failed_jobs.append((tab_id, start_page))
+                        # 작업자가 중단되기 전까지 구간 저널에 기록한 페이지는 그대로 사용
+                        pages = self.checkpoint.load_shard(tab_id, start_page) if self.checkpoint else []
+                    
+                    for page, products in pages:
+                        self._add_unique_products(products)
+                        if self.checkpoint:
+                            self.checkpoint.record_page(tab_id, page, products)
+                        if self.delta:
+                            self.delta.observe_page(tab_id, page, products, tab_pages.get(tab_id))
+                    if self.checkpoint:
+                        self.checkpoint.discard_shard(tab_id, start_page)
+                    if self.delta:
+                        for incomplete_tab_id in incomplete_tabs:
+                            self.delta.mark_incomplete(incomplete_tab_id)
+            
+            for tab_id, start_page in failed_jobs:
+                if tab_id not in self.incomplete_tabs:
+                    self._record_incomplete_tab(tab_id, self.event_tabs[tab_id], start_page, None,
+                                                "작업자 프로세스 오류")
+            
+            # 모든 구간을 마친 탭만 체크포인트에 완료로 기록
+            if self.checkpoint:
+                for tab_id in dict.fromkeys(tab_id for tab_id, _, _ in jobs):
+                    if tab_id not in self.incomplete_tabs:
+                        self.checkpoint.record_tab_done(tab_id)
+            
+            # 결과 저장 (작업자별 네트워크 사용량은 합쳐서 출력)
+            self._save_results()
+            self._report_run_stats()
+            self._finish_delta()
+            self._finish_checkpoint()
+            
+            return self.products
+            
+        except Exception as e:
+            print(f"병렬 크롤링 중 오류 발생: {str(e)}")
+            return []
+            
+        finally:
+            self._finish_run()
+    
+    def _release_driver(self):
+        """직접 만든 드라이버만 종료 (빌려온 드라이버는 풀에 그대로 반환)"""
+        if self.owns_driver:
+            if self.network_filter:
+                NetworkFilter.clear(self.driver)
+            self.driver.quit()
+    
+    def _worker_options(self):
+        """작업자 프로세스에서 크롤러를 다시 만들 때 사용할 설정값"""
+        return {
+            "crawl_all_pages": self.crawl_all_pages,
+            "max_pages": self.max_pages,
+            "wait_time": self.wait_time,
+            "smart_wait": self.smart_wait,
+            "js_extraction": self.js_extraction,
+            "network_filter": self.network_filter,
+            "snapshot_dir": self.snapshot_dir
+        }
+    
+    def _wait_until(self, condition, fixed_delay, description="화면 갱신"):
+        """
+        조건이 충족되는 즉시 진행하는 대기 (smart_wait가 꺼져 있으면 기존 고정 대기)
+        
+        Args:
+            condition (callable): driver를 받아 충족 여부를 반환하는 함수
+            fixed_delay (float): 기존에 사용하던 고정 대기 시간(초) - 절약 시간 계산에 사용
+            description (str): 시간 초과 시 출력할 대기 설명
+        """
+        with self._stage("wait"):
+            self._wait_until_unmeasured(condition, fixed_delay, description)
+    
+    def _wait_until_unmeasured(self, condition, fixed_delay, description):
+        if not self.smart_wait:
+            time.sleep(fixed_delay)
+            return
+        
+        start = time.time()
+        try:
+            WebDriverWait(self.driver, self.wait_time, poll_frequency=0.1,
+                          ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+        except TimeoutException:
+            # 시간 초과 시에도 기존 동작처럼 그대로 진행
+            self.wait_stats["timeouts"] += 1
+            print(f"{description} 대기 시간 초과 ({self.wait_time}초) - 계속 진행합니다.")
+        
+        elapsed = time.time() - start
+        self.wait_stats["count"] += 1
+        self.wait_stats["waited"] += elapsed
+        self.wait_stats["saved"] += fixed_delay - elapsed
+    
+    def _document_ready(self, driver):
+        """문서 로딩 완료 여부"""
+        return driver.execute_script("return document.readyState") == "complete"
+    
+    def _list_state(self):
+        """현재 보이는 상품 목록의 상태 조회"""
+        return self.driver.execute_script(LIST_STATE_JS)
+    
+    def _list_ready(self, driver):
+        """보이는 상품 목록이 렌더링되었는지 여부"""
+        return driver.execute_script(LIST_STATE_JS)["count"] > 0
+    
+    def _list_changed(self, old_item, old_state):
+        """
+        페이지 이동 후 상품 목록이 다시 렌더링되었는지 확인하는 조건 생성
+        
+        이전 첫 상품 요소가 stale 상태가 되거나, 첫 상품명/페이지 표시가 바뀌면 갱신된 것으로 판단합니다.
+        """
+        def condition(driver):
+            state = driver.execute_script(LIST_STATE_JS)
+            if state["count"] == 0:
+                return False
+            if old_item is not None:
+                try:
+                    old_item.is_enabled()
+                except StaleElementReferenceException:
+                    return True
+            return state["first"] != old_state["first"] or state["page"] != old_state["page"]
+        return condition
+    
+    def _report_run_stats(self):
+        """대기 및 네트워크 사용량 통계 출력"""
+        if self.network_filter:
+            self.network_filter.report()
+        for tab_info in self.incomplete_tabs.values():
+            print(f"- 미완료 탭: {tab_info['tab_name']} (페이지 {tab_info['last_page']}/{tab_info['total_pages'] or '?'}, "
+                  f"{tab_info['reason']})")
+        if self.circuit_breaker.trips:
+            print(f"- 사이트 응답 실패로 {self.circuit_breaker.trips}회 크롤링을 멈췄습니다.")
+        if not self.smart_wait or not self.wait_stats["count"]:
+            return
+        print(f"- 대기 {self.wait_stats['count']}회, 실제 대기 {self.wait_stats['waited']:.1f}초, "
+              f"고정 대기 대비 {self.wait_stats['saved']:.1f}초 절약 "
+              f"(시간 초과 {self.wait_stats['timeouts']}회)")
+    
+    def _reopen_page(self, tab_id, tab_name, page):
+        """탭을 처음부터 다시 열고 지정한 페이지로 이동한 뒤 상품 목록 컨테이너 반환"""
+        visible_tblwrap = self._open_event_tab(tab_id, tab_name)
+        if not visible_tblwrap:
+            raise RuntimeError(f"{tab_name} 탭의 상품 목록이 표시되지 않았습니다.")
+        if page > 1:
+            self._move_to_page(page, visible_tblwrap)
+        return visible_tblwrap
+    
+    def _crawl_event_tab(self, tab_id, tab_name, start_page=1, end_page=None):
+        """
+        특정 행사 탭의 상품 정보 크롤링
+        
+        탭 열기, 페이지 이동, 상품 추출이 실패하면 RetryPolicy에 따라 백오프 후 탭을 다시 열어
+        실패한 페이지로 돌아가 재시도합니다. 끝내 실패하면 탭을 미완료로 기록합니다.
+        
+        Args:
+            tab_id (str): 행사 탭 ID
+            tab_name (str): 행사 탭 이름
+            start_page (int): 크롤링을 시작할 페이지 (movePage로 바로 이동)
+            end_page (int): 크롤링을 마칠 페이지 (기본값은 탭의 마지막 페이지)
+        """
+        current_page = start_page
+        total_pages = None
+        tab_completed = False
+        failure_reason = "알 수 없는 오류"
+        visible_tblwrap = None
+        
+        def reopen_page(page):
+            nonlocal visible_tblwrap
+            with self._stage("page_load"):
+                visible_tblwrap = self._reopen_page(tab_id, tab_name, page)
+        
+        try:
+            if self.metrics:
+                self.metrics.begin_page(tab_id, start_page)
+            with self._stage("page_load"):
+                visible_tblwrap = self._retry("tab_open", lambda: self._reopen_page(tab_id, tab_name, 1))
+            
+            print(f"{tab_name} 탭의 상품 목록 컨테이너 찾음")
+            
+            # 총 페이지 수 확인 (마지막 페이지 버튼이 있는 경우)
+            site_total_pages = self._get_total_pages(visible_tblwrap, tab_name)
+            total_pages = min(site_total_pages, end_page) if end_page else site_total_pages
+            
+            # 시작 페이지가 1이 아니면 해당 페이지로 바로 이동
+            if current_page > 1:
+                if current_page > total_pages:
+                    print(f"{tab_name}: 시작 페이지({current_page})가 마지막 페이지({total_pages})보다 큽니다.")
+                    tab_completed = True
+                    if self.checkpoint:
+                        self.checkpoint.record_tab_done(tab_id)
+                    return
+                with self._stage("page_load"):
+                    self._retry("page_move", lambda: self._move_to_page(current_page, visible_tblwrap),
+                                recover=lambda: reopen_page(1))
+            
+            # 모든 페이지 순회
+            while current_page <= total_pages:
+                print(f"\n----- {tab_name}: 페이지 {current_page}/{total_pages} 크롤링 시작 -----")
+                
+                # 현재 페이지 크롤링
+                with self._stage("extraction"):
+                    products_on_page = self._retry("extraction",
+                                                   lambda: self._extract_page(tab_name, current_page, total_pages),
+                                                   recover=lambda: reopen_page(current_page))
+                if self.metrics:
+                    self.metrics.record_products(len(products_on_page))
+                if self.snapshot_dir:
+                    self._save_snapshot(tab_id, current_page, products_on_page)
+                
+                # 마지막 페이지까지 결과가 없으면 다음 탭으로 이동 (중간 페이지가 비면 _extract_page에서 재시도)
+                if not products_on_page:
+                    print(f"{tab_name} 탭의 페이지 {current_page}에 상품이 없습니다. 다음 탭으로 이동합니다.")
+                    tab_completed = True
+                    break
+                
+                self._add_unique_products(products_on_page)
+                if self.checkpoint:
+                    self.checkpoint.record_page(tab_id, current_page, products_on_page)
+                if self.page_results is not None:
+                    self.page_results.append((current_page, products_on_page))
+                if self.scheduler:
+                    self.scheduler.record(tab_id, current_page, products_on_page, None if end_page else total_pages)
+                if self.network_filter:
+                    network_stats = self.network_filter.collect(self.driver, tab_id, current_page)
+                    if network_stats and self.metrics:
+                        self.metrics.record_bytes(network_stats["bytes"])
+                print(f"{tab_name}: 페이지 {current_page}/{total_pages} 크롤링 완료 - {len(products_on_page)}개 상품 추출")
+                
+                # 앞쪽 페이지가 이전 실행과 같으면 나머지 페이지는 이전 결과 사용
+                if self.delta and self.delta.observe_page(tab_id, current_page, products_on_page,
+                                                          site_total_pages, total_pages):
+                    carried_pages = self.delta.carry_forward(tab_id, current_page, total_pages)
+                    for carried_page, previous_products in enumerate(carried_pages, start=current_page + 1):
+                        self._add_unique_products(previous_products)
+                        # 이어서 크롤링할 때 이전 결과를 사용한 페이지도 복원되도록 체크포인트에 기록
+                        if self.checkpoint:
+                            self.checkpoint.record_page(tab_id, carried_page, previous_products)
+                        if self.page_results is not None:
+                            self.page_results.append((carried_page, previous_products))
+                    print(f"{tab_name}: 이전 실행과 동일한 페이지가 이어져 나머지 {len(carried_pages)}개 페이지는 이전 결과를 사용합니다.")
+                    tab_completed = True
+                    break
+                
+                # 다음 페이지로 이동
+                if current_page < total_pages:
+                    print(f"다음 페이지로 이동 중...")
+                    if self.metrics:
+                        self.metrics.begin_page(tab_id, current_page + 1)
+                    # 다음 페이지 버튼이 없거나 이동에 실패하면 탭을 다시 열어 현재 페이지로 돌아간 뒤 다시 이동
+                    with self._stage("page_load"):
+                        self._retry("page_move", lambda: self._move_to_next_page(current_page + 1, visible_tblwrap),
+                                    recover=lambda: reopen_page(current_page))
+                    
+                    current_page += 1
+                else:
+                    print(f"마지막 페이지({total_pages})에 도달했습니다.")
+                    tab_completed = True
+                    break
+            
+            if tab_completed and self.checkpoint:
+                self.checkpoint.record_tab_done(tab_id)
+                
+        except Exception as e:
+            failure_reason = str(e)
+            print(f"{tab_name} 탭 크롤링 중 오류 발생: {failure_reason}")
+        
+        finally:
+            # 재시도 후에도 실패한 탭은 완료로 기록하지 않음 (다음 실행에서 이어서 진행)
+            if not tab_completed:
+                self._record_incomplete_tab(tab_id, tab_name, current_page, total_pages, failure_reason)
+    
+    def _open_event_tab(self, tab_id, tab_name):
+        """페이지를 새로고침한 뒤 행사 탭을 열고, 보이는 상품 목록 컨테이너(div.tblwrap)를 반환"""
+        # 페이지 새로고침을 통해 초기 상태로 돌아가기
+        self.driver.refresh()
+        self._wait_until(self._document_ready, 3, "새로고침")
+        
+        # 탭 요소 찾기 및 클릭
+        tab_selector = f"a#" + tab_id
+        tab_element = self.wait.until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, tab_selector))
+        )
+        
+        # JavaScript로 강제 클릭 (더 안정적)
+        self.driver.execute_script("arguments[0].click();", tab_element)
+        print(f"{tab_name} 탭 클릭 완료")
+        
+        # 탭 변경 후 로딩 대기
+        tab_active = lambda driver: (driver.find_elements(By.CSS_SELECTOR, f"span.active a#" + tab_id)
+                                     and self._list_ready(driver))
+        self._wait_until(tab_active, 3, f"{tab_name} 탭 전환")
+        
+        # 현재 활성화된 탭 확인
+        tab_spans = self.driver.find_elements(By.CSS_SELECTOR, f"span.active a#" + tab_id)
+        if not tab_spans:
+            print(f"{tab_name} 탭이 활성화되지 않았습니다. 다시 시도합니다.")
+            if self.metrics:
+                self.metrics.record_retry("tab_click")
+            self.driver.execute_script("arguments[0].click();", tab_element)
+            self._wait_until(tab_active, 3, f"{tab_name} 탭 전환")
+        
+        # 해당 탭의 상품 목록 표시 확인 (여러 개의 div.tblwrap 중 display: block인 것 찾기)
+        tblwraps = self.driver.find_elements(By.CSS_SELECTOR, "div.tblwrap")
+        for tblwrap in tblwraps:
+            if tblwrap.value_of_css_property("display") == "block":
+                return tblwrap
+        
+        return None
+    
+    def _get_total_pages(self, visible_tblwrap, tab_name):
+        """마지막 페이지 버튼(a.next2)의 onclick에서 총 페이지 수 확인"""
+        total_pages = self.max_pages  # 기본값
+        
+        if self.crawl_all_pages:
+            try:
+                last_page_buttons = visible_tblwrap.find_elements(By.CSS_SELECTOR, "a.next2")
+                if last_page_buttons:
+                    last_page_button = last_page_buttons[0]
+                    onclick_attr = last_page_button.get_attribute("onclick")
+                    if onclick_attr and "movePage" in onclick_attr:
+                        # "goodsPageController.movePage(80)" 같은 형식에서 숫자만 추출
+                        match = re.search(r'movePage\((\d+)\)', onclick_attr)
+                        if match:
+                            total_pages = int(match.group(1))
+                            print(f"{tab_name} 탭의 총 페이지 수: {total_pages}페이지")
+            except Exception as e:
+                print(f"총 페이지 수 확인 중 오류: {str(e)}")
+                print(f"설정된 기본값 {self.max_pages}페이지로 진행합니다.")
+        
+        return total_pages
+    
+    def _move_to_page(self, page_num, visible_tblwrap):
+        """goodsPageController.movePage(n)으로 지정한 페이지로 바로 이동"""
+        # 이동 전 목록 상태 기록 (갱신 감지용)
+        old_items = visible_tblwrap.find_elements(By.CSS_SELECTOR, "ul.prod_list li")
+        old_state = self._list_state()
+        
+        self.driver.execute_script(f"goodsPageController.movePage({int(page_num)})")
+        
+        # 페이지 로딩 대기
+        self._wait_until(self._list_changed(old_items[0] if old_items else None, old_state),
+                         3, f"페이지 {page_num}")
+        
+        # 페이지 로드 확인
+        self.wait.until(
+            lambda driver: len(visible_tblwrap.find_elements(By.CSS_SELECTOR, "ul.prod_list li")) > 0
+        )
+    
+    def probe_total_pages(self):
+        """각 행사 탭의 총 페이지 수 확인 (병렬 크롤링의 페이지 분할용)"""
+        self.driver.get(self.url)
+        self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.myptab")))
+        
+        tab_pages = {}
+        for tab_id, tab_name in self.event_tabs.items():
+            try:
+                visible_tblwrap = self._open_event_tab(tab_id, tab_name)
+                tab_pages[tab_id] = self._get_total_pages(visible_tblwrap, tab_name) if visible_tblwrap else 0
+            except Exception as e:
+                print(f"{tab_name} 탭의 총 페이지 수 확인 중 오류: {str(e)}")
+                tab_pages[tab_id] = self.max_pages
+        return tab_pages
+    
+    def _save_snapshot(self, tab_id, page, products):
+        """
+        현재 페이지의 DOM을 스냅샷 파일로 저장 ({snapshot_dir}/{tab_id}/page_001.html)
+        
+        실제 크롤링에서 추출한 상품 목록도 같은 이름의 .json 파일로 남겨
+        SnapshotReplayer.check_parity()로 재생 결과와 비교할 수 있게 합니다.
+        
+        Args:
+            tab_id (str): 행사 탭 ID
+            page (int): 페이지 번호
+            products (list): 이 페이지에서 추출한 상품 목록
+        """
+        try:
+            tab_dir = os.path.join(self.snapshot_dir, tab_id)
+            if not os.path.exists(tab_dir):
+                os.makedirs(tab_dir)
+            page_html = self.driver.execute_script(SNAPSHOT_JS)
+            with open(os.path.join(tab_dir, f"page_{page:03d}.html"), 'w', encoding='utf-8') as f:
+                f.write(page_html)
+            with open(os.path.join(tab_dir, f"page_{page:03d}.json"), 'w', encoding='utf-8') as f:
+                json.dump([product.to_row() for product in products], f, ensure_ascii=False)
+        except Exception as e:
+            print(f"페이지 스냅샷 저장 중 오류: {str(e)}")
+    
+    def _crawl_current_page(self, event_type):
+        """현재 페이지의 상품 정보 추출"""
+        # 페이지가 완전히 로드될 때까지 기다립니다
+        self._wait_until(self._list_ready, 2, "상품 목록")
+        
+        if self.js_extraction:
+            products_on_page = self._crawl_current_page_js(event_type)
+            if products_on_page is not None:
+                return products_on_page
+            print("JavaScript 추출에 실패하여 요소별 추출 방식으로 진행합니다.")
+        
+        return self._crawl_current_page_elements(event_type)
+    
+    def _extract_page(self, tab_name, page, total_pages):
+        """
+        현재 페이지 상품 추출 - 마지막 페이지 전에 상품이 비어 있으면 로딩 실패로 보고 예외 발생
+        
+        Args:
+            tab_name (str): 탭 이름 (행사 유형)
+            page (int): 현재 페이지 번호
+            total_pages (int): 탭의 총 페이지 수
         """
-        self.url = url
-        self.crawl_all_pages = crawl_all_pages
-        self.max_pages = max_pages  # crawl_all_pages가 False일 때만 사용
-        self.wait_time = wait_time
-        self.products = []
-        self.product_names = set()  # 상품명 중복 체크를 위한 집합
+        products_on_page = self._crawl_current_page(tab_name)
+        if not products_on_page and page < total_pages:
+            raise PageExtractionError(f"{tab_name} 탭의 페이지 {page}/{total_pages}에 상품이 없습니다.")
+        return products_on_page
+    
+    def _move_to_next_page(self, page, visible_tblwrap):
+        """다음 페이지 버튼을 확인한 뒤 page로 이동 (버튼이 없으면 페이지 로딩 실패로 보고 예외 발생)"""
+        if not visible_tblwrap.find_elements(By.CSS_SELECTOR, "a.next"):
+            raise PageExtractionError(f"페이지 {page - 1}에서 다음 페이지 버튼을 찾을 수 없습니다.")
+        self._move_to_page(page, visible_tblwrap)
+    
+    def _crawl_current_page_js(self, event_type):
+        """현재 페이지의 상품 정보를 한 번의 JavaScript 호출로 추출 (실패 시 None 반환)"""
+        try:
+            raw_products = self.driver.execute_script(EXTRACT_PAGE_JS)
+        except Exception as e:
+            print(f"JavaScript 상품 추출 중 오류: {str(e)}")
+            return None
         
-        # 행사 탭 ID 목록 (전체 탭 제외)
-        self.event_tabs = {
-            "ONE_TO_ONE": "1+1 행사",
-            "TWO_TO_ONE": "2+1 행사",
-            "GIFT": "덤증정 행사"
-        }
+        if raw_products is None:
+            raise PageExtractionError("현재 페이지에서 보이는 상품 목록 컨테이너를 찾을 수 없습니다.")
+        
+        if not raw_products:
+            print("현재 페이지에서 상품을 찾을 수 없습니다.")
+            return []
         
-        # Chrome 옵션 설정
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # 헤드리스 모드 (필요시 주석처리)
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
+        print(f"현재 페이지에서 {len(raw_products)}개의 상품을 발견했습니다.")
         
-        # WebDriver 초기화
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.wait = WebDriverWait(self.driver, wait_time)
+        products_on_page = []
+        for raw in raw_products:
+            name, price = _collapse_whitespace(raw["name"]), _collapse_whitespace(raw["price"])
+            promotion = _collapse_whitespace(raw["promotion"])
+            products_on_page.append(Product.create(raw["img"], name, price, promotion, event_type,
+                                                   _collapse_whitespace(raw["gift"])))
+            print(f"상품 정보 추출: {name} - {price}원 ({promotion})")
+        
+        return products_on_page
+    
+    def _crawl_current_page_elements(self, event_type):
+        """현재 페이지의 상품 정보를 요소별 WebDriver 호출로 추출 (JavaScript 추출의 대체 경로)"""
+        products_on_page = []
+        
+        try:
+            # 현재 보이는 div.tblwrap 찾기
+            tblwraps = self.driver.find_elements(By.CSS_SELECTOR, "div.tblwrap")
+            visible_tblwrap = None
+            
+            for tblwrap in tblwraps:
+                if tblwrap.value_of_css_property("display") == "block":
+                    visible_tblwrap = tblwrap
+                    break
+                    
+            if not visible_tblwrap:
+                raise PageExtractionError("현재 페이지에서 보이는 상품 목록 컨테이너를 찾을 수 없습니다.")
+                
+            # 보이는 컨테이너 내의 상품 목록 요소 찾기
+            product_items = visible_tblwrap.find_elements(By.CSS_SELECTOR, "ul.prod_list li div.prod_box")
+            
+            if not product_items:
+                print("현재 페이지에서 상품을 찾을 수 없습니다.")
+                return []
+                
+            print(f"현재 페이지에서 {len(product_items)}개의 상품을 발견했습니다.")
+            
+            # 각 상품 정보 추출
+            for item in product_items:
+                try:
+                    # 이미지 URL 추출
+                    img_elements = item.find_elements(By.CSS_SELECTOR, "p.img img")
+                    if not img_elements:
+                        print("상품 이미지를 찾을 수 없습니다.")
+                        continue
+                        
+                    img_url = img_elements[0].get_attribute("src")
+                    
+                    # 상품명 추출
+                    name_elements = item.find_elements(By.CSS_SELECTOR, "p.tit")
+                    if not name_elements:
+                        print("상품명을 찾을 수 없습니다.")
+                        continue
+                        
+                    name = _collapse_whitespace(name_elements[0].text)
+                    
+                    # 가격 추출
+                    price_elements = item.find_elements(By.CSS_SELECTOR, "p.price span.cost")
+                    if not price_elements:
+                        print(f"상품 '{name}'의 가격을 찾을 수 없습니다.")
+                        continue
+                        
+                    price = _collapse_whitespace(price_elements[0].text.replace('원', ''))
+                    
+                    # 행사 유형 추출 (여러 종류의 행사 태그 확인)
+                    promotion = ""
+                    
+                    # 1+1 행사 확인
+                    one_to_one_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box.ONE_TO_ONE p.flg01 span")
+                    if one_to_one_elements and len(one_to_one_elements) > 0:
+                        promotion = _collapse_whitespace(one_to_one_elements[0].text)
+                    
+                    # 2+1 행사 확인
+                    if not promotion:
+                        two_to_one_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box.TWO_TO_ONE p.flg01 span")
+                        if two_to_one_elements and len(two_to_one_elements) > 0:
+                            promotion = _collapse_whitespace(two_to_one_elements[0].text)
+                    
+                    # 덤증정 행사 확인
+                    if not promotion:
+                        gift_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box.GIFT p.flg01 span")
+                        if gift_elements and len(gift_elements) > 0:
+                            promotion = "덤증정"
+                    
+                    # 행사 유형이 파악되지 않은 경우 기본 방식으로 한 번 더 시도
+                    if not promotion:
+                        all_span_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box p.flg01 span")
+                        if all_span_elements and len(all_span_elements) > 0:
+                            promotion = _collapse_whitespace(all_span_elements[0].text)
+                    
+                    # 덤증정 상품 정보 추출 (있는 경우)
+                    gift_info = ""
+                    if "덤증정" in promotion or "덤" in promotion:
+                        try:
+                            dum_box = item.find_element(By.CSS_SELECTOR, "div.dum_box")
+                            gift_name_element = dum_box.find_element(By.CSS_SELECTOR, "div.dum_txt p.name")
+                            if gift_name_element:
+                                gift_info = _collapse_whitespace(gift_name_element.text)
+                        except:
+                            pass
+                    
+                    # 상품 정보 저장
+                    products_on_page.append(Product.create(img_url, name, price, promotion, event_type, gift_info))
+                    print(f"상품 정보 추출: {name} - {price}원 ({promotion})")
+                    
+                except Exception as e:
+                    print(f"상품 정보 추출 중 오류: {str(e)}")
+            
+            return products_on_page
+            
+        except PageExtractionError:
+            raise
+        except Exception as e:
+            # 페이지 단위 오류는 호출한 쪽에서 재시도할 수 있도록 전달
+            raise PageExtractionError(f"현재 페이지 크롤링 중 오류: {str(e)}") from e
     
-    def start_crawling(self):
-        """크롤링 시작 - 모든 행사 유형 크롤링"""
+    def crawl_single_event(self, event_type, save_results=True, start_page=1, end_page=None, resume=False):
+        """
+        특정 행사 유형만 크롤링
+        
+        Args:
+            event_type (str): 크롤링할 행사 탭 ID (ONE_TO_ONE, TWO_TO_ONE, GIFT)
+            save_results (bool): 크롤링 결과를 CSV 파일로 저장할지 여부
+            start_page (int): 크롤링을 시작할 페이지
+            end_page (int): 크롤링을 마칠 페이지 (기본값은 탭의 마지막 페이지)
+            resume (bool): 체크포인트 저널에 기록된 지점부터 이어서 크롤링할지 여부
+        """
         try:
+            if event_type in self.event_tabs:
+                # 이어서 크롤링할 위치 확인 (완료된 페이지의 상품은 그대로 복원)
+                resume_page = self._prepare_checkpoint(resume, [event_type])[event_type]
+                if resume_page is None:
+                    print(f"{self.event_tabs[event_type]}: 이전 실행에서 완료됨 - 체크포인트 결과를 사용합니다.")
+                    if save_results:
+                        self._save_results()
+                    self._finish_checkpoint([event_type])
+                    return self.products
+                start_page = max(start_page, resume_page)
+            
             # 웹사이트 접속
             self.driver.get(self.url)
             print(f"웹사이트 접속 완료: {self.url}")
             
             # 페이지 로딩 대기
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.myptab")))
+            with self._stage("wait"):
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.myptab")))
             
-            # 페이지가 완전히 로드될 때까지 추가 대기
-            time.sleep(3)
+            # 지정된 행사 탭만 크롤링
+            if event_type in self.event_tabs:
+                tab_id = event_type
+                tab_name = self.event_tabs[event_type]
+                print(f"\n===== {tab_name} 크롤링 시작 =====")
+                self._crawl_event_tab(tab_id, tab_name, start_page, end_page)
+                
+                # 결과 저장
+                if save_results:
+                    self._save_results()
+                if self.scheduler:
+                    self.scheduler.save()
+                self._report_run_stats()
+                self._finish_delta([tab_id])
+                self._finish_checkpoint([tab_id])
+                
+                return self.products
+            else:
+                print(f"유효하지 않은 행사 유형: {event_type}")
+                print(f"유효한 행사 유형: {list(self.event_tabs.keys())}")
+                return []
+                
+        except Exception as e:
+            print(f"크롤링 중 오류 발생: {str(e)}")
+            return []
             
-            # 모든 행사 탭 목록 확인
-            tabs_found = self.driver.find_elements(By.CSS_SELECTOR, "ul.myptab li span a")
-            if not tabs_found:
-                print("행사 탭 목록을 찾을 수 없습니다.")
+        finally:
+            # 드라이버 종료
+            self._release_driver()
+            self._finish_run()
+    
+    def crawl_scheduled(self):
+        """
+        AdaptiveCrawlScheduler의 계획대로 크롤링 - 변경이 잦은 탭/페이지만 바로 방문
+        
+        Returns:
+            list: 크롤링된 상품 정보 목록
+        """
+        if not self.scheduler:
+            print("크롤링 계획기(scheduler)가 설정되지 않았습니다.")
+            return []
+        
+        try:
+            plan = self.scheduler.plan(list(self.event_tabs))
+            # 계획이 실행마다 달라 이어서 크롤링하지 않음 (전체를 크롤링하는 탭만 체크포인트에 기록)
+            self._prepare_checkpoint(resume=False)
+            if not plan:
+                next_due = min(self.scheduler.seconds_until_due(tab_id) for tab_id in self.event_tabs)
+                print(f"크롤링 주기가 된 탭이 없습니다. (다음 크롤링까지 {next_due / 60:.0f}분)")
                 return []
+            print("크롤링 계획: " + ", ".join(
+                f"{self.event_tabs[tab_id]} {'전체' if pages is None else f'{len(pages)}개 페이지'}"
+                for tab_id, pages in plan))
+            
+            # 웹사이트 접속
+            with self._stage("page_load"):
+                self.driver.get(self.url)
+            print(f"웹사이트 접속 완료: {self.url}")
+            with self._stage("wait"):
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.myptab")))
+            
+            for tab_id, pages in plan:
+                tab_name = self.event_tabs[tab_id]
+                print(f"\n===== {tab_name} 크롤링 시작 =====")
+                try:
+                    if pages is None:
+                        self._crawl_event_tab(tab_id, tab_name)
+                    else:
+                        self._crawl_selected_pages(tab_id, tab_name, pages)
+                except Exception as e:
+                    print(f"{tab_name} 탭 크롤링 중 오류 발생: {str(e)}")
+                    continue
+            
+            # 결과 저장 - 일부 페이지만 크롤링한 결과는 전체 결과 파일(GS25_행사상품_*.csv)과 구분
+            partial = any(pages is not None for _, pages in plan)
+            self._save_results("GS25_부분크롤링" if partial else "GS25_행사상품")
+            self.scheduler.save()
+            self.scheduler.report()
+            self._report_run_stats()
+            self._finish_checkpoint()
+            
+            return self.products
+            
+        except Exception as e:
+            print(f"크롤링 중 오류 발생: {str(e)}")
+            return []
+            
+        finally:
+            # 드라이버 종료
+            self._release_driver()
+            self._finish_run()
+    
+    def _crawl_selected_pages(self, tab_id, tab_name, pages):
+        """
+        행사 탭에서 지정한 페이지만 movePage로 이동하며 크롤링
+        
+        탭 열기, 페이지 이동, 상품 추출은 _crawl_event_tab과 같이 재시도하고,
+        끝내 실패하면 탭을 미완료로 기록합니다.
+        """
+        current_page = 1
+        target_page = pages[0]
+        total_pages = None
+        visible_tblwrap = None
+        
+        def reopen_page(page):
+            nonlocal visible_tblwrap
+            with self._stage("page_load"):
+                visible_tblwrap = self._reopen_page(tab_id, tab_name, page)
+        
+        try:
+            if self.metrics:
+                self.metrics.begin_page(tab_id, pages[0])
+            with self._stage("page_load"):
+                visible_tblwrap = self._retry("tab_open", lambda: self._reopen_page(tab_id, tab_name, 1))
+            total_pages = self._get_total_pages(visible_tblwrap, tab_name)
+            
+            for page in pages:
+                if page > total_pages:
+                    break
+                target_page = page
+                if page != current_page:
+                    if self.metrics:
+                        self.metrics.begin_page(tab_id, page)
+                    # 이동에 실패하면 탭을 다시 열어 현재 페이지로 돌아간 뒤 다시 이동
+                    with self._stage("page_load"):
+                        self._retry("page_move", lambda: self._move_to_page(page, visible_tblwrap),
+                                    recover=lambda: reopen_page(current_page))
+                    current_page = page
                 
-            print(f"총 {len(tabs_found)}개의 행사 탭을 발견했습니다.")
+                with self._stage("extraction"):
+                    products_on_page = self._retry("extraction",
+                                                   lambda: self._extract_page(tab_name, page, total_pages),
+                                                   recover=lambda: reopen_page(page))
+                if self.metrics:
+                    self.metrics.record_products(len(products_on_page))
+                
+                self._add_unique_products(products_on_page)
+                self.scheduler.record(tab_id, page, products_on_page, total_pages)
+                print(f"{tab_name}: 페이지 {page}/{total_pages} 크롤링 완료 - {len(products_on_page)}개 상품 추출")
+        
+        except Exception as e:
+            print(f"{tab_name} 탭 크롤링 중 오류 발생: {str(e)}")
+            self._record_incomplete_tab(tab_id, tab_name, target_page, total_pages, str(e))
+
+
+class GS25HttpCrawler(GS25CrawlerBase):
+    """
+    브라우저 없이 행사상품 목록 API를 직접 호출하는 크롤러
+    
+    goodsPageController.movePage()가 내부적으로 호출하는 event-goods-search 엔드포인트를
+    keep-alive 세션으로 병렬 호출하고, GS25EventCrawler와 같은 형식의 상품 정보를 만듭니다.
+    """
+    
+    # 행사 구분 코드 -> 화면에 표시되는 행사유형
+    PROMOTION_NAMES = {
+        "ONE_TO_ONE": "1+1",
+        "TWO_TO_ONE": "2+1",
+        "GIFT": "덤증정"
+    }
+    
+    def __init__(self, url, crawl_all_pages=True, max_pages=20, timeout=10, max_workers=8,
+                 page_size=8, search_url=None, sinks=None, keep_in_memory=True, dedup_index=None,
+                 metrics=None, checkpoint_path=None, delta_state_path=None, retry_policy=None,
+                 circuit_breaker=None):
+        """
+        GS25 행사상품 HTTP 크롤러 초기화
+        
+        Args:
+            url (str): 행사상품 페이지 URL (세션 쿠키와 CSRF 토큰을 얻는 데 사용)
+            crawl_all_pages (bool): 모든 페이지를 크롤링할지 여부
+            max_pages (int): crawl_all_pages가 False일 때 각 탭별 크롤링할 최대 페이지 수
+            timeout (int): HTTP 요청 시간 제한(초)
+            max_workers (int): 동시에 요청할 페이지 수 (연결 풀 크기)
+            page_size (int): 한 페이지에 요청할 상품 수
+            search_url (str): 상품 목록 엔드포인트 URL (기본값은 url 기준 event-goods-search)
+            sinks (list): 페이지마다 새 상품을 바로 내보낼 ProductSink 목록
+            keep_in_memory (bool): 수집한 상품을 self.products에 모아 마지막에 CSV로 저장할지 여부
+            dedup_index (ProductDedupIndex): 이전 실행에서 저장소로 보낸 상품을 다시 보내지 않기 위한 중복 인덱스
+            metrics (CrawlMetrics): 단계별 시간 등을 기록할 계측기
+            checkpoint_path (str): 체크포인트 저널 경로 (지정하면 페이지마다 진행 상황을 기록)
+            delta_state_path (str): 증분 크롤링 상태 파일 경로 (지정하면 이전 실행 대비 변경 상품 파일 저장)
+            retry_policy (RetryPolicy): 페이지 요청 실패 시 재시도 정책
+            circuit_breaker (CircuitBreaker): 연속 실패 시 크롤링을 멈출 회로 차단기
+        """
+        super().__init__(url, crawl_all_pages, max_pages, sinks, keep_in_memory, dedup_index, metrics,
+                         checkpoint_path, delta_state_path, retry_policy, circuit_breaker)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.search_url = search_url or urljoin(url, "event-goods-search")
+        self.csrf_token = None
+        
+        # keep-alive 연결을 재사용하는 세션 (작업자 수만큼 연결 유지)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0",
+            "X-Requested-With": "XMLHttpRequest",
+            "Referer": url
+        })
+    
+    def start_crawling(self, resume=False):
+        """
+        크롤링 시작 - 모든 행사 유형 크롤링
+        
+        Args:
+            resume (bool): 체크포인트 저널에 기록된 지점부터 이어서 크롤링할지 여부
+        """
+        try:
+            start_pages = self._prepare_checkpoint(resume)
+            self._prepare_session()
             
-            # 각 행사 탭별로 크롤링 진행
             for tab_id, tab_name in self.event_tabs.items():
-                print(f"\n===== {tab_name} 크롤링 시작 =====")
+                if start_pages.get(tab_id) is None:
+                    print(f"\n===== {tab_name} 이전 실행에서 완료됨 - 건너뜀 =====")
+                    continue
+                print(f"\n===== {tab_name} 크롤링 시작 (HTTP) =====")
                 try:
-                    self._crawl_event_tab(tab_id, tab_name)
-                    # 탭 간 전환 시 페이지가 안정화될 시간 추가
-                    time.sleep(3)
+                    self._crawl_event_tab(tab_id, tab_name, start_pages[tab_id])
                 except Exception as e:
                     print(f"{tab_name} 탭 크롤링 중 오류 발생: {str(e)}")
                     print(f"다음 탭으로 진행합니다.")
@@ -80,6 +2650,8 @@ class GS25EventCrawler:
             
             # 결과 저장
             self._save_results()
+            self._finish_delta()
+            self._finish_checkpoint()
             
             return self.products
             
@@ -88,318 +2660,881 @@ class GS25EventCrawler:
             return []
             
         finally:
-            # 드라이버 종료
-            self.driver.quit()
+            self.session.close()
+            self._finish_run()
     
-    def _crawl_event_tab(self, tab_id, tab_name):
-        """특정 행사 탭의 상품 정보 크롤링"""
+    def crawl_single_event(self, event_type, save_results=True, resume=False):
+        """
+        특정 행사 유형만 크롤링
+        
+        Args:
+            event_type (str): 크롤링할 행사 탭 ID (ONE_TO_ONE, TWO_TO_ONE, GIFT)
+            save_results (bool): 크롤링 결과를 CSV 파일로 저장할지 여부
+            resume (bool): 체크포인트 저널에 기록된 지점부터 이어서 크롤링할지 여부
+        """
         try:
-            # 페이지 새로고침을 통해 초기 상태로 돌아가기
-            self.driver.refresh()
-            time.sleep(3)
-            
-            # 탭 요소 찾기 및 클릭
-            tab_selector = f"a#" + tab_id
-            tab_element = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, tab_selector))
-            )
+            if event_type not in self.event_tabs:
+                print(f"유효하지 않은 행사 유형: {event_type}")
+                print(f"유효한 행사 유형: {list(self.event_tabs.keys())}")
+                return []
             
-            # JavaScript로 강제 클릭 (더 안정적)
-            self.driver.execute_script("arguments[0].click();", tab_element)
-            print(f"{tab_name} 탭 클릭 완료")
+            tab_name = self.event_tabs[event_type]
+            start_page = self._prepare_checkpoint(resume, [event_type])[event_type]
+            if start_page is None:
+                print(f"{tab_name}: 이전 실행에서 완료됨 - 체크포인트 결과를 사용합니다.")
+            else:
+                self._prepare_session()
+                print(f"\n===== {tab_name} 크롤링 시작 (HTTP) =====")
+                self._crawl_event_tab(event_type, tab_name, start_page)
             
-            # 탭 변경 후 로딩 대기
-            time.sleep(3)
+            if save_results:
+                self._save_results()
+            self._finish_delta([event_type])
+            self._finish_checkpoint([event_type])
             
-            # 현재 활성화된 탭 확인
-            tab_spans = self.driver.find_elements(By.CSS_SELECTOR, f"span.active a#" + tab_id)
-            if not tab_spans:
-                print(f"{tab_name} 탭이 활성화되지 않았습니다. 다시 시도합니다.")
-                self.driver.execute_script("arguments[0].click();", tab_element)
-                time.sleep(3)
+            return self.products
             
-            # 해당 탭의 상품 목록 표시 확인 (여러 개의 div.tblwrap 중 display: block인 것 찾기)
-            tblwraps = self.driver.find_elements(By.CSS_SELECTOR, "div.tblwrap")
-            visible_tblwrap = None
+        except Exception as e:
+            print(f"크롤링 중 오류 발생: {str(e)}")
+            return []
             
-            for tblwrap in tblwraps:
-                if tblwrap.value_of_css_property("display") == "block":
-                    visible_tblwrap = tblwrap
-                    break
+        finally:
+            self.session.close()
+            self._finish_run()
+    
+    def _prepare_session(self):
+        """행사상품 페이지에 접속해 세션 쿠키와 CSRF 토큰 확보"""
+        response = self.session.get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        print(f"웹사이트 접속 완료: {self.url}")
+        
+        match = re.search(r'CSRFToken["\']?\s*(?:=|:|value=)\s*["\']([^"\']+)["\']', response.text)
+        if match:
+            self.csrf_token = match.group(1)
+        else:
+            print("CSRF 토큰을 찾을 수 없습니다. 토큰 없이 진행합니다.")
+    
+    def _crawl_event_tab(self, tab_id, tab_name, start_page=1):
+        """
+        특정 행사 탭의 페이지를 병렬로 요청
+        
+        실패한 요청은 RetryPolicy에 따라 백오프 후 다시 요청합니다. 끝내 실패한 페이지가 있으면
+        나머지 페이지는 그대로 병합하되 탭을 미완료로 기록하고, 체크포인트에는 실패한 페이지 앞까지만
+        기록해 다음 실행에서 그 페이지부터 이어서 크롤링합니다.
+        
+        Args:
+            tab_id (str): 행사 탭 ID
+            tab_name (str): 행사 탭 이름
+            start_page (int): 요청을 시작할 페이지 (체크포인트에서 이어서 크롤링하는 경우)
+        """
+        # 첫 페이지로 총 페이지 수 확인
+        try:
+            with self._stage("page_load"):
+                first_page, site_total_pages = self._retry("page_load", lambda: self._fetch_page(tab_id, 1))
+        except Exception as e:
+            self._record_incomplete_tab(tab_id, tab_name, start_page, None, str(e))
+            return
+        total_pages = site_total_pages if self.crawl_all_pages else min(site_total_pages, self.max_pages)
+        print(f"{tab_name} 탭의 총 페이지 수: {total_pages}페이지")
+        
+        pages = {1: first_page} if start_page == 1 else {}
+        failed_pages = {}
+        first_page_to_fetch = max(start_page, 2)
+        if total_pages >= first_page_to_fetch:
+            with self._stage("page_load"), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    page: executor.submit(self._retry, "page_load", lambda page=page: self._fetch_page(tab_id, page))
+                    for page in range(first_page_to_fetch, total_pages + 1)
+                }
+                for page, future in futures.items():
+                    try:
+                        pages[page] = future.result()[0]
+                    except Exception as e:
+                        print(f"{tab_name}: 페이지 {page} 요청 중 오류 발생: {str(e)}")
+                        failed_pages[page] = str(e)
+        
+        # 페이지 순서대로 병합 (브라우저 크롤러와 동일한 중복 제거 결과)
+        for page in sorted(pages):
+            results = pages[page]
+            if not results:
+                print(f"{tab_name} 탭의 페이지 {page}에 상품이 없습니다.")
+                continue
             
-            if not visible_tblwrap:
-                print(f"{tab_name} 탭의 상품 목록이 표시되지 않았습니다. 다음 탭으로 이동합니다.")
+            if self.metrics:
+                self.metrics.begin_page(tab_id, page)
+            with self._stage("extraction"):
+                products_on_page = [self._to_product(item, tab_name) for item in results]
+            if self.metrics:
+                self.metrics.record_products(len(products_on_page))
+            self._add_unique_products(products_on_page)
+            # 체크포인트는 이어서 크롤링할 위치가 어긋나지 않도록 실패한 페이지 앞까지만 기록
+            if self.checkpoint and not any(failed < page for failed in failed_pages):
+                self.checkpoint.record_page(tab_id, page, products_on_page)
+            if self.delta:
+                self.delta.observe_page(tab_id, page, products_on_page, site_total_pages, total_pages)
+            print(f"{tab_name}: 페이지 {page}/{total_pages} 크롤링 완료 - {len(products_on_page)}개 상품 추출")
+        
+        if failed_pages:
+            first_failed = min(failed_pages)
+            self._record_incomplete_tab(tab_id, tab_name, first_failed, total_pages,
+                                        f"페이지 {sorted(failed_pages)} 요청 실패: {failed_pages[first_failed]}")
+        elif self.checkpoint:
+            self.checkpoint.record_tab_done(tab_id)
+    
+    def _fetch_page(self, tab_id, page_num):
+        """상품 목록 한 페이지 요청 - (상품 목록, 총 페이지 수) 반환"""
+        params = {"CSRFToken": self.csrf_token} if self.csrf_token else None
+        data = {
+            "pageNum": page_num,
+            "pageSize": self.page_size,
+            "searchType": "",
+            "searchWord": "",
+            "parameterList": tab_id
+        }
+        response = self.session.post(self.search_url, params=params, data=data, timeout=self.timeout)
+        response.raise_for_status()
+        
+        # 응답이 JSON 문자열로 한 번 더 감싸져 오는 경우 처리
+        payload = response.json()
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        
+        results = payload.get("results") or []
+        total_pages = int((payload.get("pagination") or {}).get("numberOfPages") or 1)
+        return results, total_pages
+    
+    def _to_product(self, item, event_type):
+        """API 응답 항목을 GS25EventCrawler와 같은 상품 정보로 변환"""
+        event_code = (item.get("eventTypeSp") or {}).get("code", "")
+        promotion = self.PROMOTION_NAMES.get(event_code) or item.get("eventTypeNm") or ""
+        price = item.get("price")
+        
+        price = float(price) if price not in (None, "") else 0
+        gift_info = (item.get("giftGoodsNm") or "").strip()
+        
+        return Product.create(item.get("attFileNm"), item.get("goodsNm"), price,
+                              promotion, event_type, gift_info)
+
+
+class FetchInterceptor:
+    """
+    드라이버 하나의 요청을 CDP Fetch 도메인으로 가로채 차단/통과시키는 백그라운드 스레드
+    
+    selenium의 bidi_connection(trio)으로 DevTools 세션을 열고 Fetch.enable에 넘긴 패턴에 맞는 요청이
+    멈출 때마다(Fetch.requestPaused) NetworkFilter.should_block으로 판단해
+    Fetch.failRequest 또는 Fetch.continueRequest를 보냅니다.
+    """
+    
+    def __init__(self, driver, network_filter, start_timeout=10):
+        """
+        Args:
+            driver: 요청을 가로챌 WebDriver
+            network_filter (NetworkFilter): 차단 여부를 판단할 필터
+            start_timeout (float): Fetch.enable까지 기다릴 최대 시간(초)
+        """
+        self.driver = driver
+        self.network_filter = network_filter
+        self.start_timeout = start_timeout
+        self.blocked = 0
+        self.ready = threading.Event()
+        self.error = None
+        self.stopping = False
+        self.trio_token = None
+        self.cancel_scope = None
+        self.thread = threading.Thread(target=self._run, name="gs25-fetch-interceptor", daemon=True)
+    
+    def start(self):
+        """가로채기 시작 - Fetch.enable이 끝날 때까지 기다리고, 실패하면 예외 발생"""
+        self.thread.start()
+        if not self.ready.wait(self.start_timeout):
+            self.stop()
+            raise TimeoutError("Fetch.enable 응답이 없습니다.")
+        if self.error:
+            raise self.error
+    
+    def stop(self, timeout=5):
+        """가로채기 중지 - DevTools 세션이 닫히면 Chrome이 Fetch 가로채기를 해제함"""
+        import trio
+        self.stopping = True
+        if self.trio_token is not None and self.cancel_scope is not None:
+            try:
+                trio.from_thread.run_sync(self.cancel_scope.cancel, trio_token=self.trio_token)
+            except trio.RunFinishedError:
+                pass
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            raise RuntimeError("요청 가로채기 스레드가 종료되지 않았습니다.")
+    
+    def _run(self):
+        import trio
+        try:
+            trio.run(self._intercept)
+        except Exception as e:
+            self.error = e
+            if not self.stopping and self.ready.is_set():
+                print(f"요청 가로채기 중 오류 발생 - 이후 요청은 차단하지 않습니다: {str(e)}")
+        finally:
+            self.ready.set()
+    
+    async def _intercept(self):
+        import trio
+        self.trio_token = trio.lowlevel.current_trio_token()
+        with trio.CancelScope() as cancel_scope:
+            self.cancel_scope = cancel_scope
+            if self.stopping:
                 return
-            
-            print(f"{tab_name} 탭의 상품 목록 컨테이너 찾음")
-            
-            # 총 페이지 수 확인 (마지막 페이지 버튼이 있는 경우)
-            total_pages = self.max_pages  # 기본값
-            
-            if self.crawl_all_pages:
-                try:
-                    last_page_buttons = visible_tblwrap.find_elements(By.CSS_SELECTOR, "a.next2")
-                    if last_page_buttons:
-                        last_page_button = last_page_buttons[0]
-                        onclick_attr = last_page_button.get_attribute("onclick")
-                        if onclick_attr and "movePage" in onclick_attr:
-                            # "goodsPageController.movePage(80)" 같은 형식에서 숫자만 추출
-                            import re
-                            match = re.search(r'movePage\((\d+)\)', onclick_attr)
-                            if match:
-                                total_pages = int(match.group(1))
-                                print(f"{tab_name} 탭의 총 페이지 수: {total_pages}페이지")
-                except Exception as e:
-                    print(f"총 페이지 수 확인 중 오류: {str(e)}")
-                    print(f"설정된 기본값 {self.max_pages}페이지로 진행합니다.")
-            
-            # 현재 페이지 번호
-            current_page = 1
-            
-            # 모든 페이지 순회
-            while current_page <= total_pages:
-                print(f"\n----- {tab_name}: 페이지 {current_page}/{total_pages} 크롤링 시작 -----")
-                
-                # 현재 페이지 크롤링
-                products_on_page = self._crawl_current_page(tab_name)
+            async with self.driver.bidi_connection() as connection:
+                session, devtools = connection.session, connection.devtools
+                paused_events = session.listen(devtools.fetch.RequestPaused)
+                await session.execute(devtools.fetch.enable(patterns=self._request_patterns(devtools)))
+                self.ready.set()
                 
-                # 결과가 없으면 다음 탭으로 이동
-                if not products_on_page:
-                    print(f"{tab_name} 탭의 페이지 {current_page}에 상품이 없습니다. 다음 탭으로 이동합니다.")
-                    break
-                
-                self._add_unique_products(products_on_page)
-                print(f"{tab_name}: 페이지 {current_page}/{total_pages} 크롤링 완료 - {len(products_on_page)}개 상품 추출")
-                
-                # 다음 페이지로 이동
-                if current_page < total_pages:
+                async for event in paused_events:
+                    resource_type = event.resource_type.value if event.resource_type else "Other"
                     try:
-                        # 다음 페이지 버튼 찾기 (표시된 tblwrap 내부에서)
-                        next_buttons = visible_tblwrap.find_elements(By.CSS_SELECTOR, "a.next")
-                        
-                        if not next_buttons:
-                            print("다음 페이지 버튼을 찾을 수 없습니다. 마지막 페이지로 판단합니다.")
-                            break
-                        
-                        # JavaScript 클릭 이벤트 실행
-                        self.driver.execute_script("goodsPageController.moveControl(1)")
-                        print(f"다음 페이지로 이동 중...")
-                        
-                        # 페이지 로딩 대기
-                        time.sleep(3)
-                        
-                        # 페이지 로드 확인
-                        self.wait.until(
-                            lambda driver: len(visible_tblwrap.find_elements(By.CSS_SELECTOR, "ul.prod_list li")) > 0
-                        )
-                        
-                        current_page += 1
+                        if self.network_filter.should_block(resource_type, event.request.url):
+                            self.blocked += 1
+                            await session.execute(devtools.fetch.fail_request(
+                                event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+                        else:
+                            await session.execute(devtools.fetch.continue_request(event.request_id))
+                    except trio.Cancelled:
+                        raise
                     except Exception as e:
-                        print(f"다음 페이지로 이동 중 오류 발생: {str(e)}")
-                        print("마지막 페이지로 판단하고 이 탭의 크롤링을 종료합니다.")
-                        break
-                else:
-                    print(f"마지막 페이지({total_pages})에 도달했습니다.")
-                    break
-                
-        except Exception as e:
-            print(f"{tab_name} 탭 크롤링 중 오류 발생: {str(e)}")
+                        # 페이지 이동 등으로 이미 취소된 요청
+                        print(f"가로챈 요청 처리 중 오류: {str(e)}")
     
-    def _add_unique_products(self, products_list):
-        """중복되지 않은 상품만 추가"""
-        for product in products_list:
-            product_name = product["상품명"]
-            # 이미 추가된 상품명이 아닌 경우에만 추가
-            if product_name not in self.product_names:
-                self.products.append(product)
-                self.product_names.add(product_name)
-            else:
-                print(f"중복 상품 발견 - 제외: {product_name}")
+    def _request_patterns(self, devtools):
+        """차단할 수 있는 요청만 멈추도록 리소스 유형/URL 패턴으로 Fetch.enable 패턴 구성"""
+        stage = devtools.fetch.RequestStage.REQUEST
+        patterns = [devtools.fetch.RequestPattern(resource_type=devtools.network.ResourceType(resource_type),
+                                                  request_stage=stage)
+                    for resource_type in sorted(self.network_filter.block_resource_types)]
+        patterns.extend(devtools.fetch.RequestPattern(url_pattern=url_pattern, request_stage=stage)
+                        for url_pattern in self.network_filter.blocked_patterns)
+        return patterns
+
+
+class NetworkFilter:
+    """
+    Chrome DevTools Protocol 기반 요청 차단 및 네트워크 사용량 집계
     
-    def _crawl_current_page(self, event_type):
-        """현재 페이지의 상품 정보 추출"""
-        products_on_page = []
+    요청 차단은 드라이버마다 FetchInterceptor가 Fetch.enable에 리소스 유형(resourceType)과
+    URL 패턴을 넘겨 요청을 멈추고, 허용 목록에 없으면 Fetch.failRequest로, 있으면 Fetch.continueRequest로
+    처리합니다. 따라서 이미지/글꼴/미디어 같은 유형은 처음 요청부터 받지 않습니다.
+    성능 로그에서 페이지별/탭별 요청 수와 전송 바이트도 집계합니다.
+    크롤러는 img의 src 속성과 텍스트만 읽으므로 이미지/글꼴/미디어는 받지 않아도 됩니다.
+    스타일시트는 div.tblwrap의 display 판별에 필요하므로 기본적으로 차단하지 않습니다.
+    """
+    
+    # 추적/광고 스크립트
+    TRACKER_PATTERNS = [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*facebook.net*", "*criteo.*", "*wcs.naver.net*"
+    ]
+    
+    def __init__(self, block_resource_types=("Image", "Font", "Media"), block_url_patterns=None,
+                 block_trackers=True, allow_resource_types=(), allow_url_patterns=None):
+        """
+        Args:
+            block_resource_types (tuple): 차단할 리소스 유형 (CDP resourceType 값: Image, Font, Media, Stylesheet 등)
+            block_url_patterns (list): 추가로 차단할 URL 패턴 (* 와일드카드)
+            block_trackers (bool): 알려진 추적/광고 스크립트 차단 여부
+            allow_resource_types (tuple): URL 패턴에 맞아도 차단하지 않을 리소스 유형 (예: "Document")
+            allow_url_patterns (list): 유형이나 패턴에 맞아도 차단하지 않을 URL 패턴 (예: 상품 이미지 CDN)
+        """
+        self.block_resource_types = set(block_resource_types)
+        self.blocked_patterns = list(block_url_patterns or [])
+        if block_trackers:
+            self.blocked_patterns.extend(self.TRACKER_PATTERNS)
+        self.allow_resource_types = set(allow_resource_types)
+        self.allow_url_patterns = list(allow_url_patterns or [])
         
-        # 페이지가 완전히 로드될 때까지 기다립니다
-        time.sleep(2)
+        self.page_stats = []  # 페이지별 집계
+        self.tab_stats = {}  # 탭별 누적 집계
+        self.accounting_disabled = set()  # 성능 로그를 읽을 수 없는 드라이버의 session_id
+        self.stats_lock = threading.Lock()  # CrawlDaemon의 여러 작업 스레드가 함께 집계하는 경우
+    
+    def __getstate__(self):
+        # 병렬 크롤링 작업자 프로세스로 넘길 때 잠금은 제외
+        state = self.__dict__.copy()
+        del state["stats_lock"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.stats_lock = threading.Lock()
+    
+    def should_block(self, resource_type, url):
+        """
+        요청 차단 여부 - 허용 목록이 차단 목록보다 우선
         
+        Args:
+            resource_type (str): CDP resourceType 값
+            url (str): 요청 URL
+        """
+        if resource_type in self.allow_resource_types:
+            return False
+        if any(fnmatch.fnmatchcase(url, pattern) for pattern in self.allow_url_patterns):
+            return False
+        if resource_type in self.block_resource_types:
+            return True
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in self.blocked_patterns)
+    
+    def apply(self, driver):
+        """드라이버에 차단 규칙 적용 (요청 가로채기를 시작하지 못하면 차단 없이 진행)"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        NetworkFilter.clear(driver)
+        
+        interceptor = FetchInterceptor(driver, self)
         try:
-            # 현재 보이는 div.tblwrap 찾기
-            tblwraps = self.driver.find_elements(By.CSS_SELECTOR, "div.tblwrap")
-            visible_tblwrap = None
+            interceptor.start()
+        except Exception as e:
+            print(f"요청 가로채기를 시작하지 못해 차단 없이 진행합니다: {str(e)}")
+            return
+        driver._fetch_interceptor = interceptor
+        print(f"네트워크 차단 규칙 적용 - 유형 {sorted(self.block_resource_types)}, URL 패턴 {len(self.blocked_patterns)}개, "
+              f"허용 유형 {sorted(self.allow_resource_types)}, 허용 URL 패턴 {len(self.allow_url_patterns)}개")
+    
+    @staticmethod
+    def clear(driver):
+        """드라이버의 요청 가로채기 중지 (BrowserPool에 반환하거나 종료하기 전)"""
+        interceptor = driver.__dict__.pop("_fetch_interceptor", None)
+        if interceptor:
+            interceptor.stop()
+    
+    def collect(self, driver, tab_id, page):
+        """지난 집계 이후의 성능 로그를 읽어 페이지 집계로 기록"""
+        if driver.session_id in self.accounting_disabled:
+            return None
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            # 성능 로그 없이 만든 드라이버 (예: 풀에서 빌린 드라이버) - 다른 드라이버의 집계는 계속
+            print("성능 로그를 읽을 수 없어 이 드라이버의 네트워크 사용량 집계를 중단합니다.")
+            with self.stats_lock:
+                self.accounting_disabled.add(driver.session_id)
+            return None
+        
+        stats = {"tab": tab_id, "page": page, "requests": 0, "bytes": 0, "blocked": 0, "by_type": {}}
+        request_types = {}
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message.get("params", {})
             
-            for tblwrap in tblwraps:
-                if tblwrap.value_of_css_property("display") == "block":
-                    visible_tblwrap = tblwrap
+            if method in ("Network.requestWillBeSent", "Network.responseReceived"):
+                request_types[params["requestId"]] = params.get("type", "Other")
+                if method == "Network.requestWillBeSent":
+                    stats["requests"] += 1
+            elif method == "Network.loadingFinished":
+                resource_type = request_types.get(params["requestId"], "Other")
+                size = int(params.get("encodedDataLength", 0))
+                stats["bytes"] += size
+                type_stats = stats["by_type"].setdefault(resource_type, {"requests": 0, "bytes": 0})
+                type_stats["requests"] += 1
+                type_stats["bytes"] += size
+            elif method == "Network.loadingFailed" and (
+                    params.get("blockedReason") or "ERR_BLOCKED_BY_CLIENT" in params.get("errorText", "")):
+                # Fetch.failRequest(BlockedByClient)로 차단한 요청
+                stats["blocked"] += 1
+        
+        self._record(stats)
+        return stats
+    
+    def merge(self, page_stats):
+        """
+        병렬 크롤링 작업자의 페이지별 집계 합치기
+        
+        Args:
+            page_stats (list): 작업자의 collect() 결과 목록
+        """
+        for stats in page_stats:
+            self._record(stats)
+    
+    def _record(self, stats):
+        """페이지 집계를 기록하고 탭별 누적 집계에 더함"""
+        with self.stats_lock:
+            self.page_stats.append(stats)
+            tab_total = self.tab_stats.setdefault(stats["tab"], {"pages": 0, "requests": 0, "bytes": 0, "blocked": 0})
+            tab_total["pages"] += 1
+            for key in ("requests", "bytes", "blocked"):
+                tab_total[key] += stats[key]
+    
+    def report(self):
+        """탭별 네트워크 사용량 출력"""
+        for tab_id, total in self.tab_stats.items():
+            pages = max(total["pages"], 1)
+            print(f"- {tab_id} 네트워크: 요청 {total['requests']}건, {total['bytes'] / 1024:.1f}KB, "
+                  f"차단 {total['blocked']}건 (페이지당 {total['bytes'] / pages / 1024:.1f}KB)")
+
+
+def _xpath_class(name):
+    """CSS 클래스 선택자(.name)에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class SnapshotReplayer:
+    """
+    저장된 페이지 스냅샷을 브라우저 없이 lxml로 파싱해 상품 정보를 만드는 재생기
+    
+    _crawl_current_page와 같은 선택자/규칙을 XPath로 적용하므로
+    실제 크롤링과 같은 Product 목록을 얻을 수 있습니다. (lxml 필요)
+    """
+    
+    def __init__(self, snapshot_dir, base_url="http://gs25.gsretail.com/gscvs/ko/products/event-goods"):
+        """
+        Args:
+            snapshot_dir (str): GS25EventCrawler(snapshot_dir=...)로 저장한 스냅샷 디렉토리
+            base_url (str): 상대 경로 이미지 주소를 절대 경로로 바꿀 기준 URL
+        """
+        from lxml import html as lxml_html
+        self.lxml_html = lxml_html
+        self.snapshot_dir = snapshot_dir
+        self.base_url = base_url
+        self.event_tabs = GS25CrawlerBase.EVENT_TABS
+    
+    def snapshot_files(self):
+        """(탭 ID, 페이지 번호, 파일 경로) 목록 - 탭 순서, 페이지 순서"""
+        files = []
+        for tab_id in self.event_tabs:
+            for path in sorted(glob.glob(os.path.join(self.snapshot_dir, tab_id, "page_*.html"))):
+                page = int(re.search(r'page_(\d+)\.html$', path).group(1))
+                files.append((tab_id, page, path))
+        return files
+    
+    def parse(self, page_html):
+        """HTML 문자열을 lxml 문서로 파싱"""
+        return self.lxml_html.fromstring(page_html)
+    
+    def extract(self, document, event_type):
+        """파싱한 문서에서 보이는 상품 목록의 상품 정보 추출"""
+        wraps = document.xpath(f"//div[{_xpath_class('tblwrap')}][@data-snapshot-visible='1']")
+        if not wraps:
+            return []
+        
+        products_on_page = []
+        items = wraps[0].xpath(f".//ul[{_xpath_class('prod_list')}]//li//div[{_xpath_class('prod_box')}]")
+        for item in items:
+            img_elements = item.xpath(f".//p[{_xpath_class('img')}]//img")
+            name_elements = item.xpath(f".//p[{_xpath_class('tit')}]")
+            price_elements = item.xpath(f".//p[{_xpath_class('price')}]//span[{_xpath_class('cost')}]")
+            if not img_elements or not name_elements or not price_elements:
+                continue
+            
+            img_url = urljoin(self.base_url, img_elements[0].get("src", ""))
+            name = _collapse_whitespace(name_elements[0].text_content())
+            price = _collapse_whitespace(price_elements[0].text_content().replace('원', ''))
+            
+            promotion = ""
+            for flag_class in ("ONE_TO_ONE", "TWO_TO_ONE"):
+                spans = item.xpath(f".//div[{_xpath_class('flag_box')} and {_xpath_class(flag_class)}]"
+                                   f"//p[{_xpath_class('flg01')}]//span")
+                if spans:
+                    promotion = _collapse_whitespace(spans[0].text_content())
                     break
-                    
-            if not visible_tblwrap:
-                print("현재 페이지에서 보이는 상품 목록 컨테이너를 찾을 수 없습니다.")
-                return []
-                
-            # 보이는 컨테이너 내의 상품 목록 요소 찾기
-            product_items = visible_tblwrap.find_elements(By.CSS_SELECTOR, "ul.prod_list li div.prod_box")
+            if not promotion and item.xpath(f".//div[{_xpath_class('flag_box')} and {_xpath_class('GIFT')}]"
+                                            f"//p[{_xpath_class('flg01')}]//span"):
+                promotion = "덤증정"
+            if not promotion:
+                spans = item.xpath(f".//div[{_xpath_class('flag_box')}]//p[{_xpath_class('flg01')}]//span")
+                if spans:
+                    promotion = _collapse_whitespace(spans[0].text_content())
             
-            if not product_items:
-                print("현재 페이지에서 상품을 찾을 수 없습니다.")
-                return []
-                
-            print(f"현재 페이지에서 {len(product_items)}개의 상품을 발견했습니다.")
+            gift_info = ""
+            if "덤" in promotion:
+                gift_elements = item.xpath(f".//div[{_xpath_class('dum_box')}]//div[{_xpath_class('dum_txt')}]"
+                                           f"//p[{_xpath_class('name')}]")
+                if gift_elements:
+                    gift_info = _collapse_whitespace(gift_elements[0].text_content())
             
-            # 각 상품 정보 추출
-            for item in product_items:
-                try:
-                    # 이미지 URL 추출
-                    img_elements = item.find_elements(By.CSS_SELECTOR, "p.img img")
-                    if not img_elements:
-                        print("상품 이미지를 찾을 수 없습니다.")
-                        continue
-                        
-                    img_url = img_elements[0].get_attribute("src")
-                    
-                    # 상품명 추출
-                    name_elements = item.find_elements(By.CSS_SELECTOR, "p.tit")
-                    if not name_elements:
-                        print("상품명을 찾을 수 없습니다.")
-                        continue
-                        
-                    name = name_elements[0].text.strip()
-                    
-                    # 가격 추출
-                    price_elements = item.find_elements(By.CSS_SELECTOR, "p.price span.cost")
-                    if not price_elements:
-                        print(f"상품 '{name}'의 가격을 찾을 수 없습니다.")
-                        continue
-                        
-                    price = price_elements[0].text.replace('원', '').strip()
-                    
-                    # 행사 유형 추출 (여러 종류의 행사 태그 확인)
-                    promotion = ""
-                    
-                    # 1+1 행사 확인
-                    one_to_one_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box.ONE_TO_ONE p.flg01 span")
-                    if one_to_one_elements and len(one_to_one_elements) > 0:
-                        promotion = one_to_one_elements[0].text.strip()
-                    
-                    # 2+1 행사 확인
-                    if not promotion:
-                        two_to_one_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box.TWO_TO_ONE p.flg01 span")
-                        if two_to_one_elements and len(two_to_one_elements) > 0:
-                            promotion = two_to_one_elements[0].text.strip()
-                    
-                    # 덤증정 행사 확인
-                    if not promotion:
-                        gift_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box.GIFT p.flg01 span")
-                        if gift_elements and len(gift_elements) > 0:
-                            promotion = "덤증정"
-                    
-                    # 행사 유형이 파악되지 않은 경우 기본 방식으로 한 번 더 시도
-                    if not promotion:
-                        all_span_elements = item.find_elements(By.CSS_SELECTOR, "div.flag_box p.flg01 span")
-                        if all_span_elements and len(all_span_elements) > 0:
-                            promotion = all_span_elements[0].text.strip()
-                    
-                    # 덤증정 상품 정보 추출 (있는 경우)
-                    gift_info = ""
-                    if "덤증정" in promotion or "덤" in promotion:
-                        try:
-                            dum_box = item.find_element(By.CSS_SELECTOR, "div.dum_box")
-                            gift_name_element = dum_box.find_element(By.CSS_SELECTOR, "div.dum_txt p.name")
-                            if gift_name_element:
-                                gift_info = gift_name_element.text.strip()
-                        except:
-                            pass
-                    
-                    # 상품 정보 저장
-                    product_info = {
-                        "이미지URL": img_url,
-                        "상품명": name,
-                        "가격": price,
-                        "행사유형": promotion,
-                        "행사분류": event_type
-                    }
-                    
-                    # 덤증정 상품 정보가 있으면 추가
-                    if gift_info:
-                        product_info["덤증정상품"] = gift_info
-                    
-                    products_on_page.append(product_info)
-                    print(f"상품 정보 추출: {name} - {price}원 ({promotion})")
-                    
-                except Exception as e:
-                    print(f"상품 정보 추출 중 오류: {str(e)}")
+            products_on_page.append(Product.create(img_url, name, price, promotion, event_type, gift_info))
+        
+        return products_on_page
+    
+    def replay(self):
+        """모든 스냅샷을 재생해 페이지 순서대로 (탭 ID, 페이지 번호, 상품 목록) 반환"""
+        pages = []
+        for tab_id, page, path in self.snapshot_files():
+            with open(path, 'r', encoding='utf-8') as f:
+                document = self.parse(f.read())
+            pages.append((tab_id, page, self.extract(document, self.event_tabs[tab_id])))
+        return pages
+    
+    def check_parity(self):
+        """
+        재생 결과를 스냅샷을 저장할 때 실제 크롤링에서 추출한 상품 목록(page_*.json)과 비교
+        
+        다른 페이지마다 (탭 ID, 페이지 번호, 실제 상품, 재생 상품) 중 처음 다른 상품 쌍을 담아 반환합니다.
+        실제 추출 결과가 없는 스냅샷(이전 버전으로 저장)은 건너뜁니다.
+        """
+        mismatches = []
+        checked = 0
+        for tab_id, page, replayed in self.replay():
+            live_path = os.path.join(self.snapshot_dir, tab_id, f"page_{page:03d}.json")
+            if not os.path.exists(live_path):
+                continue
+            with open(live_path, 'r', encoding='utf-8') as f:
+                live = [Product.from_row(row) for row in json.load(f)]
+            checked += 1
+            if live == replayed:
+                continue
+            # 개수가 다르면 짧은 쪽이 끝난 위치를 None으로 표시
+            live_product, replayed_product = next(pair for pair in zip_longest(live, replayed)
+                                                  if pair[0] != pair[1])
+            mismatches.append((tab_id, page, live_product, replayed_product))
+        
+        print(f"- 스냅샷 재생 일치 확인: {checked}개 페이지 중 {len(mismatches)}개 불일치")
+        for tab_id, page, live_product, replayed_product in mismatches:
+            print(f"  {tab_id} 페이지 {page}: 실제 {live_product} / 재생 {replayed_product}")
+        return mismatches
+
+
+def run_snapshot_benchmark(snapshot_dir, repeat=3):
+    """
+    스냅샷 기반 파서/중복 제거 벤치마크 - 단계별 지연 시간, 메모리 사용량, 초당 상품 수 출력
+    
+    단계별 메모리는 tracemalloc으로 두 가지를 잽니다.
+    - 최대 추가 메모리(peak_growth_bytes): 단계를 실행하는 동안 시작 시점보다 늘어난 최고치 (페이지 중 최댓값)
+    - 순증가(retained_bytes): 단계가 끝난 뒤에도 남은 메모리의 합 (중간에 할당했다 해제한 메모리는 빠짐)
+    
+    Args:
+        snapshot_dir (str): 스냅샷 디렉토리
+        repeat (int): 반복 횟수 (가장 빠른 회차 기준으로 보고)
+    """
+    replayer = SnapshotReplayer(snapshot_dir)
+    files = replayer.snapshot_files()
+    if not files:
+        print(f"스냅샷 파일이 없습니다: {snapshot_dir}")
+        return {}
+    
+    # 재생 결과가 실제 크롤링과 다르면 측정값도 실제 파서와 다른 작업을 잰 것이므로 먼저 확인
+    mismatches = replayer.check_parity()
+    
+    stages = ["read", "parse", "extract", "dedup"]
+    best = None
+    for _ in range(repeat):
+        timings = {stage: 0.0 for stage in stages}
+        peak_growth = {stage: 0 for stage in stages}
+        retained = {stage: 0 for stage in stages}
+        peak = 0
+        product_count = 0
+        crawler = GS25CrawlerBase(replayer.base_url)
+        
+        tracemalloc.start()
+        for tab_id, page, path in files:
             
-            return products_on_page
+            def measure(stage, func):
+                nonlocal peak
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                start = time.perf_counter()
+                value = func()
+                timings[stage] += time.perf_counter() - start
+                current, stage_peak = tracemalloc.get_traced_memory()
+                peak_growth[stage] = max(peak_growth[stage], stage_peak - before)
+                retained[stage] += current - before
+                peak = max(peak, stage_peak)
+                return value
             
-        except Exception as e:
-            print(f"현재 페이지 크롤링 중 오류: {str(e)}")
-            return []
+            with open(path, 'r', encoding='utf-8') as f:
+                page_html = measure("read", f.read)
+            document = measure("parse", lambda: replayer.parse(page_html))
+            products = measure("extract", lambda: replayer.extract(document, replayer.event_tabs[tab_id]))
+            # 중복 상품 출력은 측정에서 제외
+            with contextlib.redirect_stdout(io.StringIO()):
+                measure("dedup", lambda: crawler._add_unique_products(products))
+            product_count += len(products)
+        tracemalloc.stop()
+        
+        total = sum(timings.values())
+        if best is None or total < best["total_seconds"]:
+            best = {"total_seconds": total, "timings": timings, "peak_growth_bytes": peak_growth,
+                    "retained_bytes": retained, "peak_bytes": peak, "products": product_count, "unique_products": len(crawler.products)}
     
-    def _save_results(self):
-        """크롤링 결과를 CSV 파일로 저장"""
-        if not self.products:
-            print("저장할 데이터가 없습니다.")
+    pages = len(files)
+    best["pages"] = pages
+    best["parity_mismatches"] = len(mismatches)
+    best["products_per_second"] = best["products"] / best["total_seconds"] if best["total_seconds"] else 0.0
+    
+    print(f"\n스냅샷 벤치마크 ({pages}개 페이지, 상품 {best['products']}개, 중복 제거 후 {best['unique_products']}개)")
+    for stage in stages:
+        print(f"- {stage:8s}: 페이지당 {best['timings'][stage] / pages * 1000:.2f}ms, "
+              f"최대 추가 메모리 {best['peak_growth_bytes'][stage] / 1024:.1f}KB, "
+              f"순증가 {best['retained_bytes'][stage] / 1024:.1f}KB")
+    print(f"- 처리량: 초당 {best['products_per_second']:.0f}개 상품, 최대 메모리 {best['peak_bytes'] / 1024:.1f}KB")
+    return best
+
+
+class PooledDriver:
+    """BrowserPool이 관리하는 WebDriver와 사용 기록"""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.jobs = 0
+        self.created_at = time.time()
+        self.baseline_memory_mb = None
+
+
+class BrowserPool:
+    """
+    미리 띄워 둔(warm) Chrome WebDriver 풀
+    
+    크롤링 작업마다 드라이버를 빌려주고 반환받아 Chrome 시작 비용과 사이트 JS/CSS 캐시 손실을 없앱니다.
+    반환할 때 상태를 점검하고, 일정 횟수 이상 사용했거나 메모리가 늘어난 드라이버는 종료합니다.
+    종료한 자리는 빈 슬롯(None)으로 남겨 두었다가 다음에 빌릴 때 새로 만들므로,
+    Chrome 생성이 실패해도 반환은 항상 성공하고 풀 크기가 줄어들지 않습니다.
+    """
+    
+    def __init__(self, url, size=2, max_jobs_per_driver=20, max_memory_growth_mb=500, driver_factory=None):
+        """
+        Args:
+            url (str): 드라이버를 미리 접속시켜 둘 웹사이트 URL (캐시 예열)
+            size (int): 풀에 유지할 드라이버 수
+            max_jobs_per_driver (int): 드라이버 하나로 처리할 최대 작업 수 (초과 시 교체)
+            max_memory_growth_mb (int): 처음 대비 늘어난 Chrome 메모리가 이 값을 넘으면 교체 (psutil 필요)
+            driver_factory (callable): 드라이버 생성 함수 (기본값 create_chrome_driver)
+        """
+        self.url = url
+        self.size = size
+        self.max_jobs_per_driver = max_jobs_per_driver
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self.driver_factory = driver_factory or create_chrome_driver
+        self.idle = queue.Queue()
+        self.closed = False
+        self.stats = {"created": 0, "leased": 0, "recycled": 0, "unhealthy": 0, "create_failed": 0}
+        self.stats_lock = threading.Lock()
+        
+        for _ in range(size):
+            try:
+                self.idle.put(self._create())
+            except Exception as e:
+                print(f"드라이버 생성 중 오류 발생 - 처음 빌릴 때 다시 만듭니다: {str(e)}")
+                self.idle.put(None)
+    
+    def acquire(self, timeout=None):
+        """드라이버 빌리기 (빈 슬롯이거나 상태가 나쁜 드라이버는 새로 만들어 반환)"""
+        if self.closed:
+            raise RuntimeError("종료된 BrowserPool입니다.")
+        pooled = self.idle.get(timeout=timeout)
+        if pooled is not None and not self._is_healthy(pooled):
+            self._count("unhealthy")
+            print("응답하지 않는 드라이버를 교체합니다.")
+            self._quit(pooled)
+            pooled = None
+        if pooled is None:
+            try:
+                pooled = self._create()
+            except Exception:
+                # 슬롯을 돌려놓아야 다른 작업이 다시 시도할 수 있음
+                self.idle.put(None)
+                raise
+        pooled.jobs += 1
+        self._count("leased")
+        return pooled
+    
+    def release(self, pooled):
+        """드라이버 반환 - 사용 횟수나 메모리 증가량이 한도를 넘으면 새 드라이버로 교체"""
+        if self.closed:
+            self._quit(pooled)
             return
         
-        # 결과 디렉토리 생성
-        output_dir = "gs25_results"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        reason = None
+        if pooled.jobs >= self.max_jobs_per_driver:
+            reason = f"작업 {pooled.jobs}회 처리"
+        else:
+            memory = self._memory_mb(pooled.driver)
+            if memory is not None and pooled.baseline_memory_mb is not None \
+                    and memory - pooled.baseline_memory_mb > self.max_memory_growth_mb:
+                reason = f"메모리 {memory - pooled.baseline_memory_mb:.0f}MB 증가"
         
-        # 파일명 생성 (현재 시간 포함)
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(output_dir, f"GS25_행사상품_{timestamp}.csv")
+        # 이전 작업의 CrawlMetrics가 감싼 execute와 NetworkFilter의 요청 가로채기는 다음 작업에 남기지 않음
+        CrawlMetrics.uninstrument_driver(pooled.driver)
+        if not reason:
+            try:
+                NetworkFilter.clear(pooled.driver)
+            except Exception as e:
+                reason = f"요청 가로채기 해제 실패: {str(e)}"
         
-        # DataFrame 생성 및 저장
-        df = pd.DataFrame(self.products)
-        df.to_csv(file_path, index=False, encoding='utf-8-sig')
-        print(f"\n크롤링 결과 요약:")
-        print(f"- 총 {len(self.products)}개의 상품 정보 수집 (중복 제거됨)")
-        print(f"- 결과 저장 경로: {file_path}")
+        if reason:
+            print(f"드라이버 교체 ({reason})")
+            self._count("recycled")
+            self._quit(pooled)
+            pooled = None
         
-        # 행사 유형별 통계
-        event_counts = df['행사분류'].value_counts().to_dict()
-        for event_type, count in event_counts.items():
-            print(f"- {event_type}: {count}개 상품")
+        self.idle.put(pooled)
+    
+    def close(self):
+        """풀의 모든 드라이버 종료"""
+        self.closed = True
+        while True:
+            try:
+                pooled = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            if pooled is not None:
+                self._quit(pooled)
+    
+    def _count(self, name):
+        """여러 작업 스레드가 함께 쓰는 통계 증가"""
+        with self.stats_lock:
+            self.stats[name] += 1
+    
+    def _create(self):
+        """새 드라이버를 만들고 웹사이트에 미리 접속"""
+        try:
+            pooled = PooledDriver(self.driver_factory())
+        except Exception:
+            self._count("create_failed")
+            raise
+        self._count("created")
+        try:
+            pooled.driver.get(self.url)
+        except Exception as e:
+            print(f"드라이버 예열 중 오류 발생: {str(e)}")
+        pooled.baseline_memory_mb = self._memory_mb(pooled.driver)
+        return pooled
+    
+    def _is_healthy(self, pooled):
+        """드라이버가 명령에 응답하는지 확인"""
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+    
+    def _memory_mb(self, driver):
+        """chromedriver와 하위 Chrome 프로세스의 메모리 합계(MB) - psutil이 없으면 None"""
+        try:
+            import psutil
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+    
+    def _quit(self, pooled):
+        try:
+            NetworkFilter.clear(pooled.driver)
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"드라이버 종료 중 오류 발생: {str(e)}")
+
+
+class CrawlDaemon:
+    """
+    BrowserPool의 드라이버로 크롤링 작업을 처리하는 상주 프로세스
+    
+    submit()으로 받은 작업을 풀 크기만큼의 작업 스레드가 하나씩 꺼내
+    빌린 드라이버로 GS25EventCrawler를 실행합니다.
+    크롤링이 끝나면 닫히거나 실행 결과가 쌓이는 설정값(JOB_SCOPED_OPTIONS)은 작업끼리 함께 쓸 수 없으므로
+    crawler_options 대신 job_options_factory가 작업마다 새로 만들어 넘깁니다.
+    """
+    
+    # 작업마다 새로 만들어야 하는 설정값 (저장소는 작업 종료 시 닫히고, 지표/체크포인트/중복 인덱스는 실행 단위)
+    JOB_SCOPED_OPTIONS = ("sinks", "metrics", "checkpoint_path", "dedup_index", "delta_state_path", "scheduler")
+    
+    def __init__(self, pool, crawler_options=None, job_options_factory=None):
+        """
+        Args:
+            pool (BrowserPool): 드라이버를 빌려올 풀
+            crawler_options (dict): 모든 작업의 GS25EventCrawler 생성 시 전달할 설정값
+            job_options_factory (callable): 행사 탭 ID(전체 탭이면 None)를 받아 그 작업에만 쓸 설정값
+                                            (새 sinks, metrics 등) dict를 만드는 함수
+        """
+        shared = [name for name in self.JOB_SCOPED_OPTIONS if name in (crawler_options or {})]
+        if shared:
+            raise ValueError(f"{', '.join(shared)}는 작업마다 새로 만들어야 하므로 job_options_factory로 전달하세요.")
+        self.pool = pool
+        self.crawler_options = crawler_options or {}
+        self.job_options_factory = job_options_factory
+        self.jobs = queue.Queue()
+        self.threads = []
+        self.running = False
+    
+    def start(self):
+        """작업 스레드 시작"""
+        self.running = True
+        for index in range(self.pool.size):
+            thread = threading.Thread(target=self._work, name=f"crawl-worker-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        print(f"크롤링 데몬 시작 - 작업자 {self.pool.size}개")
+    
+    def submit(self, event_type=None, **options):
+        """
+        크롤링 작업 등록 - 결과 상품 목록을 담을 Future 반환
         
-        # 중복 제거 상태 보고
-        duplicate_count = len(self.product_names) - len(self.products)
-        if duplicate_count > 0:
-            print(f"- {duplicate_count}개의 중복 상품이 제거되었습니다.")
-
-    def crawl_single_event(self, event_type):
-        """특정 행사 유형만 크롤링"""
+        Args:
+            event_type (str): 특정 행사 탭만 크롤링할 경우 탭 ID (없으면 전체 탭)
+            options: 이 작업에만 적용할 GS25EventCrawler 설정값
+        """
+        future = Future()
+        self.jobs.put((future, event_type, options))
+        return future
+    
+    def run_forever(self, interval_seconds=3600):
+        """일정 간격으로 전체 크롤링 작업을 등록하며 계속 실행 (Ctrl+C로 종료)"""
+        if not self.running:
+            self.start()
         try:
-            # 웹사이트 접속
-            self.driver.get(self.url)
-            print(f"웹사이트 접속 완료: {self.url}")
-            
-            # 페이지 로딩 대기
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.myptab")))
-            
-            # 지정된 행사 탭만 크롤링
-            if event_type in self.event_tabs:
-                tab_id = event_type
-                tab_name = self.event_tabs[event_type]
-                print(f"\n===== {tab_name} 크롤링 시작 =====")
-                self._crawl_event_tab(tab_id, tab_name)
-                
-                # 결과 저장
-                self._save_results()
-                
-                return self.products
-            else:
-                print(f"유효하지 않은 행사 유형: {event_type}")
-                print(f"유효한 행사 유형: {list(self.event_tabs.keys())}")
-                return []
-                
-        except Exception as e:
-            print(f"크롤링 중 오류 발생: {str(e)}")
-            return []
-            
+            while True:
+                future = self.submit()
+                try:
+                    products = future.result()
+                    print(f"정기 크롤링 완료 - {len(products)}개 상품, {interval_seconds}초 후 다시 실행합니다.")
+                except Exception as e:
+                    # 드라이버 생성 실패 등 일시적인 오류는 이번 회차만 건너뛰고 다음 회차에 다시 시도
+                    print(f"정기 크롤링 중 오류 발생: {str(e)} - {interval_seconds}초 후 다시 실행합니다.")
+                time.sleep(interval_seconds)
+        except KeyboardInterrupt:
+            print("크롤링 데몬을 종료합니다.")
         finally:
-            # 드라이버 종료
-            self.driver.quit()
+            self.stop()
+    
+    def stop(self):
+        """남은 작업을 마친 뒤 작업 스레드와 드라이버 풀 종료"""
+        self.running = False
+        for _ in self.threads:
+            self.jobs.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        self.pool.close()
+    
+    def _work(self):
+        """작업 스레드 - 큐에서 작업을 꺼내 빌린 드라이버로 크롤링"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            future, event_type, options = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            
+            pooled = None
+            try:
+                job_options = dict(self.crawler_options)
+                if self.job_options_factory:
+                    job_options.update(self.job_options_factory(event_type))
+                job_options.update(options)
+                pooled = self.pool.acquire()
+                crawler = GS25EventCrawler(self.pool.url, driver=pooled.driver, **job_options)
+                if event_type:
+                    products = crawler.crawl_single_event(event_type)
+                else:
+                    products = crawler.start_crawling()
+                future.set_result(products)
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                # 반환 중 오류가 나도 작업 스레드는 계속 다음 작업을 처리
+                if pooled is not None:
+                    try:
+                        self.pool.release(pooled)
+                    except Exception as e:
+                        print(f"드라이버 반환 중 오류 발생: {str(e)}")
+
 
 if __name__ == "__main__":
     # 크롤링할 웹사이트 URL
@@ -408,10 +3543,81 @@ if __name__ == "__main__":
     # 크롤러 객체 생성 - wait_time 증가 및 최대 페이지 조정
     crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15)
     
+    # 중단된 크롤링을 이어서 하려면 체크포인트 경로를 지정하고 resume=True로 실행합니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15,
+    #                            checkpoint_path="gs25_results/crawl_checkpoint.jsonl")
+    # products = crawler.start_crawling(resume=True)
+    
+    # 바뀐 페이지만 크롤링하고 변경 상품 파일을 만들려면 증분 크롤링 상태 파일을 지정합니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15,
+    #                            delta_state_path="gs25_results/delta_state.json")
+    
+    # 결과를 메모리에 쌓지 않고 페이지마다 바로 파일로 내보낼 수도 있습니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15, keep_in_memory=False,
+    #                            sinks=[CsvProductSink("gs25_results/GS25_행사상품_stream.csv"),
+    #                                   JsonLinesProductSink("gs25_results/GS25_행사상품_stream.jsonl")])
+    
+    # 크롤링 중에 페이지마다 DB(event_products와 웹페이지가 조회하는 gs25_products)에 바로 저장하면
+    # CSV 적재 단계 없이 웹페이지에 반영됩니다 (gs25_products는 connect_Sql의 migrate_gs25_products로 먼저 준비)
+    # db_manager = GS25DatabaseManager(password="")
+    # db_manager.connect()
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15, keep_in_memory=False,
+    #                            sinks=[PipelineProductSink(db_manager, batch_size=200)])
+    
+    # 크롤링마다 전체 상품 목록을 이력 테이블(product_history)에도 남기면 크롤링 간 변경 내역과
+    # 상품별 가격 이력을 조회할 수 있습니다 (파이프라인과 연결을 나눠 쓰지 않도록 DB 관리자를 따로 만듦)
+    # history_manager = GS25DatabaseManager(password="")
+    # history_manager.connect()
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15, keep_in_memory=False,
+    #                            sinks=[PipelineProductSink(db_manager, batch_size=200),
+    #                                   HistoryProductSink(history_manager)])
+    
     # 모든 탭 크롤링
     print("모든 행사 상품 크롤링 시작...")
     products = crawler.start_crawling()
     
+    # 또는 탭별로 별도의 Chrome을 띄워 병렬로 크롤링할 수 있습니다
+    # products = crawler.start_parallel_crawling(max_workers=3)
+    # products = crawler.start_parallel_crawling(max_workers=6, shards_per_tab=2)  # 탭별 페이지 범위도 분할
+    
+    # 또는 브라우저 없이 상품 목록 API를 직접 호출할 수 있습니다
+    # products = GS25HttpCrawler(website_url, max_workers=8).start_crawling()
+    
+    # 이전 실행에서 같은 내용으로 저장한 상품을 저장소로 다시 보내지 않으려면 중복 인덱스를 지정합니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15,
+    #                            sinks=[PipelineProductSink(db_manager, batch_size=200)],
+    #                            dedup_index=ProductDedupIndex("gs25_results/crawler_dedup_index.db"))
+    
+    # 방문한 페이지의 DOM을 저장해 두면 브라우저 없이 파서/중복 제거 성능을 측정할 수 있습니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15, snapshot_dir="gs25_snapshots")
+    # run_snapshot_benchmark("gs25_snapshots")
+    
+    # 단계별 시간과 WebDriver 명령 수를 Prometheus 텍스트 파일과 JSON 보고서로 남길 수 있습니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15,
+    #                            metrics=CrawlMetrics(prometheus_path="gs25_results/gs25_crawl.prom",
+    #                                                 json_path="gs25_results/crawl_report.json"))
+    
+    # 페이지 작업 재시도 횟수와 사이트 장애 시 멈출 기준을 조정할 수 있습니다
+    # crawler = GS25EventCrawler(website_url, wait_time=15, checkpoint_path="gs25_results/checkpoint.jsonl",
+    #                            retry_policy=RetryPolicy(max_attempts=4, base_delay=2),
+    #                            circuit_breaker=CircuitBreaker(failure_threshold=5, cooldown=120))
+    
+    # 변경이 잦은 탭/페이지 위주로 시간당 페이지 예산 안에서 크롤링할 수 있습니다
+    # scheduler = AdaptiveCrawlScheduler("gs25_results/crawl_schedule.json", budget_pages_per_hour=60)
+    # products = GS25EventCrawler(website_url, wait_time=15, scheduler=scheduler).crawl_scheduled()
+    
+    # 이미지/글꼴/추적 스크립트 요청을 차단하고 페이지별 네트워크 사용량을 집계할 수 있습니다
+    # crawler = GS25EventCrawler(website_url, max_pages=50, wait_time=15, network_filter=NetworkFilter())
+    
+    # 또는 미리 띄워 둔 Chrome 풀로 정기 크롤링을 계속 실행할 수 있습니다
+    # daemon = CrawlDaemon(BrowserPool(website_url, size=2), {"max_pages": 50, "wait_time": 15})
+    # daemon.run_forever(interval_seconds=3600)
+    # (저장소와 지표는 작업마다 새로 만들어 넘깁니다)
+    # daemon = CrawlDaemon(BrowserPool(website_url, size=2), {"max_pages": 50, "wait_time": 15},
+    #                      job_options_factory=lambda event_type: {
+    #                          "sinks": [CsvProductSink(f"gs25_results/GS25_행사상품_{time.strftime('%Y%m%d_%H%M%S')}.csv")],
+    #                          "metrics": CrawlMetrics(json_path="gs25_results/crawl_report.json")})
+    
     # 또는 각 탭을 개별적으로 크롤링할 수 있습니다
     # print("1+1 행사 상품만 크롤링...")
     # products = crawler.crawl_single_event("ONE_TO_ONE")  # 1+1 행사만 크롤링
@@ -467,8 +3673,39 @@ from mysql.connector import Error
 import pandas as pd
 import os
 
+def crawl_file_timestamp(path):
+    """크롤링 결과 파일의 크롤링 시각 (파일명의 YYYYMMDD_HHMMSS, 없으면 수정 시각)"""
+    match = re.search(r'(\d{8}_\d{6})', os.path.basename(path))
+    if match:
+        return time.mktime(time.strptime(match.group(1), "%Y%m%d_%H%M%S"))
+    return os.path.getmtime(path)
+
+
+def _ingest_partition(product, partition_count):
+    """DB 키 비교 규칙(대소문자 무시 등)이 같은 상품으로 보는 상품끼리 같은 파티션 번호"""
+    partition_key = "\x1f".join(db_product_key(product.name, product.promotion))
+    return zlib.crc32(partition_key.encode('utf-8')) % partition_count
+
+
+def _parse_ingest_file(path, partition_count):
+    """
+    프로세스 풀 작업자 - CSV 파일 하나를 읽어 상품 키별 마지막 레코드를 파티션별 행(to_row) 목록으로 정규화
+    
+    Returns:
+        tuple: (파일 경로, 행 수, 파티션 번호 순서의 행 목록)
+    """
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    latest = {}
+    for product in Product.from_frame(df):
+        latest[(product.name, product.promotion)] = product
+    partitions = [[] for _ in range(partition_count)]
+    for product in latest.values():
+        partitions[_ingest_partition(product, partition_count)].append(product.to_row())
+    return path, len(df), partitions
+
+
 class GS25DatabaseManager:
-    def __init__(self, host="localhost", user="root", password="2741", database="gs25_db"):
+    def __init__(self, host="localhost", user="root", password="2741", database="gs25_db", dedup_index=None):
         """
         GS25 행사상품 데이터베이스 관리자 초기화
         
@@ -477,6 +3714,7 @@ class GS25DatabaseManager:
             user (str): MySQL 사용자 이름
             password (str): MySQL 비밀번호
             database (str): 사용할 데이터베이스 이름
+            dedup_index (ProductDedupIndex): 이전에 같은 내용으로 저장한 상품을 건너뛰기 위한 중복 인덱스
         """
         self.host = host
         self.user = user
@@ -484,9 +3722,15 @@ class GS25DatabaseManager:
         self.database = database
         self.conn = None
         self.cursor = None
+        self.dedup_index = dedup_index
     
-    def connect(self):
-        """데이터베이스 연결"""
+    def connect(self, prepare_schema=True):
+        """
+        데이터베이스 연결
+        
+        Args:
+            prepare_schema (bool): 테이블 생성과 통계 초기화까지 할지 여부 (이미 준비된 DB에 여는 작업자 연결은 False)
+        """
         try:
             # 데이터베이스 연결
             print(f"MySQL 서버({self.host})에 연결 중...")
@@ -508,7 +3752,8 @@ class GS25DatabaseManager:
                 self.cursor.execute(f"USE {self.database}")
                 
                 # 행사 상품 테이블 생성
-                self.create_tables()
+                if prepare_schema:
+                    self.create_tables()
                 
                 return True
         except Error as e:
@@ -554,8 +3799,46 @@ class GS25DatabaseManager:
             )
             ''')
             
+            # 크롤링별 상품 이력 테이블 (크롤링 날짜별 파티션, 파티션 테이블은 외래 키를 쓸 수 없음)
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS product_history (
+                crawl_date DATE NOT NULL,
+                crawled_at DATETIME NOT NULL,
+                product_name VARCHAR(255) NOT NULL,
+                promotion_type VARCHAR(20) NOT NULL DEFAULT '',
+                price INT,
+                image_url VARCHAR(500),
+                event_type_id INT,
+                gift_product VARCHAR(255),
+                PRIMARY KEY (crawl_date, crawled_at, product_name, promotion_type),
+                KEY idx_history_product (product_name, promotion_type, crawled_at)
+            )
+            PARTITION BY RANGE (TO_DAYS(crawl_date)) (
+                PARTITION pmax VALUES LESS THAN MAXVALUE
+            )
+            ''')
+            
+            # 행사 유형/행사별 상품 수와 가격 통계 (save_products에서 증분 갱신, 행사 유형이 없으면 0)
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS event_product_stats (
+                event_type_id INT NOT NULL DEFAULT 0,
+                promotion_type VARCHAR(20) NOT NULL DEFAULT '',
+                product_count INT NOT NULL DEFAULT 0,
+                price_sum BIGINT NOT NULL DEFAULT 0,
+                min_price INT,
+                max_price INT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                PRIMARY KEY (event_type_id, promotion_type)
+            )
+            ''')
+            
             print("필요한 테이블이 생성되었습니다.")
             
+            # 통계 테이블을 새로 만든 경우 기존 상품으로 채움
+            self.cursor.execute("SELECT COUNT(*) FROM event_product_stats")
+            if self.cursor.fetchone()[0] == 0:
+                self.rebuild_stats()
+            
             # 기본 행사 유형 데이터 삽입
             self.seed_event_types()
             
@@ -588,8 +3871,27 @@ class GS25DatabaseManager:
         except Error as e:
             print(f"행사 유형 데이터 등록 중 오류 발생: {e}")
     
-    def save_products(self, products):
-        """행사 상품 데이터 저장"""
+    # 상품명+행사유형 UNIQUE 키를 이용한 upsert (executemany로 여러 행 INSERT 한 문장씩 전송)
+    UPSERT_QUERY = """
+    INSERT INTO event_products 
+    (product_name, price, image_url, promotion_type, event_type_id, gift_product)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+      price = VALUES(price),
+      image_url = VALUES(image_url),
+      event_type_id = VALUES(event_type_id),
+      gift_product = VALUES(gift_product),
+      updated_at = CURRENT_TIMESTAMP
+    """
+    
+    def save_products(self, products, batch_size=500):
+        """
+        행사 상품 데이터 저장 (batch_size개씩 INSERT ... ON DUPLICATE KEY UPDATE)
+        
+        Args:
+            products (list): 저장할 상품 목록 (Product 또는 CSV 컬럼 딕셔너리)
+            batch_size (int): 한 번에 upsert할 상품 수
+        """
         if not self.conn or not self.conn.is_connected():
             print("데이터베이스에 연결되어 있지 않습니다.")
             return 0
@@ -598,115 +3900,621 @@ class GS25DatabaseManager:
             print("저장할 상품 데이터가 없습니다.")
             return 0
         
+        try:
+            _, _, inserted_count, updated_count = self.upsert_products(products, batch_size)
+        except Error as e:
+            print(f"상품 데이터 저장 중 오류 발생: {e}")
+            return 0
+        
+        print(f"\n데이터베이스 저장 완료: 새로 추가된 상품 {inserted_count}개, 업데이트된 상품 {updated_count}개")
+        return inserted_count + updated_count
+    
+    def upsert_products(self, products, batch_size=500, stats_delta=None, recompute_groups=None):
+        """
+        save_products의 저장 단계 - 실패하면 롤백한 뒤 Error를 그대로 발생시킴
+        
+        Args:
+            products (list): 저장할 상품 목록 (Product 또는 CSV 컬럼 딕셔너리)
+            batch_size (int): 한 번에 upsert할 상품 수
+            stats_delta (dict): 지정하면 통계 변화량을 여기에 모으기만 하고 event_product_stats에는 반영하지 않음
+                                (여러 작업자의 변화량을 호출한 쪽에서 한 번에 반영할 때 사용)
+            recompute_groups (set): stats_delta와 함께 최저/최고 가격을 다시 계산할 그룹을 모을 집합
+        
+        Returns:
+            tuple: (저장된 상품 목록, 저장에 실패한 상품 목록, 새로 추가된 상품 수, 업데이트된 상품 수)
+        """
         inserted_count = 0
         updated_count = 0
         
+        # 이전에 같은 내용으로 저장한 상품은 DB 조회 없이 건너뜀
+        products = [Product.coerce(product) for product in products]
+        if self.dedup_index is not None:
+            known_count = len(products)
+            products = [product for product in products if not self.dedup_index.is_unchanged(product)]
+            known_count -= len(products)
+            if known_count:
+                print(f"변경 없는 기존 상품 {known_count}개를 건너뜁니다.")
+        saved_products = []
+        failed_products = []
+        
+        # 행사 유형/행사별 통계 변화량 (그룹 -> [상품 수, 가격 합계, 최저, 최고])
+        apply_stats = stats_delta is None
+        if apply_stats:
+            stats_delta = {}
+            recompute_groups = set()
+        
         try:
             # 행사 유형 ID 가져오기
-            event_type_mapping = {}
-            self.cursor.execute("SELECT id, event_id FROM event_types")
-            for id, event_id in self.cursor.fetchall():
-                event_type_mapping[event_id] = id
+            event_type_mapping = self._event_type_mapping()
             
             # 상품 정보 저장
-            for product in products:
+            for start in range(0, len(products), batch_size):
+                chunk = products[start:start + batch_size]
+                
+                # 통계 변화량 집계를 위해 이미 저장된 상품을 한 번에 조회
+                existing = self._existing_products(chunk)
+                rows = [self._product_params(product, event_type_mapping) for product in chunk]
+                
+                # 추가/업데이트 건수는 영향받은 행 수로 판단 (MySQL upsert는 추가 1, 업데이트 2)
                 try:
-                    # 이벤트 타입 ID 찾기
-                    event_type = None
-                    event_name = product.get('행사분류', '')
-                    
-                    if '1+1' in event_name:
-                        event_type = event_type_mapping.get('ONE_TO_ONE')
-                    elif '2+1' in event_name:
-                        event_type = event_type_mapping.get('TWO_TO_ONE')
-                    elif '덤증정' in event_name:
-                        event_type = event_type_mapping.get('GIFT')
-                    
-                    # 가격을 숫자만 남기기
-                    price_str = product.get('가격', '0')
-                    price = int(''.join(filter(str.isdigit, price_str))) if price_str else 0
-                    
-                    # 덤증정 상품 정보
-                    gift_product = product.get('덤증정상품', '')
-                    
-                    # 중복 확인 (같은 상품명과 행사 유형)
-                    check_query = """
-                    SELECT id FROM event_products 
-                    WHERE product_name = %s AND promotion_type = %s
-                    """
-                    self.cursor.execute(check_query, (product.get('상품명', ''), product.get('행사유형', '')))
-                    existing_id = self.cursor.fetchone()
-                    
-                    if existing_id:
-                        # 이미 존재하는 상품 업데이트
-                        update_query = """
-                        UPDATE event_products SET 
-                          price = %s,
-                          image_url = %s,
-                          event_type_id = %s,
-                          gift_product = %s,
-                          updated_at = CURRENT_TIMESTAMP
-                        WHERE id = %s
-                        """
-                        self.cursor.execute(update_query, (
-                            price,
-                            product.get('이미지URL', ''),
-                            event_type,
-                            gift_product,
-                            existing_id[0]
-                        ))
-                        updated_count += 1
-                    else:
-                        # 새 상품 등록
-                        insert_query = """
-                        INSERT INTO event_products 
-                        (product_name, price, image_url, promotion_type, event_type_id, gift_product)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                        """
-                        self.cursor.execute(insert_query, (
-                            product.get('상품명', ''),
-                            price,
-                            product.get('이미지URL', ''),
-                            product.get('행사유형', ''),
-                            event_type,
-                            gift_product
-                        ))
-                        inserted_count += 1
-                        
+                    self.cursor.executemany(self.UPSERT_QUERY, rows)
+                    saved_chunk = chunk
+                    chunk_updated = min(max(self.cursor.rowcount - len(chunk), 0), len(chunk))
+                    updated_count += chunk_updated
+                    inserted_count += len(chunk) - chunk_updated
                 except Error as e:
-                    print(f"상품 '{product.get('상품명', '')}' 저장 중 오류 발생: {e}")
+                    # 문제가 되는 상품만 빼고 저장하도록 한 건씩 다시 시도
+                    print(f"일괄 저장 중 오류 발생, 한 건씩 다시 저장합니다: {e}")
+                    saved_chunk = []
+                    for product, row in zip(chunk, rows):
+                        try:
+                            self.cursor.execute(self.UPSERT_QUERY, row)
+                            saved_chunk.append(product)
+                            if self.cursor.rowcount == 1:
+                                inserted_count += 1
+                            else:
+                                updated_count += 1
+                        except Error as e:
+                            failed_products.append(product)
+                            print(f"상품 '{product.name}' 저장 중 오류 발생: {e}")
+                
+                for product in saved_chunk:
+                    key = db_product_key(product.name, product.promotion)
+                    new_value = (product.price, self._event_type_id(product.category, event_type_mapping))
+                    old_value = existing.get(key)
+                    existing[key] = new_value
+                    
+                    # 통계 변화량: 기존 값은 이전 그룹에서 빼고 새 값은 새 그룹에 더함
+                    if old_value == new_value:
+                        continue
+                    if old_value is not None:
+                        old_group = (old_value[1] or 0, product.promotion)
+                        self._add_stats_delta(stats_delta, old_group, -1, old_value[0])
+                        recompute_groups.add(old_group)
+                    self._add_stats_delta(stats_delta, (new_value[1] or 0, product.promotion), 1, new_value[0])
+                saved_products.extend(saved_chunk)
             
-            # 변경사항 저장
+            # 통계 반영 후 변경사항 저장
+            if apply_stats:
+                self._apply_stats_delta(stats_delta, recompute_groups)
             self.conn.commit()
-            print(f"\n데이터베이스 저장 완료: 새로 추가된 상품 {inserted_count}개, 업데이트된 상품 {updated_count}개")
             
+        except Error:
+            self._rollback()
+            raise
+        
+        if self.dedup_index is not None:
+            self.dedup_index.add_many(saved_products)
+        return saved_products, failed_products, inserted_count, updated_count
+    
+    # 웹페이지(gs25_webpage)가 조회하는 gs25_products에 upsert (connect_Sql의 uk_product 키 사용)
+    WEB_UPSERT_QUERY = """
+    INSERT INTO gs25_products 
+    (이미지URL, 상품명, 가격, 행사유형, 행사분류, 가격값)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+      이미지URL = VALUES(이미지URL),
+      가격 = VALUES(가격),
+      행사분류 = VALUES(행사분류),
+      가격값 = VALUES(가격값)
+    """
+    
+    def upsert_web_products(self, products, batch_size=500):
+        """
+        웹페이지가 조회하는 gs25_products에 상품 저장 - 실패하면 롤백한 뒤 Error를 그대로 발생시킴
+        
+        gs25_products는 connect_Sql의 csv_to_mysql/migrate_gs25_products로 만든 테이블이며,
+        (상품명, 행사유형) UNIQUE 키(uk_product)가 있어야 같은 상품을 다시 저장해도 행이 늘지 않습니다.
+        웹페이지의 상품 수/필터별 개수(gs25_product_stats)는 같은 마이그레이션이 만든 트리거가 갱신합니다.
+        
+        Args:
+            products (list): 저장할 상품 목록 (Product 또는 CSV 컬럼 딕셔너리)
+            batch_size (int): 한 번에 upsert할 상품 수
+        """
+        rows = []
+        for product in products:
+            product = Product.coerce(product)
+            row = product.to_row()
+            rows.append((row["이미지URL"], row["상품명"], row["가격"], row["행사유형"], row["행사분류"], product.price))
+        try:
+            for start in range(0, len(rows), batch_size):
+                self.cursor.executemany(self.WEB_UPSERT_QUERY, rows[start:start + batch_size])
+            self.conn.commit()
+        except Error:
+            self._rollback()
+            raise
+        return len(rows)
+    
+    def _rollback(self):
+        """저장 실패 시 트랜잭션 되돌리기 (연결이 끊긴 경우는 무시)"""
+        try:
+            self.conn.rollback()
         except Error as e:
-            print(f"상품 데이터 저장 중 오류 발생: {e}")
-            return 0
+            print(f"롤백 중 오류 발생: {e}")
+    
+    def _existing_products(self, products):
+        """event_products에 이미 있는 상품의 db_product_key(상품명, 행사유형) -> (가격, 행사 유형 ID)"""
+        keys = list(dict.fromkeys((product.name, product.promotion) for product in products))
+        placeholders = ", ".join(["(%s, %s)"] * len(keys))
+        self.cursor.execute(f"""
+        SELECT product_name, promotion_type, price, event_type_id FROM event_products 
+        WHERE (product_name, promotion_type) IN ({placeholders})
+        """, [value for key in keys for value in key])
+        return {db_product_key(name, promotion): (price, event_type_id)
+                for name, promotion, price, event_type_id in self.cursor.fetchall()}
+    
+    def _apply_stats_delta(self, stats_delta, recompute_groups):
+        """
+        save_products에서 모은 그룹별 변화량을 event_product_stats에 반영 (같은 트랜잭션에서 커밋)
         
-        return inserted_count + updated_count
+        상품 수와 가격 합계는 더하고 빼기만 하면 되지만, 최저/최고 가격은 기존 값이 빠진 그룹만
+        해당 그룹의 상품으로 다시 계산합니다.
+        """
+        # 여러 연결이 동시에 반영해도 교착 상태가 생기지 않도록 항상 같은 그룹 순서로 잠금
+        if stats_delta:
+            self.cursor.executemany("""
+            INSERT INTO event_product_stats 
+            (event_type_id, promotion_type, product_count, price_sum, min_price, max_price)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              product_count = product_count + VALUES(product_count),
+              price_sum = price_sum + VALUES(price_sum),
+              min_price = COALESCE(LEAST(min_price, VALUES(min_price)), min_price, VALUES(min_price)),
+              max_price = COALESCE(GREATEST(max_price, VALUES(max_price)), max_price, VALUES(max_price))
+            """, [group + tuple(values) for group, values in sorted(stats_delta.items())])
+        
+        for event_type_id, promotion_type in sorted(recompute_groups):
+            self.cursor.execute("""
+            SELECT MIN(price), MAX(price) FROM event_products
+            WHERE COALESCE(event_type_id, 0) = %s AND COALESCE(promotion_type, '') = %s
+            """, (event_type_id, promotion_type))
+            min_price, max_price = self.cursor.fetchone()
+            self.cursor.execute("""
+            UPDATE event_product_stats SET min_price = %s, max_price = %s
+            WHERE event_type_id = %s AND promotion_type = %s
+            """, (min_price, max_price, event_type_id, promotion_type))
+    
+    def rebuild_stats(self):
+        """event_products 전체로 event_product_stats 다시 계산 (최초 생성 시 또는 복구용)"""
+        try:
+            self.cursor.execute("DELETE FROM event_product_stats")
+            self.cursor.execute("""
+            INSERT INTO event_product_stats 
+            (event_type_id, promotion_type, product_count, price_sum, min_price, max_price)
+            SELECT COALESCE(event_type_id, 0), COALESCE(promotion_type, ''),
+                   COUNT(*), COALESCE(SUM(price), 0), MIN(price), MAX(price)
+            FROM event_products
+            GROUP BY COALESCE(event_type_id, 0), COALESCE(promotion_type, '')
+            """)
+            self.conn.commit()
+            print("행사 상품 통계를 다시 계산했습니다.")
+        except Error as e:
+            print(f"행사 상품 통계 계산 중 오류 발생: {e}")
+    
+    @staticmethod
+    def _add_stats_delta(stats_delta, group, count, price):
+        delta = stats_delta.setdefault(group, [0, 0, None, None])
+        delta[0] += count
+        delta[1] += count * (price or 0)
+        if count > 0 and price is not None:
+            delta[2] = price if delta[2] is None else min(delta[2], price)
+            delta[3] = price if delta[3] is None else max(delta[3], price)
+    
+    @staticmethod
+    def _merge_stats_delta(stats_delta, other):
+        """작업자가 모은 통계 변화량을 합침"""
+        for group, (count, price_sum, min_price, max_price) in other.items():
+            delta = stats_delta.setdefault(group, [0, 0, None, None])
+            delta[0] += count
+            delta[1] += price_sum
+            if min_price is not None:
+                delta[2] = min_price if delta[2] is None else min(delta[2], min_price)
+            if max_price is not None:
+                delta[3] = max_price if delta[3] is None else max(delta[3], max_price)
+    
+    def _product_params(self, product, event_type_mapping):
+        """upsert 파라미터 (상품명, 가격, 이미지, 행사유형, 행사 유형 ID, 덤증정상품)"""
+        event_type = self._event_type_id(product.category, event_type_mapping)
+        
+        # 가격은 Product에서 이미 정수로 변환됨
+        return (product.name, product.price, product.image_url, product.promotion, event_type, product.gift)
     
-    def load_products_from_csv(self, csv_file):
-        """CSV 파일에서 상품 정보 로드 후 DB에 저장"""
+    @staticmethod
+    def _event_type_id(event_name, event_type_mapping):
+        """행사분류 이름으로 행사 유형 ID 찾기"""
+        if '1+1' in event_name:
+            return event_type_mapping.get('ONE_TO_ONE')
+        elif '2+1' in event_name:
+            return event_type_mapping.get('TWO_TO_ONE')
+        elif '덤증정' in event_name:
+            return event_type_mapping.get('GIFT')
+        return None
+    
+    def load_products_from_csv(self, csv_file, chunksize=None):
+        """
+        CSV 파일에서 상품 정보 로드 후 DB에 저장
+        
+        Args:
+            csv_file (str): CSV 파일 경로 또는 glob 패턴 (예: gs25_results/GS25_행사상품_*.csv)
+            chunksize (int): 지정하면 파일을 이 행 수씩 읽어 청크마다 저장 (메모리 사용량 일정)
+        """
         try:
-            if not os.path.exists(csv_file):
+            # 패턴이면 파일명(크롤링 시각) 순서대로 저장해 최신 결과가 마지막에 반영되도록 함
+            csv_files = sorted(glob.glob(csv_file)) if glob.has_magic(csv_file) else [csv_file]
+            if not csv_files or not os.path.exists(csv_files[0]):
                 print(f"파일을 찾을 수 없습니다: {csv_file}")
                 return 0
-                
-            # CSV 파일 읽기
-            df = pd.read_csv(csv_file, encoding='utf-8-sig')
-            print(f"CSV 파일 '{csv_file}'에서 {len(df)}개의 상품 정보를 로드했습니다.")
             
-            # DataFrame을 리스트로 변환
-            products = df.to_dict('records')
+            saved_count = 0
+            for path in csv_files:
+                # CSV 파일 읽기 (chunksize가 없으면 파일 전체를 한 번에)
+                if chunksize:
+                    chunks = pd.read_csv(path, encoding='utf-8-sig', chunksize=chunksize)
+                else:
+                    chunks = [pd.read_csv(path, encoding='utf-8-sig')]
+                
+                row_count = 0
+                for df in chunks:
+                    row_count += len(df)
+                    # DataFrame 컬럼에서 바로 상품 레코드 생성 후 DB에 저장
+                    saved_count += self.save_products(Product.from_frame(df))
+                print(f"CSV 파일 '{path}'에서 {row_count}개의 상품 정보를 로드했습니다.")
             
-            # DB에 저장
-            return self.save_products(products)
+            return saved_count
             
         except Exception as e:
             print(f"CSV 파일 로드 중 오류 발생: {e}")
             return 0
     
+    def ingest_directory(self, directory="gs25_results", pattern="GS25_행사상품_*.csv",
+                         max_workers=None, batch_size=500, partition_count=None):
+        """
+        디렉토리의 크롤링 결과 CSV 파일 전체를 병렬로 적재
+        
+        파일 파싱/정규화는 프로세스 풀에서, DB 저장은 작업자마다 별도 연결로 나눠 진행합니다.
+        파싱한 상품은 DB 키 비교 규칙(대소문자 무시 등)으로 나눈 파티션별 임시 파일에 크롤링 시각 순서대로
+        이어 쓰고, 저장 작업자가 파티션을 하나씩 읽어 상품마다 가장 최근 레코드만 남긴 뒤 저장합니다.
+        같은 상품은 항상 같은 파티션에 있으므로 파일을 하나씩 순서대로 적재한 것과 최종 상태가 같고,
+        메모리에는 전체 상품 대신 작업자 수만큼의 파티션만 올라갑니다.
+        
+        Args:
+            directory (str): 크롤링 결과 디렉토리
+            pattern (str): 적재할 파일 패턴
+            max_workers (int): 파싱 프로세스/저장 연결 수 (기본값은 CPU 코어 수)
+            batch_size (int): 작업자가 한 번에 upsert할 상품 수
+            partition_count (int): 상품을 나눌 파티션 수 (기본값은 max_workers의 4배 - 클수록 파티션당 메모리가 작음)
+        """
+        if not self.conn or not self.conn.is_connected():
+            print("데이터베이스에 연결되어 있지 않습니다.")
+            return 0
+        
+        csv_files = sorted(glob.glob(os.path.join(directory, pattern)), key=crawl_file_timestamp)
+        if not csv_files:
+            print(f"적재할 CSV 파일이 없습니다: {os.path.join(directory, pattern)}")
+            return 0
+        
+        max_workers = max_workers or os.cpu_count() or 1
+        partition_count = partition_count or max_workers * 4
+        start_time = time.perf_counter()
+        
+        with tempfile.TemporaryDirectory(prefix="gs25_ingest_") as partition_dir:
+            partition_paths = [os.path.join(partition_dir, f"partition_{index}.jsonl")
+                               for index in range(partition_count)]
+            
+            # 1단계: 파일 파싱 (결과를 크롤링 시각 순서대로 받아 파티션별 임시 파일에 이어 씀)
+            row_count = 0
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for path, file_rows, partitions in executor.map(_parse_ingest_file, csv_files,
+                                                                repeat(partition_count)):
+                    row_count += file_rows
+                    for partition_path, rows in zip(partition_paths, partitions):
+                        if rows:
+                            with open(partition_path, 'a', encoding='utf-8') as f:
+                                f.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+            print(f"{len(csv_files)}개 파일에서 {row_count}개 행을 읽어 {partition_count}개 파티션으로 나눴습니다.")
+            
+            # 2단계: 파티션별 저장 - 작업자는 상품만 저장하고, 통계 변화량은 모아서 이 연결에서 한 번에 반영
+            # (통계 행 잠금 경합 방지)
+            dedup_lock = threading.Lock()
+            product_count = 0
+            saved_count = 0
+            stats_delta = {}
+            recompute_groups = set()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._upsert_partition, partition_path, batch_size, dedup_lock)
+                           for partition_path in partition_paths if os.path.exists(partition_path)]
+                for future in as_completed(futures):
+                    try:
+                        partition_products, saved_products, partition_delta, partition_groups = future.result()
+                    except Exception as e:
+                        print(f"병렬 적재 작업 중 오류 발생: {e}")
+                        continue
+                    product_count += partition_products
+                    saved_count += len(saved_products)
+                    self._merge_stats_delta(stats_delta, partition_delta)
+                    recompute_groups.update(partition_groups)
+                    
+                    # 커밋까지 마친 작업자의 상품만 중복 인덱스에 기록
+                    if self.dedup_index is not None:
+                        with dedup_lock:
+                            self.dedup_index.add_many(saved_products)
+        
+        try:
+            self._apply_stats_delta(stats_delta, recompute_groups)
+            self.conn.commit()
+        except Error as e:
+            print(f"행사 상품 통계 반영 중 오류 발생 (rebuild_stats()로 다시 계산하세요): {e}")
+            self._rollback()
+        
+        elapsed = time.perf_counter() - start_time
+        print(f"디렉토리 적재 완료: {product_count}개 상품 중 {saved_count}개 저장, {elapsed:.2f}초 "
+              f"({row_count / max(elapsed, 1e-9):.0f}행/초)")
+        return saved_count
+    
+    def _upsert_partition(self, partition_path, batch_size, dedup_lock):
+        """
+        작업자 - 파티션 임시 파일을 읽어 상품마다 가장 최근 레코드만 남기고 자체 DB 연결로 저장 후 커밋
+        (실패하면 예외 발생)
+        
+        작업자 연결은 부모 연결이 이미 준비한 스키마를 다시 만들거나 통계를 다시 계산하지 않습니다.
+        
+        Returns:
+            tuple: (정리한 상품 수, 저장된 상품 목록, 통계 변화량, 최저/최고 가격을 다시 계산할 그룹)
+        """
+        latest = {}
+        with open(partition_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                product = Product.from_row(json.loads(line))
+                key = db_product_key(product.name, product.promotion)
+                latest.pop(key, None)
+                latest[key] = product
+        
+        products = list(latest.values())
+        if self.dedup_index is not None:
+            # 중복 인덱스의 SQLite 연결은 작업자들이 함께 쓰므로 한 번에 하나씩 조회
+            with dedup_lock:
+                products = [product for product in products if not self.dedup_index.is_unchanged(product)]
+        if not products:
+            return len(latest), [], {}, set()
+        
+        worker = GS25DatabaseManager(self.host, self.user, self.password, self.database)
+        if not worker.connect(prepare_schema=False):
+            raise RuntimeError("작업자 데이터베이스 연결에 실패했습니다.")
+        try:
+            stats_delta = {}
+            recompute_groups = set()
+            saved_products, _, _, _ = worker.upsert_products(products, batch_size, stats_delta, recompute_groups)
+            return len(latest), saved_products, stats_delta, recompute_groups
+        finally:
+            worker.close()
+    
+    def save_snapshot(self, products, crawled_at=None, batch_size=1000):
+        """
+        크롤링 한 번의 상품 목록을 이력 테이블(product_history)에 추가
+        
+        event_products와 달리 덮어쓰지 않고 크롤링마다 전체 목록을 남기므로
+        크롤링 간 변경 내역과 상품별 가격 이력을 조회할 수 있습니다.
+        
+        Args:
+            products (list): 크롤링한 상품 목록
+            crawled_at (datetime): 크롤링 시각 (기본값: 현재 시각, 같은 크롤링의 상품은 같은 값 사용)
+            batch_size (int): 한 번에 추가할 상품 수
+        """
+        if not self.conn or not self.conn.is_connected():
+            print("데이터베이스에 연결되어 있지 않습니다.")
+            return 0
+        
+        products = [Product.coerce(product) for product in products]
+        crawled_at = (crawled_at or datetime.datetime.now()).replace(microsecond=0)
+        
+        try:
+            self._ensure_history_partition(crawled_at.date())
+            event_type_mapping = self._event_type_mapping()
+            rows = [(crawled_at.date(), crawled_at) + self._product_params(product, event_type_mapping)
+                    for product in products]
+            
+            # 같은 크롤링을 다시 저장해도 중복되지 않도록 INSERT IGNORE
+            for start in range(0, len(rows), batch_size):
+                self.cursor.executemany("""
+                INSERT IGNORE INTO product_history 
+                (crawl_date, crawled_at, product_name, price, image_url, promotion_type, event_type_id, gift_product)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """, rows[start:start + batch_size])
+            self.conn.commit()
+            print(f"이력 저장 완료: {crawled_at} 크롤링 상품 {len(rows)}개")
+            return len(rows)
+            
+        except Error as e:
+            print(f"이력 저장 중 오류 발생: {e}")
+            return 0
+    
+    def import_history_from_csv(self, csv_file):
+        """지난 크롤링 결과 CSV 파일(glob 패턴 가능)을 파일명의 크롤링 시각으로 이력 테이블에 추가"""
+        csv_files = sorted(glob.glob(csv_file), key=crawl_file_timestamp) if glob.has_magic(csv_file) else [csv_file]
+        saved_count = 0
+        for path in csv_files:
+            try:
+                crawled_at = datetime.datetime.fromtimestamp(crawl_file_timestamp(path))
+                df = pd.read_csv(path, encoding='utf-8-sig')
+                saved_count += self.save_snapshot(Product.from_frame(df), crawled_at)
+            except Exception as e:
+                print(f"이력 파일 '{path}' 처리 중 오류 발생: {e}")
+        return saved_count
+    
+    def list_crawls(self):
+        """이력 테이블에 저장된 크롤링 시각과 상품 수 목록"""
+        try:
+            self.cursor.execute("""
+            SELECT crawled_at, COUNT(*) FROM product_history
+            GROUP BY crawled_at ORDER BY crawled_at
+            """)
+            return self.cursor.fetchall()
+        except Error as e:
+            print(f"크롤링 목록 조회 중 오류 발생: {e}")
+            return []
+    
+    def get_crawl_diff(self, crawled_at_a, crawled_at_b):
+        """
+        두 크롤링 사이에 추가/삭제/변경된 상품
+        
+        조건에 crawl_date를 함께 주어 두 크롤링 날짜의 파티션만 읽습니다.
+        
+        Args:
+            crawled_at_a (datetime): 이전 크롤링 시각
+            crawled_at_b (datetime): 이후 크롤링 시각
+        
+        Returns:
+            dict: {"추가": [...], "삭제": [...], "변경": [...]} (상품명, 행사유형, 이전/이후 가격 등)
+        """
+        # prev에 없거나 값이 달라진 cur 상품 (null 값도 비교하도록 <=> 사용)
+        diff_query = """
+        SELECT cur.product_name, cur.promotion_type,
+               prev.price AS old_price, cur.price AS new_price,
+               prev.gift_product AS old_gift, cur.gift_product AS new_gift,
+               prev.product_name IS NULL AS is_new
+        FROM product_history cur
+        LEFT JOIN product_history prev
+          ON prev.crawl_date = %s AND prev.crawled_at = %s
+         AND prev.product_name = cur.product_name AND prev.promotion_type = cur.promotion_type
+        WHERE cur.crawl_date = %s AND cur.crawled_at = %s
+          AND (prev.product_name IS NULL
+               OR NOT (prev.price <=> cur.price AND prev.image_url <=> cur.image_url
+                       AND prev.gift_product <=> cur.gift_product))
+        """
+        a = (crawled_at_a.date(), crawled_at_a)
+        b = (crawled_at_b.date(), crawled_at_b)
+        diff = {"추가": [], "삭제": [], "변경": []}
+        cursor = None
+        
+        try:
+            cursor = self.conn.cursor(dictionary=True)
+            cursor.execute(diff_query, a + b)
+            for row in cursor.fetchall():
+                diff["추가" if row.pop("is_new") else "변경"].append(row)
+            
+            # 반대 방향에서 새로 생긴 상품 = 이후 크롤링에서 사라진 상품
+            cursor.execute(diff_query, b + a)
+            for row in cursor.fetchall():
+                if row.pop("is_new"):
+                    diff["삭제"].append(row)
+            
+            print(f"{crawled_at_a} → {crawled_at_b}: 추가 {len(diff['추가'])}개, "
+                  f"삭제 {len(diff['삭제'])}개, 변경 {len(diff['변경'])}개")
+        except Error as e:
+            print(f"크롤링 변경 내역 조회 중 오류 발생: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+        
+        return diff
+    
+    def get_price_history(self, product_name, promotion_type=None):
+        """상품의 크롤링별 가격/행사 이력 [(크롤링 시각, 행사유형, 가격, 덤증정상품)]"""
+        query = """
+        SELECT crawled_at, promotion_type, price, gift_product FROM product_history
+        WHERE product_name = %s
+        """
+        params = [product_name]
+        if promotion_type:
+            query += " AND promotion_type = %s"
+            params.append(promotion_type)
+        query += " ORDER BY crawled_at"
+        
+        try:
+            self.cursor.execute(query, tuple(params))
+            return self.cursor.fetchall()
+        except Error as e:
+            print(f"가격 이력 조회 중 오류 발생: {e}")
+            return []
+    
+    def drop_history_before(self, cutoff_date):
+        """cutoff_date 이전 날짜의 이력을 파티션 단위로 삭제 (행 단위 DELETE 없음)"""
+        cutoff_days = self._to_days(cutoff_date)
+        dropped = [name for name, bound in self._history_partitions()
+                   if bound is not None and bound <= cutoff_days]
+        if not dropped:
+            print(f"{cutoff_date} 이전 이력 파티션이 없습니다.")
+            return []
+        
+        try:
+            self.cursor.execute(f"ALTER TABLE product_history DROP PARTITION {', '.join(dropped)}")
+            print(f"{cutoff_date} 이전 이력 파티션 {len(dropped)}개 삭제: {', '.join(dropped)}")
+        except Error as e:
+            print(f"이력 파티션 삭제 중 오류 발생: {e}")
+            return []
+        return dropped
+    
+    @staticmethod
+    def _to_days(day):
+        """MySQL TO_DAYS()와 같은 값"""
+        return day.toordinal() + 365
+    
+    def _history_partitions(self):
+        """이력 테이블의 [(파티션 이름, TO_DAYS 상한 - MAXVALUE는 None)] (범위 순서)"""
+        self.cursor.execute("""
+        SELECT partition_name, partition_description FROM information_schema.partitions
+        WHERE table_schema = DATABASE() AND table_name = 'product_history'
+        ORDER BY partition_ordinal_position
+        """)
+        return [(name, None if bound == 'MAXVALUE' else int(bound))
+                for name, bound in self.cursor.fetchall()]
+    
+    def _ensure_history_partition(self, crawl_date):
+        """
+        crawl_date 하루만 담는 파티션 준비
+        
+        해당 날짜를 포함하는 파티션(보통 pmax)을 REORGANIZE로 [이전 날짜들 | 해당 날짜 | 이후]로 나눕니다.
+        파티션 이름 p_lt_YYYYMMDD는 "이 날짜 미만"을 뜻합니다.
+        """
+        day = self._to_days(crawl_date)
+        lower = None
+        for name, bound in self._history_partitions():
+            if bound is None or day < bound:
+                break
+            lower = bound
+        
+        # 이미 하루 단위 파티션이 있음
+        if lower == day and bound == day + 1:
+            return
+        
+        next_date = crawl_date + datetime.timedelta(days=1)
+        partitions = []
+        if lower is None or lower < day:
+            partitions.append(f"PARTITION p_lt_{crawl_date:%Y%m%d} VALUES LESS THAN ({day})")
+        partitions.append(f"PARTITION p_lt_{next_date:%Y%m%d} VALUES LESS THAN ({day + 1})")
+        if bound is None or bound > day + 1:
+            partitions.append(f"PARTITION {name} VALUES LESS THAN ({'MAXVALUE' if bound is None else bound})")
+        
+        self.cursor.execute(f"ALTER TABLE product_history REORGANIZE PARTITION {name} INTO ({', '.join(partitions)})")
+    
+    def _event_type_mapping(self):
+        """행사 유형 event_id -> id"""
+        event_type_mapping = {}
+        self.cursor.execute("SELECT id, event_id FROM event_types")
+        for id, event_id in self.cursor.fetchall():
+            event_type_mapping[event_id] = id
+        return event_type_mapping
+    
     def get_product_count(self):
         """DB에 저장된 상품 수 확인"""
         try:
@@ -723,26 +4531,58 @@ class GS25DatabaseManager:
             return 0
     
     def get_event_type_stats(self):
-        """행사 유형별 상품 통계"""
+        """행사 유형별 상품 통계 (event_product_stats에서 조회)"""
         try:
             if not self.conn or not self.conn.is_connected():
                 print("데이터베이스에 연결되어 있지 않습니다.")
                 return {}
                 
             query = """
-            SELECT et.event_name, COUNT(ep.id) as product_count
+            SELECT et.event_name, COALESCE(SUM(s.product_count), 0) as product_count
             FROM event_types et
-            LEFT JOIN event_products ep ON et.id = ep.event_type_id
+            LEFT JOIN event_product_stats s ON et.id = s.event_type_id
             GROUP BY et.id, et.event_name
             """
             self.cursor.execute(query)
             
             stats = {}
             for event_name, count in self.cursor.fetchall():
-                stats[event_name] = count
+                stats[event_name] = int(count)
                 
             return stats
             
         except Error as e:
             print(f"행사 유형별 통계 확인 중 오류 발생: {e}")
-            return {}
\ No newline at end of file
+            return {}
+    
+    def get_product_stats(self):
+        """행사 유형/행사별 상품 수와 최저/최고/평균 가격 목록"""
+        try:
+            if not self.conn or not self.conn.is_connected():
+                print("데이터베이스에 연결되어 있지 않습니다.")
+                return []
+            
+            self.cursor.execute("""
+            SELECT et.event_name, s.promotion_type, s.product_count, s.min_price, s.max_price,
+                   s.price_sum / NULLIF(s.product_count, 0)
+            FROM event_product_stats s
+            LEFT JOIN event_types et ON et.id = s.event_type_id
+            WHERE s.product_count > 0
+            ORDER BY s.event_type_id, s.promotion_type
+            """)
+            
+            stats = []
+            for event_name, promotion_type, count, min_price, max_price, avg_price in self.cursor.fetchall():
+                stats.append({
+                    "event_name": event_name,
+                    "promotion_type": promotion_type,
+                    "product_count": count,
+                    "min_price": min_price,
+                    "max_price": max_price,
+                    "avg_price": round(float(avg_price)) if avg_price is not None else None
+                })
+            return stats
+            
+        except Error as e:
+            print(f"행사 상품 통계 확인 중 오류 발생: {e}")
+            return []
\ No newline at end of file
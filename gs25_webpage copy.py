@@ -1,7 +1,12 @@
 # app.py
-from flask import Flask, render_template, request, redirect
+from flask import Flask, render_template, request, redirect, jsonify
 import mysql.connector
+import contextlib
 import os
+import queue
+import sys
+import threading
+import time
 
 app = Flask(__name__)
 
@@ -13,108 +18,342 @@ DB_CONFIG = {
     'database': 'gs25_db'
 }
 
+# 연결 풀 설정
+POOL_CONFIG = {
+    'size': 5,                   # 최대 연결 수
+    'checkout_timeout': 5.0,     # 빈 연결을 기다릴 최대 시간(초)
+    'health_check_interval': 30  # 이 시간(초) 이상 쉬던 연결은 꺼내기 전에 ping으로 확인
+}
+
+class PoolTimeoutError(Exception):
+    """checkout_timeout 안에 빈 연결을 얻지 못함"""
+
+class DatabasePool:
+    """
+    크기가 제한된 MySQL 연결 풀
+    
+    요청마다 연결/인증하는 대신 연결을 재사용합니다. 연결은 필요할 때 size개까지 만들고,
+    모두 사용 중이면 checkout_timeout초까지 반환을 기다립니다.
+    """
+    
+    def __init__(self, config, size=5, checkout_timeout=5.0, health_check_interval=30):
+        """
+        Args:
+            config (dict): mysql.connector.connect에 전달할 연결 정보
+            size (int): 최대 연결 수
+            checkout_timeout (float): 빈 연결을 기다릴 최대 시간(초)
+            health_check_interval (float): 이 시간(초) 이상 쉬던 연결은 꺼내기 전에 ping으로 확인
+        """
+        self.config = config
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.idle = queue.LifoQueue()  # (연결, 반환 시각) - 최근에 쓴 연결부터 재사용
+        self.lock = threading.Lock()
+        self.created = 0
+        self.metrics = {
+            'checkouts': 0, 'waits': 0, 'timeouts': 0, 'connections_created': 0,
+            'connections_discarded': 0, 'health_checks': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0
+        }
+    
+    @contextlib.contextmanager
+    def connection(self):
+        """풀에서 연결을 빌려 사용 후 반환 (연결 오류가 나면 버리고 다음에 새로 만듦)"""
+        conn = self._checkout()
+        broken = False
+        try:
+            yield conn
+        except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+            broken = True
+            raise
+        finally:
+            if broken:
+                self._discard(conn)
+            else:
+                self.idle.put((conn, time.monotonic()))
+    
+    def stats(self):
+        """풀 지표 (사용 중/대기 중 연결 수 포함)"""
+        with self.lock:
+            stats = dict(self.metrics, size=self.size, open=self.created,
+                         idle=self.idle.qsize(), in_use=self.created - self.idle.qsize())
+        stats['avg_wait_ms'] = round(stats['wait_seconds'] * 1000 / max(stats['checkouts'], 1), 2)
+        return stats
+    
+    def _checkout(self):
+        start_time = time.monotonic()
+        waited = False
+        while True:
+            try:
+                conn, returned_at = self.idle.get_nowait()
+            except queue.Empty:
+                # 여유가 있으면 새 연결, 없으면 반환될 때까지 대기
+                if self._reserve():
+                    conn = self._create()
+                    break
+                remaining = self.checkout_timeout - (time.monotonic() - start_time)
+                if remaining <= 0:
+                    self._count('timeouts')
+                    raise PoolTimeoutError(f"{self.checkout_timeout}초 안에 DB 연결을 얻지 못했습니다 (최대 {self.size}개 사용 중)")
+                waited = True
+                try:
+                    conn, returned_at = self.idle.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+            
+            # 오래 쉬던 연결은 서버가 끊었을 수 있으므로 확인
+            if time.monotonic() - returned_at >= self.health_check_interval:
+                self._count('health_checks')
+                try:
+                    conn.ping(reconnect=False)
+                except Exception:
+                    self._discard(conn)
+                    continue
+            break
+        
+        wait = time.monotonic() - start_time
+        with self.lock:
+            self.metrics['checkouts'] += 1
+            self.metrics['waits'] += waited
+            self.metrics['wait_seconds'] += wait
+            self.metrics['max_wait_seconds'] = max(self.metrics['max_wait_seconds'], wait)
+        return conn
+    
+    def _reserve(self):
+        with self.lock:
+            if self.created >= self.size:
+                return False
+            self.created += 1
+            return True
+    
+    def _create(self):
+        try:
+            # 조회만 하므로 autocommit - 재사용한 연결이 이전 트랜잭션의 스냅샷을 보지 않도록
+            conn = mysql.connector.connect(autocommit=True, **self.config)
+        except Exception:
+            with self.lock:
+                self.created -= 1
+            raise
+        self._count('connections_created')
+        return conn
+    
+    def _discard(self, conn):
+        with self.lock:
+            self.created -= 1
+            self.metrics['connections_discarded'] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    def _count(self, name):
+        with self.lock:
+            self.metrics[name] += 1
+
+db_pool = DatabasePool(DB_CONFIG, **POOL_CONFIG)
+
+@contextlib.contextmanager
+def db_cursor():
+    """풀에서 빌린 연결의 딕셔너리 커서 (라우트에서 with db_cursor() as cursor: 로 사용)"""
+    with db_pool.connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+# 정렬 기준 -> 정렬 컬럼 (가격은 문자열 대신 마이그레이션으로 추가한 정수 컬럼으로 정렬)
+SORT_COLUMNS = {
+    'id': 'id',
+    '상품명': '상품명',
+    '가격': '가격값'
+}
+
+# ngram 전문 검색 인덱스의 최소 토큰 길이 (이보다 짧은 검색어는 LIKE로만 검색)
+NGRAM_TOKEN_SIZE = 2
+
+def build_product_query(promotion_type='', category='', keyword='', sort_by='id', sort_order='DESC'):
+    """
+    상품 조회 쿼리와 파라미터 생성 (모든 라우트가 같은 쿼리를 사용해야 인덱스 점검 결과와 일치함)
+    
+    Args:
+        promotion_type (str): 행사유형 조건
+        category (str): 행사분류 조건
+        keyword (str): 상품명 검색어
+        sort_by (str): 정렬 기준 (id, 상품명, 가격)
+        sort_order (str): 정렬 방향 (ASC, DESC)
+    """
+    query = """
+        SELECT id, 이미지URL as image_url, 상품명 as product_name, 
+              가격 as price, 행사유형 as promotion_type, 행사분류 as event_category
+        FROM gs25_products
+        WHERE 1=1
+    """
+    params = []
+    
+    # 필터 조건 추가
+    if promotion_type:
+        query += " AND 행사유형 = %s"
+        params.append(promotion_type)
+        
+    if category:
+        query += " AND 행사분류 = %s"
+        params.append(category)
+    
+    if keyword:
+        # 전문 검색 인덱스로 후보를 좁힌 뒤 LIKE로 부분 일치 확인
+        if len(keyword) >= NGRAM_TOKEN_SIZE:
+            query += " AND MATCH(상품명) AGAINST (%s IN BOOLEAN MODE)"
+            params.append('"' + keyword.replace('"', ' ') + '"')
+        query += " AND 상품명 LIKE %s"
+        params.append(f'%{keyword}%')
+    
+    # 정렬 조건 추가
+    if sort_by not in SORT_COLUMNS:
+        sort_by = 'id'
+    
+    if sort_order not in ('ASC', 'DESC'):
+        sort_order = 'DESC'
+    
+    query += f" ORDER BY {SORT_COLUMNS[sort_by]} {sort_order}"
+    return query, tuple(params)
+
 def get_products():
     """데이터베이스에서 GS25 상품 정보를 가져오는 함수"""
-    conn = None
-    cursor = None
     products = []
     
     try:
-        # 데이터베이스 연결
-        conn = mysql.connector.connect(**DB_CONFIG)
-        cursor = conn.cursor(dictionary=True)
-        
-        # 한글 컬럼명 사용
-        cursor.execute("""
-            SELECT id, 이미지URL as image_url, 상품명 as product_name, 
-                  가격 as price, 행사유형 as promotion_type, 행사분류 as event_category
-            FROM gs25_products
-            ORDER BY id DESC
-        """)
+        # 풀에서 데이터베이스 연결 빌리기
+        with db_cursor() as cursor:
+            # 한글 컬럼명 사용
+            cursor.execute(*build_product_query())
         
-        products = cursor.fetchall()
+            products = cursor.fetchall()
         
-        # 결과 확인
-        if products:
-            print("첫 번째 상품 데이터:", products[0])
+            # 결과 확인
+            if products:
+                print("첫 번째 상품 데이터:", products[0])
         
     except Exception as e:
         print(f"데이터베이스 조회 중 오류 발생: {e}")
-    finally:
-        if cursor:
-            cursor.close()
-        if conn and conn.is_connected():
-            conn.close()
     
     return products
 
+def get_product_stats():
+    """
+    행사유형/행사분류 조합별 상품 수와 가격 통계 조회
+    
+    gs25_products를 매번 세지 않고 connect_Sql 마이그레이션이 만든 요약 테이블(gs25_product_stats)을 읽습니다.
+    gs25_products가 바뀔 때마다 트리거가 갱신하므로 조합 수만큼의 행만 읽습니다.
+    """
+    stats = []
+    
+    try:
+        with db_cursor() as cursor:
+            cursor.execute("""
+                SELECT 행사유형 as promotion_type, 행사분류 as event_category, product_count,
+                      min_price, max_price, price_sum / NULLIF(price_count, 0) as avg_price
+                FROM gs25_product_stats
+                WHERE product_count > 0
+                ORDER BY 행사유형, 행사분류
+            """)
+            
+            stats = cursor.fetchall()
+            for row in stats:
+                row['avg_price'] = round(float(row['avg_price'])) if row['avg_price'] is not None else None
+    
+    except Exception as e:
+        print(f"상품 통계 조회 중 오류 발생: {e}")
+    
+    return stats
+
+def count_products(stats, promotion_type='', category=''):
+    """
+    통계에서 행사유형/행사분류 조건에 맞는 상품 수 합계
+    
+    Args:
+        stats (list): get_product_stats() 결과
+        promotion_type (str): 행사유형 조건
+        category (str): 행사분류 조건
+    """
+    return sum(row['product_count'] for row in stats
+               if (not promotion_type or row['promotion_type'] == promotion_type)
+               and (not category or row['event_category'] == category))
+
+def product_facets(stats, promotion_type='', category=''):
+    """
+    필터 선택지별 상품 수 (행사유형은 선택한 행사분류 안에서, 행사분류는 선택한 행사유형 안에서 셈)
+    
+    Args:
+        stats (list): get_product_stats() 결과
+        promotion_type (str): 현재 선택한 행사유형
+        category (str): 현재 선택한 행사분류
+    """
+    facets = {'promotion': {}, 'category': {}}
+    for row in stats:
+        if not category or row['event_category'] == category:
+            facets['promotion'][row['promotion_type']] = (
+                facets['promotion'].get(row['promotion_type'], 0) + row['product_count'])
+        if not promotion_type or row['promotion_type'] == promotion_type:
+            facets['category'][row['event_category']] = (
+                facets['category'].get(row['event_category'], 0) + row['product_count'])
+    return facets
+
+def render_products(products, promotion_type='', category='', total_count=None, **context):
+    """
+    상품 목록 페이지 렌더링 - 상품 수와 필터별 개수는 요약 테이블에서 읽음
+    
+    Args:
+        products (list): 표시할 상품 목록
+        promotion_type (str): 현재 행사유형 조건
+        category (str): 현재 행사분류 조건
+        total_count (int): 요약 테이블로 셀 수 없는 조건(검색어)일 때 직접 넘기는 상품 수
+    """
+    stats = get_product_stats()
+    if total_count is None:
+        # 요약 테이블이 아직 없으면(마이그레이션 전) 가져온 목록 수로 표시
+        total_count = count_products(stats, promotion_type, category) if stats else len(products)
+    return render_template('index.html', products=products, total_count=total_count,
+                          facets=product_facets(stats, promotion_type, category),
+                          current_promotion=promotion_type, current_category=category, **context)
+
 @app.route('/')
 def index():
     """메인 페이지 라우트"""
     products = get_products()
-    return render_template('index.html', products=products)
+    return render_products(products)
 
 @app.route('/products/<promotion_type>')
 def products_by_promotion(promotion_type):
     """행사유형별 상품 조회 페이지"""
-    conn = None
-    cursor = None
     products = []
     
     try:
-        conn = mysql.connector.connect(**DB_CONFIG)
-        cursor = conn.cursor(dictionary=True)
+        with db_cursor() as cursor:
+            cursor.execute(*build_product_query(promotion_type=promotion_type))
         
-        cursor.execute("""
-            SELECT id, 이미지URL as image_url, 상품명 as product_name, 
-                  가격 as price, 행사유형 as promotion_type, 행사분류 as event_category
-            FROM gs25_products
-            WHERE 행사유형 = %s
-            ORDER BY id DESC
-        """, (promotion_type,))
-        
-        products = cursor.fetchall()
+            products = cursor.fetchall()
         
     except Exception as e:
         print(f"데이터베이스 조회 중 오류 발생: {e}")
-    finally:
-        if cursor:
-            cursor.close()
-        if conn and conn.is_connected():
-            conn.close()
     
-    return render_template('index.html', products=products, current_promotion=promotion_type)
+    return render_products(products, promotion_type=promotion_type)
 
 @app.route('/category/<event_category>')
 def products_by_category(event_category):
     """카테고리별 상품 조회 페이지"""
-    conn = None
-    cursor = None
     products = []
     
     try:
-        conn = mysql.connector.connect(**DB_CONFIG)
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute("""
-            SELECT id, 이미지URL as image_url, 상품명 as product_name, 
-                  가격 as price, 행사유형 as promotion_type, 행사분류 as event_category
-            FROM gs25_products
-            WHERE 행사분류 = %s
-            ORDER BY id DESC
-        """, (event_category,))
+        with db_cursor() as cursor:
+            cursor.execute(*build_product_query(category=event_category))
         
-        products = cursor.fetchall()
+            products = cursor.fetchall()
         
     except Exception as e:
         print(f"데이터베이스 조회 중 오류 발생: {e}")
-    finally:
-        if cursor:
-            cursor.close()
-        if conn and conn.is_connected():
-            conn.close()
     
-    return render_template('index.html', products=products, current_category=event_category)
+    return render_products(products, category=event_category)
 
 # 검색 기능을 위한 라우트 추가
 @app.route('/search')
@@ -124,33 +363,19 @@ def search():
     if not keyword:
         return redirect('/')
         
-    conn = None
-    cursor = None
     products = []
     
     try:
-        conn = mysql.connector.connect(**DB_CONFIG)
-        cursor = conn.cursor(dictionary=True)
+        with db_cursor() as cursor:
+            cursor.execute(*build_product_query(keyword=keyword))
         
-        cursor.execute("""
-            SELECT id, 이미지URL as image_url, 상품명 as product_name, 
-                  가격 as price, 행사유형 as promotion_type, 행사분류 as event_category
-            FROM gs25_products
-            WHERE 상품명 LIKE %s
-            ORDER BY id DESC
-        """, (f'%{keyword}%',))
-        
-        products = cursor.fetchall()
+            products = cursor.fetchall()
         
     except Exception as e:
         print(f"데이터베이스 조회 중 오류 발생: {e}")
-    finally:
-        if cursor:
-            cursor.close()
-        if conn and conn.is_connected():
-            conn.close()
     
-    return render_template('index.html', products=products, search_keyword=keyword)
+    # 검색어 조건은 요약 테이블에 없으므로 검색 결과 수를 그대로 표시
+    return render_products(products, total_count=len(products), search_keyword=keyword)
 
 # 필터링 기능을 위한 라우트 추가
 @app.route('/filter')
@@ -160,62 +385,94 @@ def filter_products():
     sort_by = request.args.get('sort_by', 'id')
     sort_order = request.args.get('sort_order', 'DESC')
     
-    conn = None
-    cursor = None
+    # 정렬 기준/방향이 잘못된 경우 기본값(최신순)으로
+    if sort_by not in SORT_COLUMNS:
+        sort_by = 'id'
+    
+    if sort_order not in ('ASC', 'DESC'):
+        sort_order = 'DESC'
+    
     products = []
     
     try:
-        conn = mysql.connector.connect(**DB_CONFIG)
-        cursor = conn.cursor(dictionary=True)
-        
-        # 기본 쿼리 구성
-        query = """
-            SELECT id, 이미지URL as image_url, 상품명 as product_name, 
-                  가격 as price, 행사유형 as promotion_type, 행사분류 as event_category
-            FROM gs25_products
-            WHERE 1=1
-        """
-        params = []
-        
-        # 필터 조건 추가
-        if promotion_type:
-            query += " AND 행사유형 = %s"
-            params.append(promotion_type)
-            
-        if category:
-            query += " AND 행사분류 = %s"
-            params.append(category)
-        
-        # 정렬 조건 추가
-        valid_sort_fields = ['id', '상품명', '가격']
-        valid_sort_orders = ['ASC', 'DESC']
-        
-        if sort_by not in valid_sort_fields:
-            sort_by = 'id'
-        
-        if sort_order not in valid_sort_orders:
-            sort_order = 'DESC'
-            
-        query += f" ORDER BY {sort_by} {sort_order}"
-        
-        cursor.execute(query, tuple(params))
-        products = cursor.fetchall()
+        with db_cursor() as cursor:
+            cursor.execute(*build_product_query(promotion_type, category, sort_by=sort_by, sort_order=sort_order))
+            products = cursor.fetchall()
         
     except Exception as e:
         print(f"데이터베이스 조회 중 오류 발생: {e}")
-    finally:
-        if cursor:
-            cursor.close()
-        if conn and conn.is_connected():
-            conn.close()
     
-    return render_template('index.html', products=products, 
-                          current_promotion=promotion_type, 
-                          current_category=category,
+    return render_products(products,
+                          promotion_type=promotion_type,
+                          category=category,
                           current_sort=sort_by,
                           current_order=sort_order)
 
+# 웹페이지가 보여주는 gs25_products의 행사유형/행사분류별 통계 (트리거가 갱신하는 gs25_product_stats 조회)
+@app.route('/stats')
+def product_stats():
+    stats = get_product_stats()
+    return jsonify({
+        'total': sum(row['product_count'] for row in stats),
+        'stats': stats
+    })
+
+# 연결 풀 지표
+@app.route('/pool')
+def pool_stats():
+    return jsonify(db_pool.stats())
+
+def explain_routes():
+    """각 라우트 쿼리의 EXPLAIN 결과로 인덱스 사용 여부 점검 (python "gs25_webpage copy.py" --explain)"""
+    try:
+        with db_cursor() as cursor:
+            # 실제 데이터에 있는 값으로 점검
+            cursor.execute("SELECT 행사유형, 행사분류, 상품명 FROM gs25_products LIMIT 1")
+            sample = cursor.fetchone()
+            if not sample:
+                print("점검할 상품 데이터가 없습니다.")
+                return
+            promotion_type, category = sample['행사유형'], sample['행사분류']
+            keyword = sample['상품명'][:NGRAM_TOKEN_SIZE]
+        
+            checks = [
+                ("/", {}),
+                (f"/products/{promotion_type}", {'promotion_type': promotion_type}),
+                (f"/category/{category}", {'category': category}),
+                (f"/search?keyword={keyword}", {'keyword': keyword}),
+            ]
+            for sort_by in SORT_COLUMNS:
+                for filters in ({}, {'promotion_type': promotion_type}, {'category': category},
+                                {'promotion_type': promotion_type, 'category': category}):
+                    route = "/filter?" + "&".join(f"{name}={value}" for name, value in filters.items())
+                    checks.append((f"{route}&sort_by={sort_by}", dict(filters, sort_by=sort_by)))
+        
+            problems = 0
+            for route, options in checks:
+                query, params = build_product_query(**options)
+                cursor.execute("EXPLAIN " + query, params)
+                plan = cursor.fetchall()
+                uses_index = all(row['key'] and row['type'] != 'ALL' for row in plan)
+                filesort = any('filesort' in (row['Extra'] or '') for row in plan)
+                # 검색은 전문 검색 결과를 정렬하므로 filesort 허용
+                ok = uses_index and (not filesort or 'keyword' in options)
+                problems += not ok
+                print(f"[{'OK' if ok else '확인 필요'}] {route}: "
+                      + ", ".join(f"{row['type']}/{row['key']}" for row in plan)
+                      + (" (filesort)" if filesort else ""))
+        
+            print(f"점검 완료: {len(checks)}개 쿼리 중 {problems}개 확인 필요"
+                  + (" (데이터가 적으면 옵티마이저가 전체 스캔을 고를 수 있습니다)" if problems else ""))
+        
+    except Exception as e:
+        print(f"쿼리 점검 중 오류 발생: {e}")
+
 if __name__ == '__main__':
+    # 인덱스 점검만 하고 종료
+    if '--explain' in sys.argv:
+        explain_routes()
+        sys.exit()
+    
     # templates 폴더가 없으면 생성
     if not os.path.exists('templates'):
         os.makedirs('templates')
@@ -349,20 +606,20 @@ if __name__ == '__main__':
                         <label class="form-label">행사유형</label>
                         <select class="form-select" name="promotion_type">
                             <option value="">전체</option>
-                            <option value="1+1" {% if current_promotion == '1+1' %}selected{% endif %}>1+1</option>
-                            <option value="2+1" {% if current_promotion == '2+1' %}selected{% endif %}>2+1</option>
-                            <option value="할인" {% if current_promotion == '할인' %}selected{% endif %}>할인</option>
-                            <option value="덤증정" {% if current_promotion == '덤증정' %}selected{% endif %}>덤증정</option>
+                            <option value="1+1" {% if current_promotion == '1+1' %}selected{% endif %}>1+1 ({{ facets.promotion.get('1+1', 0) }})</option>
+                            <option value="2+1" {% if current_promotion == '2+1' %}selected{% endif %}>2+1 ({{ facets.promotion.get('2+1', 0) }})</option>
+                            <option value="할인" {% if current_promotion == '할인' %}selected{% endif %}>할인 ({{ facets.promotion.get('할인', 0) }})</option>
+                            <option value="덤증정" {% if current_promotion == '덤증정' %}selected{% endif %}>덤증정 ({{ facets.promotion.get('덤증정', 0) }})</option>
                         </select>
                     </div>
                     <div class="col-md-3">
                         <label class="form-label">카테고리</label>
                         <select class="form-select" name="category">
                             <option value="">전체</option>
-                            <option value="음료" {% if current_category == '음료' %}selected{% endif %}>음료</option>
-                            <option value="과자" {% if current_category == '과자' %}selected{% endif %}>과자</option>
-                            <option value="식품" {% if current_category == '식품' %}selected{% endif %}>식품</option>
-                            <option value="생활용품" {% if current_category == '생활용품' %}selected{% endif %}>생활용품</option>
+                            <option value="음료" {% if current_category == '음료' %}selected{% endif %}>음료 ({{ facets.category.get('음료', 0) }})</option>
+                            <option value="과자" {% if current_category == '과자' %}selected{% endif %}>과자 ({{ facets.category.get('과자', 0) }})</option>
+                            <option value="식품" {% if current_category == '식품' %}selected{% endif %}>식품 ({{ facets.category.get('식품', 0) }})</option>
+                            <option value="생활용품" {% if current_category == '생활용품' %}selected{% endif %}>생활용품 ({{ facets.category.get('생활용품', 0) }})</option>
                         </select>
                     </div>
                     <div class="col-md-3">
@@ -400,7 +657,7 @@ if __name__ == '__main__':
                 
                 <!-- 검색 결과 수 표시 -->
                 {% if products %}
-                <p class="search-count">총 {{ products|length }}개의 상품</p>
+                <p class="search-count">총 {{ total_count }}개의 상품</p>
                 {% endif %}
             </div>
         </div>
@@ -0,0 +1,157 @@
+"""
+connect_Sql 적재 도우미 테스트 - MySQL 서버 없이 INSERT 파라미터와 LOAD DATA 임시 파일 확인
+
+    python -m unittest discover tests
+"""
+import importlib.util
+import os
+import sys
+import unittest
+from unittest import mock
+
+import mysql.connector
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_connect_sql_module():
+    """
+    파일명에 공백이 있는 적재 스크립트를 모듈로 불러오기
+
+    스크립트 끝의 사용 예(csv_to_mysql 호출)가 실제 DB에 연결하지 않도록 불러오는 동안 연결을 막습니다.
+    """
+    spec = importlib.util.spec_from_file_location("connect_sql", os.path.join(ROOT_DIR, "connect_Sql copy.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    error = mysql.connector.Error("테스트에서는 DB에 연결하지 않습니다.")
+    with mock.patch("mysql.connector.connect", side_effect=error), mock.patch("builtins.print"):
+        spec.loader.exec_module(module)
+    return module
+
+
+connect_sql = load_connect_sql_module()
+
+
+class RecordingCursor:
+    """실행한 SQL을 기록하고, LOAD DATA를 실행할 때 임시 파일 내용을 읽어 두는 커서"""
+
+    def __init__(self):
+        self.statements = []
+        self.loaded_text = None
+        self.rowcount = 0
+
+    def execute(self, statement, params=None):
+        self.statements.append(statement)
+        if "LOAD DATA LOCAL INFILE" in statement:
+            path = statement.split("INFILE '", 1)[1].split("'", 1)[0]
+            with open(path, "rb") as f:
+                self.loaded_text = f.read().decode("utf-8")
+            self.rowcount = self.loaded_text.count("\n")
+
+
+def normalize_sql(query):
+    return " ".join(query.split())
+
+
+def product_frame(rows):
+    return pd.DataFrame(rows, columns=connect_sql.PRODUCT_COLUMNS + ["덤증정상품"])
+
+
+class ProductRowsTest(unittest.TestCase):
+
+    def test_rows_follow_table_columns_with_price_value(self):
+        df = product_frame([
+            ["http://img/1.jpg", "콜라", "1,800원", "1+1", "ONE_TO_ONE", ""],
+            ["http://img/2.jpg", "우유", "2,500", "2+1", "TWO_TO_ONE", "빵"]
+        ])
+        self.assertEqual(connect_sql.product_rows(df), [
+            ("http://img/1.jpg", "콜라", "1,800원", "1+1", "ONE_TO_ONE", 1800),
+            ("http://img/2.jpg", "우유", "2,500", "2+1", "TWO_TO_ONE", 2500)
+        ])
+
+    def test_missing_values_become_null(self):
+        df = product_frame([[None, "콜라", None, "1+1", float("nan"), None]])
+        self.assertEqual(connect_sql.product_rows(df), [(None, "콜라", None, "1+1", None, None)])
+
+    def test_insert_in_batches(self):
+        cursor = mock.Mock()
+        connect_sql.insert_in_batches(cursor, [(i,) for i in range(5)], batch_size=2)
+        self.assertEqual([len(call.args[1]) for call in cursor.executemany.call_args_list], [2, 2, 1])
+
+
+class LoadDataInfileTest(unittest.TestCase):
+
+    def test_escape_load_data_value(self):
+        self.assertEqual(connect_sql.escape_load_data_value("C:\\images\\1.jpg"), "C:\\\\images\\\\1.jpg")
+        self.assertEqual(connect_sql.escape_load_data_value("콜라"), "콜라")
+        self.assertIsNone(connect_sql.escape_load_data_value(None))
+        self.assertEqual(connect_sql.escape_load_data_value(1800), 1800)
+
+    def test_temp_file_uses_lf_escapes_and_null_marker(self):
+        df = product_frame([
+            ["C:\\img\\1.jpg", "콜라 \"제로\"", "1,800", "1+1", "ONE_TO_ONE", "무시되는 컬럼"],
+            [None, "우유", "2,500", "2+1", None, ""]
+        ])
+        cursor = RecordingCursor()
+        self.assertEqual(connect_sql.load_data_infile(cursor, df), 2)
+
+        self.assertNotIn("\r", cursor.loaded_text)
+        self.assertEqual(cursor.loaded_text.split("\n"), [
+            'C:\\\\img\\\\1.jpg,"콜라 ""제로""","1,800",1+1,ONE_TO_ONE',
+            '\\N,우유,"2,500",2+1,\\N',
+            ''
+        ])
+        self.assertIn("ON DUPLICATE KEY UPDATE", cursor.statements[-1])
+
+    def test_stats_are_rebuilt_once_after_load(self):
+        cursor = RecordingCursor()
+        conn = mock.Mock()
+        with mock.patch("builtins.print"):
+            with connect_sql.defer_product_stats(cursor, conn):
+                cursor.execute("INSERT INTO gs25_products VALUES (1)")
+                cursor.execute("INSERT INTO gs25_products VALUES (2)")
+
+        self.assertEqual(cursor.statements[0], "SET @gs25_skip_product_stats = 1")
+        self.assertEqual(cursor.statements[3], "SET @gs25_skip_product_stats = NULL")
+        self.assertEqual(sum("DELETE FROM gs25_product_stats" in statement for statement in cursor.statements), 1)
+        conn.commit.assert_called_once()
+
+    def test_triggers_honour_skip_variable(self):
+        triggers = [routine for routine in connect_sql.PRODUCT_STATS_ROUTINES if "CREATE TRIGGER" in routine]
+        self.assertEqual(len(triggers), 3)
+        for trigger in triggers:
+            self.assertIn("IF @gs25_skip_product_stats IS NULL THEN", trigger)
+
+
+class MigrationTest(unittest.TestCase):
+
+    def test_route_indexes_are_not_redundant(self):
+        names = [name for name, _ in connect_sql.ROUTE_INDEXES]
+        self.assertFalse(set(names) & set(connect_sql.REDUNDANT_INDEXES))
+        # 조건 없는 상품명순 정렬은 uk_product(상품명, 행사유형)로 충분
+        self.assertNotIn("상품명", [columns for _, columns in connect_sql.ROUTE_INDEXES])
+
+    def test_unique_key_backs_up_duplicate_rows(self):
+        cursor = mock.Mock(rowcount=3)
+        cursor.fetchone.side_effect = [(0,), (3,)]  # uk_product 없음, 중복 3개 행
+        with mock.patch("builtins.print"):
+            connect_sql.add_product_unique_key(cursor, mock.Mock(), 5000)
+
+        statements = [normalize_sql(call.args[0]) for call in cursor.execute.call_args_list[2:]]
+        self.assertTrue(statements[0].startswith("CREATE TABLE IF NOT EXISTS gs25_products_duplicates"))
+        self.assertTrue(statements[1].startswith("INSERT IGNORE INTO gs25_products_duplicates SELECT DISTINCT older.*"))
+        self.assertTrue(statements[2].startswith("DELETE older FROM gs25_products older"))
+        self.assertIn("ADD UNIQUE KEY uk_product", statements[3])
+
+    def test_unique_key_without_duplicates_skips_backup(self):
+        cursor = mock.Mock(rowcount=0)
+        cursor.fetchone.side_effect = [(0,), (0,)]
+        with mock.patch("builtins.print"):
+            connect_sql.add_product_unique_key(cursor, mock.Mock(), 5000)
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        self.assertFalse(any("gs25_products_duplicates" in statement for statement in statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
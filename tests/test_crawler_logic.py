@@ -0,0 +1,518 @@
+"""
+크롤러 보조 로직 테스트 - 브라우저나 네트워크 없이 동작하는 구간 분할, 체크포인트 저널, 증분 크롤링, 중복 인덱스, 크롤링 계획, 재시도, 이력 파티션 등
+
+    python -m unittest discover tests
+"""
+import datetime
+import glob
+import importlib.util
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_crawler_module():
+    """파일명에 공백이 있는 크롤러 스크립트를 모듈로 불러오기 (이미 불러왔으면 그대로 사용)"""
+    if "gs25_crawling" in sys.modules:
+        return sys.modules["gs25_crawling"]
+    spec = importlib.util.spec_from_file_location("gs25_crawling", os.path.join(ROOT_DIR, "gs25_crawling copy.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+gs25_crawling = load_crawler_module()
+
+
+class SplitPageShardsTest(unittest.TestCase):
+
+    def assert_covers(self, shards, total_pages):
+        pages = [page for start, end in shards for page in range(start, end + 1)]
+        self.assertEqual(pages, list(range(1, total_pages + 1)))
+
+    def test_shard_count(self):
+        shards = gs25_crawling.split_page_shards(10, shard_count=3)
+        self.assertEqual(shards, [(1, 4), (5, 8), (9, 10)])
+        self.assert_covers(shards, 10)
+
+    def test_shard_size(self):
+        shards = gs25_crawling.split_page_shards(7, shard_size=3)
+        self.assertEqual(shards, [(1, 3), (4, 6), (7, 7)])
+        self.assert_covers(shards, 7)
+
+    def test_more_shards_than_pages(self):
+        self.assertEqual(gs25_crawling.split_page_shards(2, shard_count=5), [(1, 1), (2, 2)])
+
+    def test_default_is_single_shard(self):
+        self.assertEqual(gs25_crawling.split_page_shards(4), [(1, 4)])
+
+    def test_no_pages(self):
+        self.assertEqual(gs25_crawling.split_page_shards(0, shard_count=3), [])
+
+
+def make_product(name, price=1000, promotion="1+1"):
+    return gs25_crawling.Product.create("", name, price, promotion, "ONE_TO_ONE")
+
+
+class CrawlCheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "checkpoint.jsonl")
+        self.checkpoint = gs25_crawling.CrawlCheckpoint(self.path)
+        self.checkpoint.reset()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_pages_and_done(self):
+        self.checkpoint.record_page("ONE_TO_ONE", 1, [make_product("콜라")])
+        self.checkpoint.record_page("ONE_TO_ONE", 2, [make_product("사이다")])
+        self.checkpoint.record_tab_done("ONE_TO_ONE")
+        self.checkpoint.record_page("TWO_TO_ONE", 1, [make_product("우유", promotion="2+1")])
+
+        state = self.checkpoint.load()
+        self.assertTrue(state["ONE_TO_ONE"]["done"])
+        self.assertEqual([product.name for product in state["ONE_TO_ONE"]["pages"][2]], ["사이다"])
+        self.assertFalse(state["TWO_TO_ONE"]["done"])
+        self.assertEqual(state["TWO_TO_ONE"]["pages"][1][0].price, 1000)
+
+    def test_truncated_last_line_is_skipped(self):
+        self.checkpoint.record_page("ONE_TO_ONE", 1, [make_product("콜라")])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "page", "tab": "ONE_TO_ONE", "page": 2, "prod')
+
+        self.assertEqual(list(self.checkpoint.load()["ONE_TO_ONE"]["pages"]), [1])
+
+        # 잘린 줄 뒤에 이어서 기록한 페이지도 읽혀야 함
+        self.checkpoint.record_page("ONE_TO_ONE", 2, [make_product("사이다")])
+        self.assertEqual(list(self.checkpoint.load()["ONE_TO_ONE"]["pages"]), [1, 2])
+
+    def test_reset_and_clear_are_scoped_to_tabs(self):
+        self.checkpoint.record_page("ONE_TO_ONE", 1, [make_product("콜라")])
+        self.checkpoint.record_page("TWO_TO_ONE", 1, [make_product("우유", promotion="2+1")])
+
+        self.checkpoint.reset(["ONE_TO_ONE"])
+        self.assertEqual(list(self.checkpoint.load()), ["TWO_TO_ONE"])
+
+        self.checkpoint.clear(["GIFT"])
+        self.assertEqual(list(self.checkpoint.load()), ["TWO_TO_ONE"])
+
+        self.checkpoint.clear(["TWO_TO_ONE"])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_shard_pages_are_folded_into_journal(self):
+        shard = gs25_crawling.CrawlCheckpoint(self.checkpoint.shard_path("ONE_TO_ONE", 3))
+        shard.record_page("ONE_TO_ONE", 3, [make_product("콜라")])
+        shard.record_tab_done("ONE_TO_ONE")
+        self.assertEqual(self.checkpoint.load_shard("ONE_TO_ONE", 3)[0][0], 3)
+
+        state = self.checkpoint.load()
+        self.assertEqual(list(state["ONE_TO_ONE"]["pages"]), [3])
+        self.assertFalse(state["ONE_TO_ONE"]["done"])  # 구간의 완료 기록은 탭 완료가 아님
+        self.assertFalse(os.path.exists(shard.path))
+
+
+class CrawlDeltaTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.temp_dir, "delta_state.json")
+        self.pages = {page: [make_product(f"상품{page}-{i}") for i in range(2)] for page in range(1, 5)}
+        self.crawl(self.new_tracker(), self.pages, output_dir=os.path.join(self.temp_dir, "first_run"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def new_tracker(self):
+        return gs25_crawling.CrawlDeltaTracker(self.state_path, unchanged_stop_after=2)
+
+    def crawl(self, tracker, pages, total_pages=4, output_dir=None):
+        """stop이 나올 때까지 페이지를 관찰하고 나머지는 이전 결과를 사용 - 크롤링한 페이지 수 반환"""
+        for page in range(1, total_pages + 1):
+            if tracker.observe_page("ONE_TO_ONE", page, pages[page], total_pages):
+                tracker.carry_forward("ONE_TO_ONE", page, total_pages)
+                break
+        tracker.finish(output_dir=output_dir or self.temp_dir)
+        return page
+
+    def delta_rows(self):
+        paths = glob.glob(os.path.join(self.temp_dir, "GS25_변경상품_*.csv"))
+        return pd.read_csv(paths[0]).to_dict("records") if paths else []
+
+    def test_unchanged_pages_are_carried_forward(self):
+        tracker = self.new_tracker()
+        self.assertEqual(self.crawl(tracker, self.pages), 2)
+        self.assertEqual(tracker.skipped_pages, 2)
+        self.assertEqual(len(tracker.current_products()), 8)
+        self.assertEqual(self.delta_rows(), [])
+
+    def test_changed_total_pages_crawls_to_the_end(self):
+        pages = dict(self.pages)
+        pages[5] = [make_product("상품5-0")]
+        tracker = self.new_tracker()
+        self.assertEqual(self.crawl(tracker, pages, total_pages=5), 5)
+        self.assertEqual(tracker.skipped_pages, 0)
+        self.assertEqual([(row["상품명"], row["변경구분"]) for row in self.delta_rows()], [("상품5-0", "추가")])
+
+    def test_finish_writes_added_changed_and_deleted(self):
+        pages = dict(self.pages)
+        pages[1] = [make_product("신상품"), make_product("상품1-0", price=1500)]
+        self.crawl(self.new_tracker(), pages)
+        changes = {row["상품명"]: row["변경구분"] for row in self.delta_rows()}
+        self.assertEqual(changes, {"신상품": "추가", "상품1-0": "변경", "상품1-1": "삭제"})
+
+    def test_incomplete_tab_keeps_unvisited_products(self):
+        tracker = self.new_tracker()
+        tracker.observe_page("ONE_TO_ONE", 1, [make_product("신상품")], 4)
+        tracker.mark_incomplete("ONE_TO_ONE")
+        tracker.finish(output_dir=self.temp_dir)
+        changes = {row["상품명"]: row["변경구분"] for row in self.delta_rows()}
+        self.assertEqual(changes, {"신상품": "추가"})
+
+
+class ProductDedupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "dedup", "index.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_normalize_product_key(self):
+        key = gs25_crawling.normalize_product_key
+        self.assertEqual(key("콜라 500ml", "1+1"), key("콜라　５００ml", "1 + 1"))
+        self.assertEqual(key("  콜라   500ml ", "1+1"), key("콜라 500ml", "1+1"))
+        self.assertNotEqual(key("콜라 500ml", "1+1"), key("콜라 500ml", "2+1"))
+        self.assertNotEqual(key("콜라 500ml", "1+1"), key("콜라500ml", "1+1"))
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = gs25_crawling.BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"상품{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in keys))
+
+        false_positives = sum(f"없는상품{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_index_skips_only_unchanged_products(self):
+        index = gs25_crawling.ProductDedupIndex(self.path)
+        cola = make_product("콜라")
+        self.assertFalse(index.is_unchanged(cola))
+        self.assertEqual(index.stats["bloom_skips"], 1)
+
+        index.add_many([cola])
+        self.assertTrue(index.is_unchanged(make_product("콜라　")))
+        self.assertFalse(index.is_unchanged(make_product("콜라", price=1200)))
+        index.close()
+
+    def test_index_persists_between_runs(self):
+        index = gs25_crawling.ProductDedupIndex(self.path)
+        index.add_many([make_product("콜라")])
+        index.close()
+
+        for use_bloom in (True, False):
+            index = gs25_crawling.ProductDedupIndex(self.path, use_bloom=use_bloom)
+            self.assertTrue(index.is_unchanged(make_product("콜라")))
+            self.assertEqual(index.stats["known"], 1)
+            index.close()
+
+
+class AdaptiveCrawlSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.stats_path = os.path.join(self.temp_dir, "schedule_stats.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def new_scheduler(self, **kwargs):
+        return gs25_crawling.AdaptiveCrawlScheduler(self.stats_path, **kwargs)
+
+    def crawl_twice(self, scheduler):
+        """1페이지는 바뀌고 2, 3페이지는 그대로인 탭을 두 번 크롤링한 것으로 기록"""
+        for run in range(2):
+            scheduler.record("ONE_TO_ONE", 1, [make_product(f"신상품{run}")], total_pages=3)
+            scheduler.record("ONE_TO_ONE", 2, [make_product("콜라")], total_pages=3)
+            scheduler.record("ONE_TO_ONE", 3, [make_product("사이다")], total_pages=3)
+        return scheduler.stats["tabs"]["ONE_TO_ONE"]["last_crawled"]
+
+    def test_unknown_tab_is_crawled_in_full(self):
+        self.assertEqual(self.new_scheduler().plan(["ONE_TO_ONE", "GIFT"]), [("ONE_TO_ONE", None), ("GIFT", None)])
+
+    def test_tab_is_skipped_until_interval_passes(self):
+        scheduler = self.new_scheduler(min_tab_interval=3600, max_tab_interval=86400)
+        last_crawled = self.crawl_twice(scheduler)
+        self.assertEqual(scheduler.tab_interval("ONE_TO_ONE"), 3600)  # 1페이지 변경률이 1
+        self.assertEqual(scheduler.plan(["ONE_TO_ONE"], now=last_crawled + 60), [])
+        self.assertEqual(scheduler.plan(["ONE_TO_ONE"], now=last_crawled + 3601), [("ONE_TO_ONE", [1, 2, 3])])
+
+    def test_budget_prefers_frequently_changing_pages(self):
+        scheduler = self.new_scheduler(budget_pages_per_hour=1)
+        last_crawled = self.crawl_twice(scheduler)
+        self.assertEqual(scheduler.plan(["ONE_TO_ONE"], now=last_crawled + 7200), [("ONE_TO_ONE", [1])])
+
+        # 다음 계획의 예산은 지난 계획 후 경과 시간에 비례
+        self.assertEqual(scheduler.plan(["ONE_TO_ONE"], now=last_crawled + 14400), [("ONE_TO_ONE", [1, 2])])
+
+    def test_tab_interval_follows_change_rate(self):
+        scheduler = self.new_scheduler(min_tab_interval=3600, max_tab_interval=7200)
+        self.assertEqual(scheduler.tab_interval("ONE_TO_ONE"), 3600)  # 관측 전에는 initial_rate
+        self.crawl_twice(scheduler)
+        for page_stats in scheduler.stats["tabs"]["ONE_TO_ONE"]["pages"].values():
+            page_stats["rate"] = 0.5
+        self.assertEqual(scheduler.tab_interval("ONE_TO_ONE"), 5400)
+
+    def test_stats_are_saved(self):
+        scheduler = self.new_scheduler()
+        last_crawled = self.crawl_twice(scheduler)
+        scheduler.save()
+        self.assertEqual(self.new_scheduler().seconds_until_due("ONE_TO_ONE", now=last_crawled + 600), 3000)
+
+
+class RetryTest(unittest.TestCase):
+
+    def test_delay_grows_with_jitter_and_cap(self):
+        policy = gs25_crawling.RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5)
+        for attempt, base in ((1, 1.0), (2, 2.0), (3, 4.0)):
+            for _ in range(50):
+                self.assertTrue(base <= policy.delay(attempt) <= min(base * 1.5, 5.0))
+        self.assertEqual(policy.delay(10), 5.0)
+
+    def test_circuit_breaker_trips_after_threshold(self):
+        breaker = gs25_crawling.CircuitBreaker(failure_threshold=2, cooldown=0, max_trips=2)
+        breaker.record_failure()
+        self.assertIsNone(breaker.opened_at)
+        breaker.record_failure()
+        self.assertEqual(breaker.trips, 1)
+
+        # 멈춘 뒤 한 번 더 시도 - 성공하면 회복
+        breaker.wait_if_open()
+        self.assertTrue(breaker.half_open)
+        breaker.record_success()
+        self.assertFalse(breaker.half_open)
+        self.assertIsNone(breaker.opened_at)
+
+    def test_circuit_breaker_stops_after_max_trips(self):
+        breaker = gs25_crawling.CircuitBreaker(failure_threshold=1, cooldown=0, max_trips=2)
+        breaker.record_failure()
+        breaker.wait_if_open()
+        breaker.record_failure()  # 다시 시도한 첫 요청이 실패하면 바로 차단
+        self.assertEqual(breaker.trips, 2)
+        with self.assertRaises(RuntimeError):
+            breaker.wait_if_open()
+
+    def test_crawler_retry_recovers_before_each_retry(self):
+        crawler = gs25_crawling.GS25CrawlerBase(
+            "http://127.0.0.1/", retry_policy=gs25_crawling.RetryPolicy(max_attempts=3, base_delay=0, jitter=0))
+        attempts = []
+        recovered = []
+
+        def action():
+            attempts.append(len(attempts) + 1)
+            if len(attempts) < 3:
+                raise TimeoutError("페이지 로딩 시간 초과")
+            return "ok"
+
+        with mock.patch.object(gs25_crawling.time, "sleep"):
+            self.assertEqual(crawler._retry("페이지 이동", action, recover=lambda: recovered.append(True)), "ok")
+        self.assertEqual((attempts, len(recovered)), ([1, 2, 3], 2))
+
+        def failing_action():
+            attempts.append(len(attempts) + 1)
+            raise TimeoutError("페이지 로딩 시간 초과")
+
+        with mock.patch.object(gs25_crawling.time, "sleep"), self.assertRaises(TimeoutError):
+            crawler._retry("페이지 이동", failing_action)
+        self.assertEqual(len(attempts), 6)
+
+
+class PartitionedHistoryCursor:
+    """product_history의 파티션 목록만 흉내내는 커서 (조회, REORGANIZE, DROP PARTITION)"""
+
+    def __init__(self, partitions):
+        self.partitions = list(partitions)  # [(파티션 이름, TO_DAYS 상한 - MAXVALUE는 None)]
+        self.alters = []
+        self.result = []
+
+    def execute(self, statement, params=None):
+        if "information_schema.partitions" in statement:
+            self.result = [(name, "MAXVALUE" if bound is None else str(bound)) for name, bound in self.partitions]
+        elif "REORGANIZE PARTITION" in statement:
+            self.alters.append(statement)
+            name = re.search(r"REORGANIZE PARTITION (\w+) INTO", statement).group(1)
+            new_partitions = [(new_name, None if bound == "MAXVALUE" else int(bound)) for new_name, bound
+                              in re.findall(r"PARTITION (\w+) VALUES LESS THAN \((\w+)\)", statement)]
+            index = [partition[0] for partition in self.partitions].index(name)
+            self.partitions[index:index + 1] = new_partitions
+        elif "DROP PARTITION" in statement:
+            dropped = statement.split("DROP PARTITION ", 1)[1].split(", ")
+            self.partitions = [partition for partition in self.partitions if partition[0] not in dropped]
+
+    def fetchall(self):
+        return self.result
+
+
+class HistoryPartitionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = gs25_crawling.GS25DatabaseManager()
+        self.manager.cursor = PartitionedHistoryCursor([("pmax", None)])
+        self.to_days = gs25_crawling.GS25DatabaseManager._to_days
+
+    def partition_names(self):
+        return [name for name, _ in self.manager.cursor.partitions]
+
+    def test_to_days_matches_mysql(self):
+        self.assertEqual(self.to_days(datetime.date(2007, 10, 7)), 733321)  # MySQL 문서의 TO_DAYS 예
+
+    def test_splits_maxvalue_partition_for_crawl_date(self):
+        self.manager._ensure_history_partition(datetime.date(2026, 10, 18))
+        day = self.to_days(datetime.date(2026, 10, 18))
+        self.assertEqual(self.manager.cursor.partitions,
+                         [("p_lt_20261018", day), ("p_lt_20261019", day + 1), ("pmax", None)])
+
+        # 같은 날짜를 다시 저장하면 파티션을 바꾸지 않음
+        self.manager._ensure_history_partition(datetime.date(2026, 10, 18))
+        self.assertEqual(len(self.manager.cursor.alters), 1)
+
+    def test_consecutive_and_earlier_days(self):
+        for crawl_date in (datetime.date(2026, 10, 18), datetime.date(2026, 10, 19), datetime.date(2026, 10, 10)):
+            self.manager._ensure_history_partition(crawl_date)
+        self.assertEqual(self.partition_names(), [
+            "p_lt_20261010", "p_lt_20261011", "p_lt_20261018", "p_lt_20261019", "p_lt_20261020", "pmax"])
+
+        bounds = [bound for _, bound in self.manager.cursor.partitions[:-1]]
+        self.assertEqual(bounds, sorted(bounds))
+
+    def test_drop_history_before(self):
+        for crawl_date in (datetime.date(2026, 10, 17), datetime.date(2026, 10, 18)):
+            self.manager._ensure_history_partition(crawl_date)
+        with mock.patch("builtins.print"):
+            dropped = self.manager.drop_history_before(datetime.date(2026, 10, 18))
+        self.assertEqual(dropped, ["p_lt_20261017", "p_lt_20261018"])
+        self.assertEqual(self.partition_names(), ["p_lt_20261019", "pmax"])
+
+
+class RecordingSink(gs25_crawling.ProductSink):
+
+    def __init__(self):
+        self.products = []
+
+    def write(self, products):
+        self.products.extend(products)
+
+
+class HistoryProductSinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_manager = mock.Mock(database="gs25_db")
+        self.db_manager.save_snapshot.side_effect = lambda products, crawled_at, batch_size: len(products)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def crawl(self, sinks, dedup_index=None):
+        crawler = gs25_crawling.GS25CrawlerBase("http://127.0.0.1/", sinks=sinks, dedup_index=dedup_index)
+        with mock.patch("builtins.print"):
+            crawler._add_unique_products([make_product("콜라"), make_product("사이다")])
+            crawler._add_unique_products([make_product("우유", promotion="2+1")])
+            crawler._finish_run()
+
+    def test_snapshot_is_saved_in_batches_with_one_crawl_time(self):
+        crawled_at = datetime.datetime(2026, 10, 18, 9, 0)
+        sink = gs25_crawling.HistoryProductSink(self.db_manager, crawled_at=crawled_at, batch_size=2)
+        self.crawl([sink])
+
+        calls = self.db_manager.save_snapshot.call_args_list
+        self.assertEqual([len(call.args[0]) for call in calls], [2, 1])
+        self.assertEqual({call.args[1] for call in calls}, {crawled_at})
+        self.assertEqual((sink.saved_count, sink.failed_count), (3, 0))
+
+    def test_history_receives_products_skipped_by_dedup_index(self):
+        dedup_index = gs25_crawling.ProductDedupIndex(os.path.join(self.temp_dir, "dedup.sqlite"))
+        dedup_index.add_many([make_product("콜라")])
+        other_sink = RecordingSink()
+        history_sink = gs25_crawling.HistoryProductSink(self.db_manager)
+        self.crawl([other_sink, history_sink], dedup_index)
+        dedup_index.close()
+
+        self.assertEqual([product.name for product in other_sink.products], ["사이다", "우유"])
+        self.assertEqual(history_sink.saved_count, 3)
+
+    def test_failed_snapshot_is_counted(self):
+        self.db_manager.save_snapshot.side_effect = lambda products, crawled_at, batch_size: 0
+        sink = gs25_crawling.HistoryProductSink(self.db_manager)
+        self.crawl([sink])
+        self.assertEqual((sink.saved_count, sink.failed_count), (0, 3))
+
+
+class IngestDirectoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.write_results("20261017_090000", [("콜라", "1,800", "1+1"), ("우유", "2,500", "2+1")])
+        self.write_results("20261018_090000", [("콜라", "1,500", "1+1"), ("COLA", "2,000", "1+1"),
+                                                ("cola", "2,100", "1+1")])
+        self.saved = []
+        self.worker_schema = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_results(self, timestamp, rows):
+        pd.DataFrame([{"이미지URL": "", "상품명": name, "가격": price, "행사유형": promotion, "행사분류": "1+1 행사"}
+                      for name, price, promotion in rows]).to_csv(
+            os.path.join(self.temp_dir, f"GS25_행사상품_{timestamp}.csv"), index=False, encoding="utf-8-sig")
+
+    def fake_connect(self, manager, prepare_schema=True):
+        self.worker_schema.append(prepare_schema)
+        return True
+
+    def fake_upsert(self, manager, products, batch_size, stats_delta=None, recompute_groups=None):
+        self.saved.extend(products)
+        return products, [], stats_delta, recompute_groups
+
+    def ingest(self, manager, **kwargs):
+        manager.conn = mock.Mock()
+        # 파싱 작업자에 보내는 함수는 sys.modules의 모듈에서 찾으므로 이 모듈로 고정
+        # (다른 테스트 모듈이 크롤러 스크립트를 다시 불러왔을 수 있음)
+        modules = {"gs25_crawling": gs25_crawling}
+        Manager = gs25_crawling.GS25DatabaseManager
+        with mock.patch.object(Manager, "connect", autospec=True, side_effect=self.fake_connect), \
+                mock.patch.object(Manager, "upsert_products", autospec=True, side_effect=self.fake_upsert), \
+                mock.patch.object(Manager, "close"), mock.patch.object(Manager, "_apply_stats_delta"), \
+                mock.patch("builtins.print"), mock.patch.dict(sys.modules, modules):
+            return manager.ingest_directory(self.temp_dir, max_workers=2, **kwargs)
+
+    def test_latest_record_wins_within_partitions(self):
+        saved_count = self.ingest(gs25_crawling.GS25DatabaseManager(), partition_count=3)
+        self.assertEqual(saved_count, 3)
+        # DB 키(대소문자 무시)가 같은 COLA/cola는 나중 파일의 마지막 행만 저장
+        self.assertEqual(sorted((product.name, product.price) for product in self.saved),
+                         [("cola", 2100), ("우유", 2500), ("콜라", 1500)])
+        self.assertEqual(set(self.worker_schema), {False})
+
+    def test_dedup_index_skips_saved_products(self):
+        dedup_index = gs25_crawling.ProductDedupIndex(os.path.join(self.temp_dir, "dedup.sqlite"))
+        manager = gs25_crawling.GS25DatabaseManager(dedup_index=dedup_index)
+        self.assertEqual(self.ingest(manager), 3)
+        self.assertEqual(self.ingest(manager), 0)
+        dedup_index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
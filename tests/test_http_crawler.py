@@ -0,0 +1,160 @@
+"""
+GS25HttpCrawler 테스트 - 기록해 둔 행사상품 API 응답(tests/fixtures)을 돌려주는 로컬 http.server로 실행
+
+    python -m unittest discover tests
+"""
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ROOT_DIR, "tests", "fixtures")
+
+
+def load_crawler_module():
+    """파일명에 공백이 있는 크롤러 스크립트를 모듈로 불러오기"""
+    spec = importlib.util.spec_from_file_location("gs25_crawling", os.path.join(ROOT_DIR, "gs25_crawling copy.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+gs25_crawling = load_crawler_module()
+
+
+class EventGoodsStub(BaseHTTPRequestHandler):
+    """행사상품 페이지(GET)와 event-goods-search(POST)를 기록된 응답으로 흉내내는 핸들러"""
+    
+    csrf_token = "3f2b9c1e-7a4d-4e8a-9c55-1d2e3f4a5b6c"
+    failing_pages = set()  # 500으로 응답할 (탭 ID, 페이지)
+    requests = []
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_GET(self):
+        with open(os.path.join(FIXTURE_DIR, "event_goods.html"), "rb") as f:
+            self._respond(200, f.read(), "text/html; charset=UTF-8")
+    
+    def do_POST(self):
+        query = parse_qs(urlparse(self.path).query)
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8"))
+        tab_id = form["parameterList"][0]
+        page = int(form["pageNum"][0])
+        self.requests.append((tab_id, page, query.get("CSRFToken", [None])[0]))
+        
+        fixture = os.path.join(FIXTURE_DIR, "event_goods_search", f"{tab_id}_{page}.json")
+        if (tab_id, page) in self.failing_pages or not os.path.exists(fixture):
+            self._respond(500, b"{}", "application/json")
+            return
+        with open(fixture, "rb") as f:
+            self._respond(200, f.read(), "application/json;charset=UTF-8")
+    
+    def _respond(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class GS25HttpCrawlerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EventGoodsStub)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/gscvs/ko/products/event-goods#;"
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setUp(self):
+        EventGoodsStub.failing_pages = set()
+        EventGoodsStub.requests = []
+        # 결과 CSV(gs25_results)는 임시 디렉토리에 저장
+        self.previous_dir = os.getcwd()
+        self.work_dir = tempfile.mkdtemp()
+        os.chdir(self.work_dir)
+    
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.work_dir)
+    
+    def test_crawls_all_tabs_in_page_order(self):
+        crawler = gs25_crawling.GS25HttpCrawler(self.url, max_workers=4)
+        products = crawler.start_crawling()
+        
+        self.assertEqual([product.name for product in products], [
+            "CJ)햇반작은공기130G", "롯데)칠성사이다500ML", "오리온)초코파이2입", "빙그레)바나나맛우유240ML",
+            "농심)신라면컵65G", "해태)홈런볼46G", "동원)양반김4G",
+            "코카)코카콜라500ML"
+        ])
+        # 2페이지에 다시 나온 칠성사이다는 중복으로 제외
+        self.assertEqual(crawler.duplicate_count, 1)
+        
+        first, gift = products[0], products[-1]
+        self.assertEqual((first.price, first.promotion, first.category), (1500, "1+1", "1+1 행사"))
+        self.assertEqual(first.image_url, "https://image.woodongs.com/imgsvr/item/GD_ONE_TO_ONE_1_0.jpg")
+        self.assertEqual((gift.promotion, gift.gift), ("덤증정", "코카)스프라이트250ML"))
+        
+        # 모든 목록 요청에 페이지에서 읽은 CSRF 토큰을 붙임
+        self.assertEqual({token for _, _, token in EventGoodsStub.requests}, {EventGoodsStub.csrf_token})
+        self.assertEqual(len(os.listdir("gs25_results")), 1)
+    
+    def test_failed_page_does_not_stop_tab(self):
+        EventGoodsStub.failing_pages = {("ONE_TO_ONE", 2)}
+        crawler = gs25_crawling.GS25HttpCrawler(self.url, max_workers=2,
+                                                retry_policy=gs25_crawling.RetryPolicy(max_attempts=2, base_delay=0))
+        products = crawler.crawl_single_event("ONE_TO_ONE", save_results=False)
+        
+        self.assertEqual([product.name for product in products],
+                         ["CJ)햇반작은공기130G", "롯데)칠성사이다500ML", "오리온)초코파이2입"])
+        # 실패한 페이지는 재시도한 뒤 탭을 미완료로 기록
+        self.assertEqual([page for tab_id, page, _ in EventGoodsStub.requests if tab_id == "ONE_TO_ONE"], [1, 2, 2])
+        self.assertEqual(list(crawler.incomplete_tabs), ["ONE_TO_ONE"])
+        self.assertEqual(crawler.incomplete_tabs["ONE_TO_ONE"]["last_page"], 2)
+    
+    def test_checkpoint_resumes_from_failed_page(self):
+        checkpoint_path = os.path.join(self.work_dir, "checkpoint.jsonl")
+        retry_policy = gs25_crawling.RetryPolicy(max_attempts=1)
+        EventGoodsStub.failing_pages = {("ONE_TO_ONE", 2)}
+        crawler = gs25_crawling.GS25HttpCrawler(self.url, checkpoint_path=checkpoint_path, retry_policy=retry_policy)
+        crawler.crawl_single_event("ONE_TO_ONE", save_results=False)
+        self.assertTrue(os.path.exists(checkpoint_path))
+        
+        EventGoodsStub.failing_pages = set()
+        EventGoodsStub.requests = []
+        crawler = gs25_crawling.GS25HttpCrawler(self.url, checkpoint_path=checkpoint_path, retry_policy=retry_policy)
+        products = crawler.crawl_single_event("ONE_TO_ONE", save_results=False, resume=True)
+        
+        # 1페이지는 체크포인트에서 복원하고 총 페이지 수 확인용 요청 외에는 2페이지만 요청
+        self.assertEqual([page for _, page, _ in EventGoodsStub.requests], [1, 2])
+        self.assertEqual([product.name for product in products],
+                         ["CJ)햇반작은공기130G", "롯데)칠성사이다500ML", "오리온)초코파이2입", "빙그레)바나나맛우유240ML"])
+        self.assertEqual(crawler.incomplete_tabs, {})
+        self.assertFalse(os.path.exists(checkpoint_path))
+    
+    def test_max_pages_limits_requests(self):
+        crawler = gs25_crawling.GS25HttpCrawler(self.url, crawl_all_pages=False, max_pages=1)
+        crawler.crawl_single_event("TWO_TO_ONE", save_results=False)
+        
+        self.assertEqual([(tab_id, page) for tab_id, page, _ in EventGoodsStub.requests], [("TWO_TO_ONE", 1)])
+    
+    def test_invalid_event_type(self):
+        crawler = gs25_crawling.GS25HttpCrawler(self.url)
+        self.assertEqual(crawler.crawl_single_event("TOTAL"), [])
+        self.assertEqual(EventGoodsStub.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
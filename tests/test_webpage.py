@@ -0,0 +1,169 @@
+"""
+웹페이지 조회 도우미 테스트 - MySQL 서버 없이 상품 조회 쿼리 생성과 연결 풀 동작 확인
+
+    python -m unittest discover tests
+"""
+import importlib.util
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import mysql.connector
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_webpage_module():
+    """파일명에 공백이 있는 Flask 앱 스크립트를 모듈로 불러오기 (연결 풀은 처음 조회할 때 연결)"""
+    spec = importlib.util.spec_from_file_location("gs25_webpage", os.path.join(ROOT_DIR, "gs25_webpage copy.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+gs25_webpage = load_webpage_module()
+
+
+def normalize_sql(query):
+    return " ".join(query.split())
+
+
+class BuildProductQueryTest(unittest.TestCase):
+
+    def test_default_query(self):
+        query, params = gs25_webpage.build_product_query()
+        self.assertTrue(normalize_sql(query).endswith("FROM gs25_products WHERE 1=1 ORDER BY id DESC"))
+        self.assertEqual(params, ())
+
+    def test_filters_are_parameterized(self):
+        query, params = gs25_webpage.build_product_query(promotion_type="1+1", category="ONE_TO_ONE")
+        self.assertIn("AND 행사유형 = %s AND 행사분류 = %s", normalize_sql(query))
+        self.assertEqual(params, ("1+1", "ONE_TO_ONE"))
+
+    def test_keyword_uses_fulltext_then_like(self):
+        query, params = gs25_webpage.build_product_query(keyword='콜라 "제로"')
+        self.assertIn("AND MATCH(상품명) AGAINST (%s IN BOOLEAN MODE) AND 상품명 LIKE %s", normalize_sql(query))
+        self.assertEqual(params, ('"콜라  제로 "', '%콜라 "제로"%'))
+
+    def test_short_keyword_uses_like_only(self):
+        query, params = gs25_webpage.build_product_query(keyword="콜")
+        self.assertNotIn("MATCH", query)
+        self.assertEqual(params, ("%콜%",))
+
+    def test_sort_options(self):
+        query, _ = gs25_webpage.build_product_query(sort_by="가격", sort_order="ASC")
+        self.assertTrue(normalize_sql(query).endswith("ORDER BY 가격값 ASC"))
+
+        # 허용하지 않는 정렬 값은 SQL에 넣지 않고 기본값 사용
+        query, _ = gs25_webpage.build_product_query(sort_by="id; DROP TABLE gs25_products", sort_order="desc")
+        self.assertTrue(normalize_sql(query).endswith("ORDER BY id DESC"))
+
+
+class FakeConnection:
+    """ping 실패 여부를 정할 수 있는 가짜 MySQL 연결"""
+
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.pings = 0
+        self.closed = False
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if not self.alive:
+            raise mysql.connector.errors.InterfaceError("MySQL server has gone away")
+
+    def close(self):
+        self.closed = True
+
+
+class DatabasePoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connections = []
+        patcher = mock.patch.object(gs25_webpage.mysql.connector, "connect", side_effect=self.connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def connect(self, **config):
+        self.assertTrue(config["autocommit"])
+        connection = FakeConnection(len(self.connections) + 1)
+        self.connections.append(connection)
+        return connection
+
+    def new_pool(self, **kwargs):
+        return gs25_webpage.DatabasePool({"host": "localhost"}, **kwargs)
+
+    def test_connections_are_reused(self):
+        pool = self.new_pool(size=2)
+        for _ in range(3):
+            with pool.connection() as conn:
+                self.assertIs(conn, self.connections[0])
+        stats = pool.stats()
+        self.assertEqual((stats["checkouts"], stats["connections_created"], stats["idle"], stats["in_use"]), (3, 1, 1, 0))
+
+    def test_checkout_times_out_when_pool_is_full(self):
+        pool = self.new_pool(size=1, checkout_timeout=0.05)
+        with pool.connection():
+            with self.assertRaises(gs25_webpage.PoolTimeoutError):
+                with pool.connection():
+                    pass
+        stats = pool.stats()
+        self.assertEqual((stats["timeouts"], stats["open"], stats["idle"]), (1, 1, 1))
+
+    def test_checkout_waits_for_returned_connection(self):
+        pool = self.new_pool(size=1, checkout_timeout=2.0)
+        borrowed = threading.Event()
+
+        def hold_connection():
+            with pool.connection():
+                borrowed.set()
+                time.sleep(0.05)
+
+        worker = threading.Thread(target=hold_connection)
+        worker.start()
+        borrowed.wait()
+        with pool.connection() as conn:
+            self.assertIs(conn, self.connections[0])
+        worker.join()
+        self.assertEqual(pool.stats()["waits"], 1)
+
+    def test_idle_connection_is_health_checked(self):
+        pool = self.new_pool(size=1, health_check_interval=0)
+        with pool.connection():
+            pass
+        self.connections[0].alive = False
+
+        with pool.connection() as conn:
+            self.assertIs(conn, self.connections[1])
+        self.assertTrue(self.connections[0].closed)
+        stats = pool.stats()
+        self.assertEqual((stats["health_checks"], stats["connections_discarded"], stats["open"]), (1, 1, 1))
+
+    def test_broken_connection_is_discarded(self):
+        pool = self.new_pool(size=1)
+        with self.assertRaises(mysql.connector.errors.OperationalError):
+            with pool.connection():
+                raise mysql.connector.errors.OperationalError("Lost connection to MySQL server")
+        self.assertTrue(self.connections[0].closed)
+        self.assertEqual((pool.stats()["open"], pool.stats()["idle"]), (0, 0))
+
+    def test_failed_connect_releases_reservation(self):
+        pool = self.new_pool(size=1)
+        with mock.patch.object(gs25_webpage.mysql.connector, "connect",
+                               side_effect=mysql.connector.errors.InterfaceError("연결 거부")):
+            with self.assertRaises(mysql.connector.errors.InterfaceError):
+                with pool.connection():
+                    pass
+        self.assertEqual(pool.stats()["open"], 0)
+
+        with pool.connection() as conn:
+            self.assertIs(conn, self.connections[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file